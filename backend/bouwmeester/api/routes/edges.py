@@ -9,6 +9,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bouwmeester.api.deps import require_deleted, require_found, validate_list
 from bouwmeester.core.auth import OptionalUser
 from bouwmeester.core.database import get_db
+from bouwmeester.core.graph_index import (
+    note_edge_created,
+    note_edge_deleted,
+    note_edge_updated,
+)
 from bouwmeester.models.corpus_node import CorpusNode
 from bouwmeester.repositories.edge import EdgeRepository
 from bouwmeester.schema.edge import EdgeCreate, EdgeResponse, EdgeUpdate, EdgeWithNodes
@@ -65,6 +70,7 @@ async def create_edge(
             status_code=status.HTTP_409_CONFLICT,
             detail="Deze verbinding bestaat al.",
         )
+    note_edge_created(db, edge)
 
     resolved_id, resolved_naam = await resolve_actor(current_user, actor_id, db)
 
@@ -115,6 +121,7 @@ async def update_edge(
     """Update edge weight, description, or type."""
     repo = EdgeRepository(db)
     edge = require_found(await repo.update(id, data), "Edge")
+    note_edge_updated(db, edge)
 
     await log_activity(
         db,
@@ -150,6 +157,7 @@ async def delete_edge(
             "edge_type": edge.edge_type_id,
         }
     require_deleted(await repo.delete(id), "Edge")
+    note_edge_deleted(db, id)
     await log_activity(
         db,
         current_user,
@@ -1,40 +1,135 @@
 """API routes for graph operations."""
 
+import logging
+from collections.abc import AsyncIterator
+from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bouwmeester.api.deps import validate_list
 from bouwmeester.core.auth import OptionalUser
 from bouwmeester.core.database import get_db
+from bouwmeester.repositories.edge_closure import EdgeClosureRepository
 from bouwmeester.repositories.graph import GraphRepository
 from bouwmeester.schema.corpus_node import CorpusNodeResponse, NodeType
 from bouwmeester.schema.edge import EdgeResponse
-from bouwmeester.schema.graph import GraphViewResponse
+from bouwmeester.schema.graph import (
+    GraphDiffResponse,
+    GraphViewResponse,
+    ReachabilityResponse,
+    ReachableNode,
+)
+from bouwmeester.utils.graph_binary import (
+    GRAPH_BINARY_MEDIA_TYPE,
+    accepts_binary_graph,
+    encode_graph,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/graph", tags=["graph"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _ndjson_graph(
+    batches: AsyncIterator[tuple[str, list[RowMapping]]],
+) -> AsyncIterator[bytes]:
+    """Encode streamed graph batches as NDJSON, one chunk per batch.
+
+    Each line is ``{"node": {...}}`` or ``{"edge": {...}}``; all nodes are
+    emitted before the first edge.  Rows that fail serialisation are
+    skipped, like :func:`validate_list` does for the JSON response.
+    """
+    schemas = {"node": CorpusNodeResponse, "edge": EdgeResponse}
+    async for kind, rows in batches:
+        schema = schemas[kind]
+        prefix = f'{{"{kind}":'.encode()
+        lines: list[bytes] = []
+        for row in rows:
+            try:
+                item = schema.model_validate(dict(row))
+            except ValidationError:
+                logger.warning(
+                    "Skipping %s id=%s: serialisation failed",
+                    schema.__name__,
+                    row.get("id", "?"),
+                    exc_info=True,
+                )
+                continue
+            lines.append(prefix + item.model_dump_json().encode() + b"}\n")
+        yield b"".join(lines)
+
 
-@router.get("/search", response_model=GraphViewResponse)
+@router.get(
+    "/search",
+    response_model=GraphViewResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}, GRAPH_BINARY_MEDIA_TYPE: {}}}},
+)
 async def graph_search(
+    request: Request,
     current_user: OptionalUser,
     node_types: list[NodeType] | None = Query(None),
     edge_types: list[str] | None = Query(None),
+    include_descriptions: bool = Query(
+        False, description="Binary format only: include node descriptions."
+    ),
+    as_of: date | None = Query(
+        None, description="Show the graph as it was on this date."
+    ),
     db: AsyncSession = Depends(get_db),
-) -> GraphViewResponse:
+) -> GraphViewResponse | Response:
     """Return a graph view filtered by node and/or edge types.
 
     Uses :class:`GraphRepository.get_full_graph` to fetch all matching
     nodes and edges in a single pass rather than N+1 queries.
+
+    With ``as_of`` the graph is resolved as it was on that date: only
+    nodes valid then, with the title and status they had then (one
+    set-based query over the temporal tables), and only edges created by
+    then.
+
+    Send ``Accept: application/x-ndjson`` to stream the result instead:
+    one ``{"node": ...}`` line per node followed by one ``{"edge": ...}``
+    line per edge, read through a server-side cursor so memory stays flat
+    and clients can start rendering before the last row is sent.
+
+    Send ``Accept: application/vnd.bouwmeester.graph`` for the compact
+    binary layout described in :mod:`bouwmeester.utils.graph_binary`.
     """
     repo = GraphRepository(db)
 
     type_values = [nt.value for nt in node_types] if node_types else None
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamingResponse(
+            _ndjson_graph(
+                repo.stream_full_graph(
+                    node_types=type_values, edge_types=edge_types, as_of=as_of
+                )
+            ),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
     result = await repo.get_full_graph(
         node_types=type_values,
         edge_types=edge_types,
+        as_of=as_of,
     )
+    if accepts_binary_graph(request.headers.get("accept")):
+        return Response(
+            encode_graph(
+                result["nodes"],
+                result["edges"],
+                include_descriptions=include_descriptions,
+            ),
+            media_type=GRAPH_BINARY_MEDIA_TYPE,
+            headers={"Vary": "Accept"},
+        )
 
     return GraphViewResponse(
         nodes=validate_list(CorpusNodeResponse, result["nodes"]),
@@ -52,7 +147,7 @@ async def find_path(
 ) -> dict:
     """Find the shortest path between two nodes.
 
-    Uses a recursive CTE (breadth-first search) in
+    Uses an in-memory bidirectional breadth-first search in
     :class:`GraphRepository.find_path`.
     """
     repo = GraphRepository(db)
@@ -64,3 +159,96 @@ async def find_path(
         "path": path,
         "length": len(path),
     }
+
+
+@router.get("/diff", response_model=GraphDiffResponse)
+async def graph_diff(
+    current_user: OptionalUser,
+    from_date: date = Query(..., alias="from"),
+    to_date: date | None = Query(None, alias="to", description="Default: today"),
+    db: AsyncSession = Depends(get_db),
+) -> GraphDiffResponse:
+    """Nodes and edges added, removed or changed between two dates.
+
+    Compares the corpus as of ``from`` with the corpus as of ``to`` using
+    the temporal title/status records, and takes edge changes and hard
+    deletes from the activity log.  Only the changes are returned, so the
+    payload scales with the size of the change rather than the corpus.
+    """
+    to_date = to_date or date.today()
+    if to_date < from_date:
+        raise HTTPException(status_code=400, detail="'from' moet voor 'to' liggen")
+    result = await GraphRepository(db).diff(from_date, to_date)
+    return GraphDiffResponse(from_date=from_date, to_date=to_date, **result)
+
+
+async def _reachable(
+    db: AsyncSession,
+    node_id: UUID,
+    direction: str,
+    edge_types: list[str] | None,
+    node_types: list[NodeType] | None,
+    max_depth: int | None,
+    limit: int,
+) -> ReachabilityResponse:
+    repo = EdgeClosureRepository(db)
+    rows = await repo.get_related(
+        node_id,
+        direction=direction,
+        edge_types=edge_types,
+        node_types=[nt.value for nt in node_types] if node_types else None,
+        max_depth=max_depth,
+        limit=limit,
+    )
+    return ReachabilityResponse(
+        node_id=node_id,
+        direction=direction,
+        nodes=[
+            ReachableNode(
+                node=CorpusNodeResponse.model_validate(node),
+                depth=depth,
+                edge_types=types,
+            )
+            for node, depth, types in rows
+        ],
+    )
+
+
+@router.get("/descendants", response_model=ReachabilityResponse)
+async def get_descendants(
+    current_user: OptionalUser,
+    node_id: UUID = Query(...),
+    edge_types: list[str] | None = Query(None),
+    node_types: list[NodeType] | None = Query(None),
+    max_depth: int | None = Query(None, ge=1),
+    limit: int = Query(500, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+) -> ReachabilityResponse:
+    """Every node that transitively rolls up into *node_id*.
+
+    Follows hierarchical edge types (``onderdeel_van``, ``implementeert``,
+    ...) backwards, e.g. all maatregelen that ultimately contribute to a
+    doel.  Answered from the ``edge_closure`` table, nearest first.
+    """
+    return await _reachable(
+        db, node_id, "descendants", edge_types, node_types, max_depth, limit
+    )
+
+
+@router.get("/ancestors", response_model=ReachabilityResponse)
+async def get_ancestors(
+    current_user: OptionalUser,
+    node_id: UUID = Query(...),
+    edge_types: list[str] | None = Query(None),
+    node_types: list[NodeType] | None = Query(None),
+    max_depth: int | None = Query(None, ge=1),
+    limit: int = Query(500, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+) -> ReachabilityResponse:
+    """Every node *node_id* transitively rolls up into.
+
+    The inverse of ``/graph/descendants``.
+    """
+    return await _reachable(
+        db, node_id, "ancestors", edge_types, node_types, max_depth, limit
+    )
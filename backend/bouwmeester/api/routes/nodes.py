@@ -1,13 +1,19 @@
 """API routes for corpus nodes."""
 
+from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bouwmeester.api.deps import require_deleted, require_found, validate_list
 from bouwmeester.core.auth import OptionalUser
 from bouwmeester.core.database import get_db
+from bouwmeester.core.mention_index import (
+    note_mentionable_deleted,
+    note_mentionable_saved,
+)
 from bouwmeester.models.person import Person
 from bouwmeester.repositories.node_stakeholder import NodeStakeholderRepository
 from bouwmeester.repositories.task import TaskRepository
@@ -17,16 +23,21 @@ from bouwmeester.schema.corpus_node import (
     CorpusNodeResponse,
     CorpusNodeUpdate,
     CorpusNodeWithEdges,
+    CorpusNodeWithMetrics,
+    DuplicateGroup,
+    NodeSortField,
     NodeStatusRecord,
     NodeTitleRecord,
     NodeType,
+    SimilarNode,
 )
 from bouwmeester.schema.edge import EdgeResponse
 from bouwmeester.schema.graph import (
     GraphNeighborsResponse,
-    GraphViewResponse,
     NeighborEntry,
+    SubgraphViewResponse,
 )
+from bouwmeester.schema.llm import EdgeSuggestionItem
 from bouwmeester.schema.person import (
     NodeStakeholderCreate,
     NodeStakeholderResponse,
@@ -39,9 +50,15 @@ from bouwmeester.services.activity_service import (
     log_activity,
     resolve_actor,
 )
+from bouwmeester.services.edge_suggestion_service import EdgeSuggestionService
 from bouwmeester.services.mention_helper import sync_and_notify_mentions
 from bouwmeester.services.node_service import NodeService
 from bouwmeester.services.notification_service import NotificationService
+from bouwmeester.utils.graph_binary import (
+    GRAPH_BINARY_MEDIA_TYPE,
+    accepts_binary_graph,
+    encode_graph,
+)
 
 # Resolve forward reference to EdgeResponse in CorpusNodeWithEdges.
 CorpusNodeWithEdges.model_rebuild()
@@ -49,19 +66,39 @@ CorpusNodeWithEdges.model_rebuild()
 router = APIRouter(prefix="/nodes", tags=["nodes"])
 
 
-@router.get("", response_model=list[CorpusNodeResponse])
+@router.get("", response_model=list[CorpusNodeWithMetrics])
 async def list_nodes(
     current_user: OptionalUser,
     node_type: NodeType | None = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
+    sort_by: NodeSortField | None = Query(
+        None, description="Sort descending by a precomputed graph metric"
+    ),
+    orphan: bool | None = Query(
+        None, description="Only nodes without (true) or with (false) edges"
+    ),
+    component_id: int | None = Query(
+        None, ge=1, description="Only nodes in this connected component"
+    ),
     db: AsyncSession = Depends(get_db),
-) -> list[CorpusNodeResponse]:
-    """List all corpus nodes, optionally filtered by node_type."""
+) -> list[CorpusNodeWithMetrics]:
+    """List all corpus nodes, optionally filtered by node_type.
+
+    Each node carries its precomputed graph metrics (refreshed by the
+    worker), which can also be used to sort and filter.
+    """
     service = NodeService(db)
     node_type_str = node_type.value if node_type else None
-    nodes = await service.get_all(skip=skip, limit=limit, node_type=node_type_str)
-    return validate_list(CorpusNodeResponse, nodes)
+    nodes = await service.get_all(
+        skip=skip,
+        limit=limit,
+        node_type=node_type_str,
+        sort_by=sort_by.value if sort_by else None,
+        orphan=orphan,
+        component_id=component_id,
+    )
+    return validate_list(CorpusNodeWithMetrics, nodes)
 
 
 @router.post("", response_model=CorpusNodeResponse, status_code=status.HTTP_201_CREATED)
@@ -74,6 +111,7 @@ async def create_node(
     """Create a new corpus node. Syncs mentions and logs activity."""
     service = NodeService(db)
     node = await service.create(data)
+    note_mentionable_saved(db, "node", node.id, node.title, node.node_type)
 
     await sync_and_notify_mentions(
         db,
@@ -96,6 +134,27 @@ async def create_node(
     return CorpusNodeResponse.model_validate(node)
 
 
+@router.get("/duplicates", response_model=list[DuplicateGroup])
+async def list_duplicate_nodes(
+    current_user: OptionalUser,
+    min_similarity: float = Query(0.7, ge=0.5, le=1.0),
+    db: AsyncSession = Depends(get_db),
+) -> list[DuplicateGroup]:
+    """Groups of nodes whose title and description are near-identical.
+
+    Candidates come from a MinHash/LSH index, so the report does not
+    compare every pair of nodes.
+    """
+    service = NodeService(db)
+    return [
+        DuplicateGroup(
+            nodes=[CorpusNodeResponse.model_validate(n) for n in nodes],
+            similarity=score,
+        )
+        for nodes, score in await service.get_duplicate_groups(min_similarity)
+    ]
+
+
 @router.get("/{id}", response_model=CorpusNodeWithEdges)
 async def get_node(
     id: UUID,
@@ -134,6 +193,7 @@ async def update_node(
     """Update a corpus node. Notifies stakeholders of changes."""
     service = NodeService(db)
     node = require_found(await service.update(id, data), "Node")
+    note_mentionable_saved(db, "node", node.id, node.title, node.node_type)
 
     await sync_and_notify_mentions(
         db,
@@ -175,6 +235,23 @@ async def delete_node(
     node = await service.get(id)
     node_title = node.title if node else None
     node_type = node.node_type if node else None
+    # Recorded so the graph diff can report the node's age and the edges
+    # its deletion cascades to.
+    node_created_at = node.created_at.isoformat() if node else None
+    cascaded_edges = (
+        [
+            {
+                "edge_id": str(edge.id),
+                "from_node_id": str(edge.from_node_id),
+                "to_node_id": str(edge.to_node_id),
+                "edge_type": edge.edge_type_id,
+                "created_at": edge.created_at.isoformat(),
+            }
+            for edge in {e.id: e for e in node.edges_from + node.edges_to}.values()
+        ]
+        if node
+        else []
+    )
 
     # Clean up bijlage files on disk before deleting the bron node,
     # because CASCADE will remove the DB rows but not the files.
@@ -191,6 +268,7 @@ async def delete_node(
             bijlage_path_to_delete = bijlage.pad
 
     require_deleted(await service.delete(id), "Node")
+    note_mentionable_deleted(db, "node", id)
 
     # Delete the file after DB deletion succeeds.
     if bijlage_path_to_delete:
@@ -206,7 +284,13 @@ async def delete_node(
         current_user,
         actor_id,
         "node.deleted",
-        details={"node_id": str(id), "title": node_title, "node_type": node_type},
+        details={
+            "node_id": str(id),
+            "title": node_title,
+            "node_type": node_type,
+            "created_at": node_created_at,
+            "edges": cascaded_edges,
+        },
     )
 
 
@@ -232,19 +316,102 @@ async def get_neighbors(
     )
 
 
-@router.get("/{id}/graph", response_model=GraphViewResponse)
+@router.get("/{id}/similar", response_model=list[SimilarNode])
+async def get_similar_nodes(
+    id: UUID,
+    current_user: OptionalUser,
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+) -> list[SimilarNode]:
+    """Nodes with the most similar title and description.
+
+    Computed locally from TF-IDF vectors, so no text leaves the server.
+    """
+    service = NodeService(db)
+    require_found(await service.get(id), "Node")
+    return [
+        SimilarNode(node=CorpusNodeResponse.model_validate(node), score=score)
+        for node, score in await service.get_similar(id, limit)
+    ]
+
+
+@router.get("/{id}/suggested-connections", response_model=list[EdgeSuggestionItem])
+async def get_suggested_connections(
+    id: UUID,
+    current_user: OptionalUser,
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+) -> list[EdgeSuggestionItem]:
+    """Unconnected nodes this node is most likely to be linked to.
+
+    Ranked from shared neighbours, shared tags and text similarity only;
+    no LLM is consulted.
+    """
+    require_found(await NodeService(db).get(id), "Node")
+    return await EdgeSuggestionService(db).suggest_connections(id, limit)
+
+
+@router.get(
+    "/{id}/graph",
+    response_model=SubgraphViewResponse,
+    responses={200: {"content": {GRAPH_BINARY_MEDIA_TYPE: {}}}},
+)
 async def get_graph(
     id: UUID,
+    request: Request,
     current_user: OptionalUser,
     depth: int = Query(2, ge=1, le=5),
+    max_nodes: int = Query(500, ge=1, le=5000),
+    edge_types: list[str] | None = Query(None),
+    node_types: list[NodeType] | None = Query(None),
+    include_descriptions: bool = Query(
+        False, description="Binary format only: include node descriptions."
+    ),
+    as_of: date | None = Query(
+        None, description="Show the subgraph as it was on this date."
+    ),
     db: AsyncSession = Depends(get_db),
-) -> GraphViewResponse:
-    """Get a multi-hop subgraph around a node (configurable depth 1-5)."""
+) -> SubgraphViewResponse | Response:
+    """Get a multi-hop subgraph around a node (configurable depth 1-5).
+
+    Expansion is bounded by ``max_nodes``; ``truncated`` is set when the
+    budget cut the neighbourhood short and ``level_counts`` gives the
+    number of nodes reached per hop.
+
+    With ``as_of`` only nodes valid on that date are included, with the
+    title and status they had then, and only edges created by then.
+
+    Send ``Accept: application/vnd.bouwmeester.graph`` for the compact
+    binary layout (``truncated`` / ``level_counts`` go in its header meta).
+    """
     service = NodeService(db)
-    result = await service.get_graph(id, depth=depth)
-    return GraphViewResponse(
+    result = await service.get_graph(
+        id,
+        depth=depth,
+        max_nodes=max_nodes,
+        edge_types=edge_types,
+        node_types=[nt.value for nt in node_types] if node_types else None,
+        as_of=as_of,
+    )
+    if accepts_binary_graph(request.headers.get("accept")):
+        return Response(
+            encode_graph(
+                result["nodes"],
+                result["edges"],
+                include_descriptions=include_descriptions,
+                meta={
+                    "truncated": result["truncated"],
+                    "level_counts": result["level_counts"],
+                },
+            ),
+            media_type=GRAPH_BINARY_MEDIA_TYPE,
+            headers={"Vary": "Accept"},
+        )
+    return SubgraphViewResponse(
         nodes=validate_list(CorpusNodeResponse, result["nodes"]),
         edges=validate_list(EdgeResponse, result["edges"]),
+        truncated=result["truncated"],
+        level_counts=result["level_counts"],
     )
 
 
@@ -17,6 +17,8 @@ from bouwmeester.models.edge import Edge
 from bouwmeester.models.node_stakeholder import NodeStakeholder
 from bouwmeester.models.person import Person
 from bouwmeester.models.task import Task
+from bouwmeester.repositories.edge import EdgeRepository
+from bouwmeester.repositories.edge_closure import EdgeClosureRepository
 from bouwmeester.repositories.parlementair_item import (
     ParlementairItemRepository,
     SuggestedEdgeRepository,
@@ -364,6 +366,9 @@ async def approve_edge(
     )
     db.add(edge)
     await db.flush()
+    await EdgeClosureRepository(db).add_edge(
+        edge.from_node_id, edge.to_node_id, edge.edge_type_id
+    )
 
     # Update suggested edge status
     suggested_edge.status = "approved"
@@ -426,9 +431,7 @@ async def reset_suggested_edge(
 
     # If it was approved, delete the actual edge that was created
     if suggested_edge.status == "approved" and suggested_edge.edge_id is not None:
-        actual_edge = await db.get(Edge, suggested_edge.edge_id)
-        if actual_edge is not None:
-            await db.delete(actual_edge)
+        await EdgeRepository(db).delete(suggested_edge.edge_id)
 
     suggested_edge.edge_id = None
     updated = await repo.update_status(
@@ -8,9 +8,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from bouwmeester.api.deps import require_deleted, require_found
-from bouwmeester.core.api_key import generate_api_key, hash_api_key
+from bouwmeester.core.api_key import (
+    forget_api_key_person,
+    generate_api_key,
+    hash_api_key,
+)
 from bouwmeester.core.auth import AdminUser, OptionalUser
 from bouwmeester.core.database import get_db
+from bouwmeester.core.mention_index import (
+    note_mentionable_deleted,
+    note_mentionable_saved,
+)
 from bouwmeester.models.node_stakeholder import NodeStakeholder
 from bouwmeester.models.organisatie_eenheid import OrganisatieEenheid
 from bouwmeester.models.person import Person
@@ -100,6 +108,7 @@ async def create_person(
             )
     repo = PersonRepository(db)
     person = await repo.create(data)
+    note_mentionable_saved(db, "person", person.id, person.naam, person.functie)
 
     # Auto-generate API key for agents.
     plaintext_key: str | None = None
@@ -245,9 +254,12 @@ async def update_person(
     """Update person fields (naam, functie, etc.)."""
     repo = PersonRepository(db)
     require_found(await repo.update(id, data), "Person")
+    # is_agent may have changed, which decides whether the key still works.
+    forget_api_key_person(id)
 
     # Re-fetch with eager loading for response
     person = require_found(await repo.get(id), "Person")
+    note_mentionable_saved(db, "person", person.id, person.naam, person.functie)
 
     await log_activity(
         db,
@@ -274,6 +286,8 @@ async def delete_person(
     person = await repo.get(id)
     person_naam = person.naam if person else None
     require_deleted(await repo.delete(id), "Person")
+    forget_api_key_person(id)
+    note_mentionable_deleted(db, "person", id)
     await log_activity(
         db,
         current_user,
@@ -307,6 +321,7 @@ async def rotate_api_key(
     plaintext_key = generate_api_key()
     person.api_key_hash = hash_api_key(plaintext_key)
     await db.flush()
+    forget_api_key_person(person.id)
 
     await log_activity(
         db,
@@ -1,11 +1,11 @@
 """API routes for omni full-text search."""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bouwmeester.core.auth import OptionalUser
 from bouwmeester.core.database import get_db
-from bouwmeester.repositories.search import SearchRepository
+from bouwmeester.repositories.search import SearchRepository, decode_cursor
 from bouwmeester.schema.search import SearchResponse, SearchResult, SearchResultType
 
 router = APIRouter(prefix="/search", tags=["search"])
@@ -17,18 +17,38 @@ async def search(
     q: str = Query(..., min_length=1, max_length=500),
     result_types: list[SearchResultType] | None = Query(None),
     limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None, max_length=200),
     db: AsyncSession = Depends(get_db),
 ) -> SearchResponse:
-    """Full-text search across nodes, tasks, people, and org units."""
+    """Full-text search across nodes, tasks, people, and org units.
+
+    Results are keyset-paginated: pass the returned ``next_cursor`` as
+    ``cursor`` to get the next page.
+    """
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
     repo = SearchRepository(db)
     type_values = [rt.value for rt in result_types] if result_types else None
-    results = await repo.full_text_search(
+    page = await repo.full_text_search(
         query=q,
         result_types=type_values,
         limit=limit,
+        after=after,
+    )
+    total = sum(
+        count
+        for result_type, count in page.facets.items()
+        if type_values is None or result_type in type_values
     )
     return SearchResponse(
-        results=[SearchResult(**r) for r in results],
-        total=len(results),
+        results=[SearchResult(**r) for r in page.results],
+        total=total,
         query=q,
+        facets=page.facets,
+        next_cursor=page.next_cursor,
     )
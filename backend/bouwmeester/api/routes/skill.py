@@ -295,7 +295,9 @@ Extends EdgeResponse with full node objects:
     }
   ],
   "total": 42,
-  "query": "woningbouw"
+  "query": "woningbouw",
+  "facets": {"corpus_node": 30, "task": 12},
+  "next_cursor": "opaque-string | null"
 }
 ```
 
@@ -357,6 +359,11 @@ curl -H "Authorization: Bearer bm_..." "$BASE/api/nodes?limit=20"
 # Filter by type
 curl -H "Authorization: Bearer bm_..." "$BASE/api/nodes?node_type=dossier"
 
+# Most connected nodes / orphans (precomputed graph metrics, refreshed by
+# the worker; sort_by: degree, pagerank, betweenness)
+curl -H "Authorization: Bearer bm_..." "$BASE/api/nodes?sort_by=pagerank&limit=10"
+curl -H "Authorization: Bearer bm_..." "$BASE/api/nodes?orphan=true"
+
 # Get a single node with its edges
 curl -H "Authorization: Bearer bm_..." "$BASE/api/nodes/{id}"
 ```
@@ -565,6 +572,11 @@ curl -H "Authorization: Bearer bm_..." \\
 
 Valid `result_types`: `corpus_node`, `task`, `person`, `organisatie_eenheid`, `parlementair_item`, `tag`.
 
+`total` counts all matches for the requested types; `facets` gives the
+match count per type regardless of `result_types`. To fetch the next
+page, pass `next_cursor` back as `cursor` (with the same `q` and
+`result_types`); it is `null` on the last page.
+
 ### 14. Graph views
 
 ```bash
@@ -581,12 +593,38 @@ curl -H "Authorization: Bearer bm_..." \\
 # Shortest path between two nodes
 curl -H "Authorization: Bearer bm_..." \\
   "$BASE/api/graph/path?from_id={uuid}&to_id={uuid}&max_depth=10"
+
+# Everything that ultimately rolls up into a node (and the inverse)
+curl -H "Authorization: Bearer bm_..." \\
+  "$BASE/api/graph/descendants?node_id={uuid}&node_types=maatregel"
+curl -H "Authorization: Bearer bm_..." \\
+  "$BASE/api/graph/ancestors?node_id={uuid}&edge_types=onderdeel_van"
 ```
 
 `GET /graph/search` returns a `GraphViewResponse` (`{nodes, edges}`).
+For large graphs send `Accept: application/x-ndjson` to stream the result
+instead: one `{"node": {...}}` line per node, then one `{"edge": {...}}`
+line per edge.
+Both graph views also accept `Accept: application/vnd.bouwmeester.graph`
+for a compact little-endian binary layout (interned node indices, coded
+types, CSR edge arrays; add `include_descriptions=true` for descriptions).
 `GET /graph/path` also returns a `GraphViewResponse` containing only the
 nodes and edges along the shortest path (empty if no path found within
 `max_depth`, default 10, max 50).
+`GET /graph/diff?from=YYYY-MM-DD&to=YYYY-MM-DD` (`to` defaults to today)
+returns only what changed in between: `nodes_added`, `nodes_removed`,
+`nodes_changed` (with `previous_title` / `previous_status`) and
+`edges_added`, `edges_removed`, `edges_changed`.
+Both graph views accept `as_of=YYYY-MM-DD` to show the corpus as it was
+on that date: only nodes valid then, with the title and status they had
+then, and only edges created by then (deleted edges cannot be shown).
+`GET /graph/descendants` and `GET /graph/ancestors` follow the
+hierarchical edge types (`onderdeel_van`, `implementeert`,
+`vloeit_voort_uit`, `draagt_bij_aan`) transitively, from child (edge
+source) to parent (edge target).  They return `{node_id, direction, nodes}`
+where each entry has the `node`, its shortest `depth` and the `edge_types`
+it is reachable through; filter with `edge_types`, `node_types` and
+`max_depth`.
 
 ### 15. Notifications
 
@@ -654,7 +692,7 @@ Understanding what happens when entities are deleted:
 ## Important Conventions
 
 - **UUID primary keys** — all entity IDs are UUIDs
-- **Pagination** — use `skip` (offset) and `limit` query params. List endpoints return a **plain JSON array** (not wrapped in an envelope). There is no `total` or `has_more` field. To paginate, request with `skip` + `limit` and stop when fewer results than `limit` are returned. The `GET /search` endpoint is the exception — it returns `{results, total, query}`
+- **Pagination** — use `skip` (offset) and `limit` query params. List endpoints return a **plain JSON array** (not wrapped in an envelope). There is no `total` or `has_more` field. To paginate, request with `skip` + `limit` and stop when fewer results than `limit` are returned. The `GET /search` endpoint is the exception — it returns `{results, total, query, facets, next_cursor}` and pages with an opaque `cursor` param instead of `skip`
 - **Dutch labels** — UI labels and some error messages are in Dutch
 - **Task priorities** — `kritiek`, `hoog`, `normaal`, `laag`
 - **Task statuses** — `open`, `in_progress`, `done`, `cancelled`
@@ -8,6 +8,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bouwmeester.api.deps import require_deleted, require_found
 from bouwmeester.core.auth import OptionalUser
 from bouwmeester.core.database import get_db
+from bouwmeester.core.mention_index import (
+    note_mentionable_deleted,
+    note_mentionable_saved,
+)
 from bouwmeester.repositories.tag import TagRepository
 from bouwmeester.schema.tag import (
     TagCreate,
@@ -62,6 +66,7 @@ async def create_tag(
     """Create a new tag, optionally with a parent_id for hierarchy."""
     repo = TagRepository(db)
     tag = await repo.create(data)
+    note_mentionable_saved(db, "tag", tag.id, tag.name)
 
     await log_activity(
         db,
@@ -95,6 +100,7 @@ async def update_tag(
     """Update a tag's name or parent."""
     repo = TagRepository(db)
     tag = require_found(await repo.update(tag_id, data), "Tag")
+    note_mentionable_saved(db, "tag", tag.id, tag.name)
 
     await log_activity(
         db,
@@ -119,6 +125,7 @@ async def delete_tag(
     tag = await repo.get_by_id(tag_id)
     tag_name = tag.name if tag else None
     require_deleted(await repo.delete(tag_id), "Tag")
+    note_mentionable_deleted(db, "tag", tag_id)
     await log_activity(
         db,
         current_user,
@@ -8,6 +8,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from bouwmeester.api.deps import require_deleted, require_found, validate_list
 from bouwmeester.core.auth import OptionalUser
 from bouwmeester.core.database import get_db
+from bouwmeester.core.mention_index import (
+    note_mentionable_deleted,
+    note_mentionable_saved,
+)
 from bouwmeester.models.person import Person
 from bouwmeester.repositories.task import TaskRepository
 from bouwmeester.schema.inbox import InboxResponse
@@ -75,6 +79,7 @@ async def create_task(
     """Create a task linked to a node. Notifies assignee and team manager."""
     repo = TaskRepository(db)
     task = await repo.create(data)
+    note_mentionable_saved(db, "task", task.id, task.title, task.status)
 
     await sync_and_notify_mentions(
         db,
@@ -216,6 +221,7 @@ async def update_task(
     old_org_unit_id = old_task.organisatie_eenheid_id if old_task else None
 
     task = require_found(await repo.update(id, data), "Task")
+    note_mentionable_saved(db, "task", task.id, task.title, task.status)
 
     await sync_and_notify_mentions(
         db,
@@ -297,6 +303,7 @@ async def delete_task(
     task_title = task.title if task else None
     task_node_id = task.node_id if task else None
     require_deleted(await repo.delete(id), "Task")
+    note_mentionable_deleted(db, "task", id)
     await log_activity(
         db,
         current_user,
@@ -2,14 +2,30 @@
 
 Uses SHA-256 hashing (high-entropy keys don't need bcrypt) matching the
 pattern used by Stripe, GitHub, etc.
+
+Also holds the per-process ``hash → person`` cache used by
+:class:`~bouwmeester.middleware.auth_required.AuthRequiredMiddleware`, so an
+agent making many calls does not cost a database round trip per request.
 """
 
 import hashlib
 import secrets
+import time
+from collections import OrderedDict
+from uuid import UUID
 
 _API_KEY_PREFIX = "bm_"
 _API_KEY_BYTES = 16  # 128-bit entropy → 32 hex chars
 
+# Resolved identities are trusted for this long.  Routes that rotate a key
+# or change its owner call :func:`forget_api_key_person`; changes made by
+# other workers (or directly in the database) apply once entries expire.
+_IDENTITY_TTL_SECONDS = 30.0
+_IDENTITY_CACHE_SIZE = 1024
+
+# key hash → (person id, key usable, cached at)
+_identity_cache: OrderedDict[str, tuple[UUID, bool, float]] = OrderedDict()
+
 
 def generate_api_key() -> str:
     """Generate a new API key with ``bm_`` prefix and 32 random hex chars."""
@@ -25,3 +41,34 @@ def verify_api_key(plaintext: str, stored_hash: str) -> bool:
     """Constant-time comparison of a plaintext key against a stored hash."""
     candidate = hash_api_key(plaintext)
     return secrets.compare_digest(candidate, stored_hash)
+
+
+def get_cached_identity(key_hash: str) -> tuple[UUID, bool] | None:
+    """Return ``(person_id, usable)`` for a recently resolved key hash."""
+    entry = _identity_cache.get(key_hash)
+    if entry is None:
+        return None
+    person_id, usable, cached_at = entry
+    if time.monotonic() - cached_at > _IDENTITY_TTL_SECONDS:
+        del _identity_cache[key_hash]
+        return None
+    _identity_cache.move_to_end(key_hash)
+    return person_id, usable
+
+
+def cache_identity(key_hash: str, person_id: UUID, usable: bool) -> None:
+    """Remember which person *key_hash* belongs to and whether it may log in."""
+    _identity_cache[key_hash] = (person_id, usable, time.monotonic())
+    _identity_cache.move_to_end(key_hash)
+    while len(_identity_cache) > _IDENTITY_CACHE_SIZE:
+        _identity_cache.popitem(last=False)
+
+
+def forget_api_key_person(person_id: UUID) -> None:
+    """Drop cached identities of *person_id* (key rotated, person changed)."""
+    for key_hash in [h for h, e in _identity_cache.items() if e[0] == person_id]:
+        del _identity_cache[key_hash]
+
+
+def reset_identity_cache() -> None:
+    _identity_cache.clear()
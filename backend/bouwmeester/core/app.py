@@ -10,8 +10,13 @@ from pydantic import ValidationError
 from starlette.middleware.gzip import GZipMiddleware
 
 from bouwmeester.core.config import get_settings
-from bouwmeester.core.database import async_session, close_db, init_db
-from bouwmeester.core.session_store import DatabaseSessionStore, run_cleanup_loop
+from bouwmeester.core.database import async_session, close_db, engine, init_db
+from bouwmeester.core.session_store import (
+    DatabaseSessionStore,
+    run_cleanup_loop,
+    run_flush_loop,
+    run_invalidation_listener,
+)
 from bouwmeester.middleware.auth_required import AuthRequiredMiddleware
 from bouwmeester.middleware.csrf import CSRFMiddleware
 from bouwmeester.middleware.session import ServerSideSessionMiddleware
@@ -33,13 +38,25 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         await refresh_whitelist_cache(session)
         await session.commit()
 
-    cleanup_task = asyncio.create_task(run_cleanup_loop(app.state.session_store))
+    session_store = app.state.session_store
+    cleanup_task = asyncio.create_task(run_cleanup_loop(session_store))
+    flush_task = asyncio.create_task(
+        run_flush_loop(session_store, get_settings().SESSION_TOUCH_FLUSH_SECONDS)
+    )
+    listener_task = asyncio.create_task(
+        run_invalidation_listener(session_store, engine)
+    )
     yield
-    cleanup_task.cancel()
+    for task in (cleanup_task, flush_task, listener_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
     try:
-        await cleanup_task
-    except asyncio.CancelledError:
-        pass
+        await session_store.flush()
+    except Exception:
+        logger.exception("Final session touch flush failed")
     from bouwmeester.core.auth import close_http_client
 
     await close_http_client()
@@ -93,6 +110,8 @@ def create_app() -> FastAPI:
         session_factory=async_session,
         ttl_seconds=settings.SESSION_TTL_SECONDS,
         encryption_key=settings.SESSION_SECRET_KEY,
+        cache_size=settings.SESSION_CACHE_SIZE,
+        cache_check_seconds=settings.SESSION_CACHE_CHECK_SECONDS,
     )
     app.state.session_store = session_store
 
@@ -9,8 +9,10 @@ application can run without authentication.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import time
+from collections import OrderedDict
 from typing import Annotated, Any
 from uuid import UUID
 
@@ -38,6 +40,17 @@ _TOKEN_REVALIDATION_INTERVAL = 300
 # for up to this many seconds beyond the last successful validation.
 _NETWORK_ERROR_GRACE_SECONDS = 120
 
+# Validated Bearer-token claims are cached until the token's ``exp``.  Claims
+# from the userinfo endpoint (opaque tokens) are re-checked after
+# _BEARER_USERINFO_TTL; tokens Keycloak rejected are refused without asking
+# again for _BEARER_REJECTED_TTL.
+_BEARER_CACHE_SIZE = 4096
+_BEARER_USERINFO_TTL = 60
+_BEARER_REJECTED_TTL = 30
+
+# sha256(token) → (claims, or None if rejected; valid until, wall clock)
+_bearer_cache: OrderedDict[str, tuple[dict[str, Any] | None, float]] = OrderedDict()
+
 # Shared httpx client for outbound OIDC requests (connection pooling).
 _http_client: httpx.AsyncClient | None = None
 
@@ -207,6 +220,77 @@ def validate_jwt_locally(
         return None
 
 
+def _cache_bearer_result(
+    key: str, claims: dict[str, Any] | None, valid_until: float
+) -> None:
+    _bearer_cache[key] = (claims, valid_until)
+    _bearer_cache.move_to_end(key)
+    while len(_bearer_cache) > _BEARER_CACHE_SIZE:
+        _bearer_cache.popitem(last=False)
+
+
+def reset_bearer_cache() -> None:
+    _bearer_cache.clear()
+
+
+async def validate_bearer_token(
+    token: str,
+    settings: Settings,
+) -> dict[str, Any] | None:
+    """Validate an OIDC Bearer token and return its claims.
+
+    Tries the cache, then local JWT validation, then the userinfo endpoint.
+    Returns ``None`` if the token is invalid or cannot be checked (OIDC
+    metadata unavailable, userinfo endpoint not HTTPS).  Only an explicit
+    401/403 from the userinfo endpoint is cached as a rejection; other
+    error statuses return ``None`` uncached, and network errors raise
+    :class:`httpx.HTTPError`.
+    """
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    now = time.time()
+    cached = _bearer_cache.get(key)
+    if cached is not None:
+        claims, valid_until = cached
+        if now < valid_until:
+            _bearer_cache.move_to_end(key)
+            return dict(claims) if claims is not None else None
+        del _bearer_cache[key]
+
+    # 1. Local JWT validation (fast, no network).
+    jwks = await get_jwks(settings)
+    if jwks:
+        claims = validate_jwt_locally(token, jwks, settings)
+        if claims:
+            exp = claims.get("exp")
+            if isinstance(exp, int | float) and exp > now:
+                _cache_bearer_result(key, claims, float(exp))
+            return dict(claims)
+
+    # 2. Userinfo endpoint.
+    metadata = await get_oidc_metadata(settings)
+    if not metadata:
+        return None
+    userinfo_url = metadata.get("userinfo_endpoint")
+    if not userinfo_url or not require_https(userinfo_url, "Userinfo endpoint"):
+        return None
+
+    client = get_http_client()
+    resp = await client.get(
+        userinfo_url,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    if resp.status_code in (401, 403):
+        _cache_bearer_result(key, None, now + _BEARER_REJECTED_TTL)
+        return None
+    if resp.status_code != 200:
+        # Server-side trouble (5xx, 429, ...) says nothing about the token.
+        logger.warning("Userinfo endpoint returned %s", resp.status_code)
+        return None
+    claims = resp.json()
+    _cache_bearer_result(key, claims, now + _BEARER_USERINFO_TTL)
+    return dict(claims)
+
+
 # ---------------------------------------------------------------------------
 # OAuth / OIDC client singleton
 # ---------------------------------------------------------------------------
@@ -519,6 +603,23 @@ async def _validate_token(request: Request, settings: Settings) -> dict | None:
     if not token:
         return None
 
+    # Bearer tokens go through the shared (cached) validation.
+    if is_bearer:
+        try:
+            claims = await validate_bearer_token(token, settings)
+        except httpx.HTTPError as exc:
+            logger.warning("OIDC token validation failed: %s", exc)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token validation failed",
+            ) from exc
+        if claims is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token",
+            )
+        return claims
+
     # Try local JWT validation first (avoids network call).
     jwks = await get_jwks(settings)
     if jwks:
@@ -0,0 +1,52 @@
+"""Apply in-process cache updates only once the database write commits.
+
+The per-process indexes (graph, duplicates, mentions) are told about local
+writes so they need not wait for their next refresh.  Applying such a note
+before the transaction commits would leave a phantom behind if it rolled
+back, so notes are queued on the session and run from its ``after_commit``
+event instead.
+"""
+
+import logging
+from collections.abc import Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+logger = logging.getLogger(__name__)
+
+# Key in ``Session.info`` of the actions queued in the open transaction.
+_ACTIONS = "after_commit_actions"
+
+
+def after_commit(session: AsyncSession, action: Callable[[], None]) -> None:
+    """Run *action* once *session*'s outermost transaction commits.
+
+    Queued actions are dropped on any rollback, savepoints included;
+    the indexes pick up whatever still commits on their next refresh.
+    """
+    sync_session = session.sync_session
+    actions = sync_session.info.get(_ACTIONS)
+    if actions is None:
+        actions = sync_session.info[_ACTIONS] = []
+        event.listen(sync_session, "after_commit", _run_actions)
+        event.listen(sync_session, "after_soft_rollback", _drop_actions)
+    actions.append(action)
+
+
+def _run_actions(sync_session: Session) -> None:
+    if sync_session.get_nested_transaction() is not None:
+        return  # only a savepoint was released
+    actions = sync_session.info[_ACTIONS]
+    queued = list(actions)
+    actions.clear()
+    for action in queued:
+        try:
+            action()
+        except Exception:
+            logger.exception("After-commit cache update failed")
+
+
+def _drop_actions(sync_session: Session, previous: SessionTransaction) -> None:
+    sync_session.info[_ACTIONS].clear()
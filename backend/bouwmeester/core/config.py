@@ -50,6 +50,13 @@ class Settings(BaseSettings):
     SESSION_COOKIE_DOMAIN: str = ""
     SESSION_COOKIE_SECURE: bool = False
     SESSION_TTL_SECONDS: int = 604800  # 7 days
+    # Decrypted sessions cached per process (0 disables the cache), and how
+    # often all cached sessions are re-checked against the database, on top
+    # of the LISTEN/NOTIFY invalidations from other replicas.
+    SESSION_CACHE_SIZE: int = 1024
+    SESSION_CACHE_CHECK_SECONDS: float = 2.0
+    # How often sliding expiry and touch fields are written back in bulk.
+    SESSION_TOUCH_FLUSH_SECONDS: float = 30.0
 
     # WebAuthn (biometric re-authentication)
     WEBAUTHN_RP_ID: str = ""
@@ -62,8 +69,26 @@ class Settings(BaseSettings):
     EK_API_BASE_URL: str = "https://opendata.eerstekamer.nl"
     TK_POLL_INTERVAL_SECONDS: int = 3600
     TK_IMPORT_LIMIT: int = 100
+    GRAPH_METRICS_INTERVAL_SECONDS: int = 300
+    # Edge types kept in the edge_closure reachability table.  The worker
+    # rebuilds the table on start-up, so changes apply after a restart.
+    HIERARCHICAL_EDGE_TYPES: list[str] = [
+        "onderdeel_van",
+        "implementeert",
+        "vloeit_voort_uit",
+        "draagt_bij_aan",
+    ]
+    # How often the in-process mention autocomplete index checks the
+    # database for writes made by other workers.
+    MENTION_INDEX_CHECK_SECONDS: float = 10.0
+    # Same for the TF-IDF index behind /api/nodes/{id}/similar.
+    SIMILARITY_INDEX_CHECK_SECONDS: float = 60.0
+    DUPLICATE_INDEX_CHECK_SECONDS: float = 60.0
     LLM_MODEL: str = "claude-haiku-4-5-20251001"
     LLM_PROVIDER: str = "claude"  # "claude" or "vlam"
+    # Persistent LLM response cache (llm_cache table); a TTL of 0 disables it.
+    LLM_CACHE_TTL_SECONDS: float = 7 * 24 * 3600
+    LLM_CACHE_MAX_ENTRIES: int = 20000
     VLAM_API_KEY: str = ""
     VLAM_BASE_URL: str = ""
     VLAM_MODEL_ID: str = ""
@@ -0,0 +1,81 @@
+"""Change feed over ``search_document`` for in-process indexes.
+
+Several per-process indexes (mention autocomplete, text similarity,
+duplicate detection) are built from ``search_document`` rows.  A
+:class:`DocumentFeed` tells them, at most every few seconds, how many
+rows they should hold and which rows changed since the previous check,
+so they can apply deltas and only rebuild when rows disappeared.
+
+Typical use::
+
+    if index is None or feed.due():
+        count, latest = await feed.poll(session)
+        since = feed.changed_since(latest)
+        if index is not None and since is not None:
+            ...  # re-read rows with updated_at >= since
+        if index is None or len(index) != count:
+            ...  # full rebuild
+        feed.mark(latest)
+"""
+
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import ColumnElement, Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bouwmeester.core.config import get_settings
+from bouwmeester.models.search_document import SearchDocument
+
+# Transactions that were still open at the previous check commit rows
+# with an older ``updated_at``; re-read this far back to pick them up.
+DELTA_LOOKBACK = timedelta(minutes=5)
+
+
+class DocumentFeed:
+    def __init__(self, *criteria: ColumnElement[bool], interval_setting: str) -> None:
+        """Follow the ``search_document`` rows matching *criteria*.
+
+        *interval_setting* names the ``Settings`` field holding the
+        minimum number of seconds between two database checks.
+        """
+        self._criteria = criteria
+        self._interval_setting = interval_setting
+        self.reset()
+
+    def reset(self) -> None:
+        self._latest: datetime | None = None
+        self._checked_at: float | None = None
+
+    def due(self) -> bool:
+        """Whether the database should be checked again."""
+        if self._checked_at is None:
+            return True
+        interval = getattr(get_settings(), self._interval_setting)
+        return time.monotonic() - self._checked_at >= interval
+
+    def select(self, *columns, since: datetime | None = None) -> Select:
+        """Select *columns* of the followed rows (changed since *since*)."""
+        stmt = select(*columns).where(*self._criteria)
+        if since is not None:
+            stmt = stmt.where(SearchDocument.updated_at >= since)
+        return stmt
+
+    async def poll(self, session: AsyncSession) -> tuple[int, datetime | None]:
+        """Current ``(row count, max(updated_at))`` of the followed rows."""
+        result = await session.execute(
+            self.select(func.count(), func.max(SearchDocument.updated_at))
+        )
+        count, latest = result.one()
+        return count, latest
+
+    def changed_since(self, latest: datetime | None) -> datetime | None:
+        """Lower bound for re-reading changed rows, or None if unchanged."""
+        if self._latest is None or latest is None or latest <= self._latest:
+            return None
+        return self._latest - DELTA_LOOKBACK
+
+    def mark(self, latest: datetime | None) -> None:
+        """Record a completed check that saw *latest*."""
+        self._latest = latest
+        self._checked_at = time.monotonic()
@@ -0,0 +1,277 @@
+"""MinHash / LSH index for spotting near-duplicate corpus nodes.
+
+Comparing every node with every other node is quadratic, so each node's
+title and description are reduced to a short MinHash signature and the
+signature is split into bands.  Nodes that agree on any whole band land
+in the same bucket; only those candidates are compared.  Checking one
+node is a handful of dict lookups regardless of corpus size.
+
+Signatures use one-permutation hashing: every character shingle is
+hashed once and kept only if it is the minimum of its bin, with empty
+bins borrowed from the next non-empty one.  Signatures are never
+persisted, so Python's per-process ``hash()`` is good enough.
+
+The index is refreshed like :mod:`~bouwmeester.core.mention_index`:
+:func:`check_node` adds a created or edited node once its transaction
+commits, and :func:`get_duplicate_index` applies ``search_document``
+deltas at most every ``DUPLICATE_INDEX_CHECK_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterable
+from datetime import datetime
+from functools import partial
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bouwmeester.core.commit_hooks import after_commit
+from bouwmeester.core.document_feed import DocumentFeed
+from bouwmeester.core.mention_index import fold
+from bouwmeester.models.search_document import SearchDocument
+from bouwmeester.utils.tiptap import tiptap_to_plain
+
+logger = logging.getLogger(__name__)
+
+_SHINGLE = 4
+# Long descriptions add little beyond their opening.
+_MAX_TEXT = 1000
+# 16 bands of 4 rows: pairs with Jaccard similarity ~0.5 collide in at
+# least one band about half of the time, ~0.8 almost always.
+_BANDS = 16
+_ROWS = 4
+_BINS = _BANDS * _ROWS
+_HASH_MASK = (1 << 64) - 1
+
+DEFAULT_THRESHOLD = 0.7
+
+Signature = tuple[int, ...]
+
+
+def _normalise(title: str, body: str | None) -> str:
+    text = f"{title} {body or ''}"[:_MAX_TEXT]
+    return " ".join(re.findall(r"\w+", fold(text)))
+
+
+def signature(title: str, body: str | None) -> Signature | None:
+    """MinHash signature of a node's text, or None if it is too short."""
+    text = _normalise(title, body)
+    if len(text) < _SHINGLE:
+        return None
+    bins: list[int | None] = [None] * _BINS
+    for i in range(len(text) - _SHINGLE + 1):
+        h = hash(text[i : i + _SHINGLE]) & _HASH_MASK
+        b, value = h % _BINS, h // _BINS
+        current = bins[b]
+        if current is None or value < current:
+            bins[b] = value
+    # Densify: an empty bin takes the value of the next non-empty bin
+    # (cyclically), offset by the distance so it stays distinct.
+    filled = [b for b in range(_BINS) if bins[b] is not None]
+    result = []
+    for b in range(_BINS):
+        value = bins[b]
+        if value is None:
+            distance, donor = min(((d - b) % _BINS, d) for d in filled)
+            value = bins[donor] + distance * _HASH_MASK
+        result.append(value)
+    return tuple(result)
+
+
+def similarity(a: Signature, b: Signature) -> float:
+    """Estimated Jaccard similarity of the two shingle sets."""
+    return sum(x == y for x, y in zip(a, b, strict=True)) / _BINS
+
+
+class DuplicateIndex:
+    """LSH buckets over node signatures."""
+
+    def __init__(self, docs: Iterable[tuple[UUID, str, str | None]] = ()) -> None:
+        self._signatures: dict[UUID, Signature] = {}
+        self._buckets: list[dict[int, set[UUID]]] = [{} for _ in range(_BANDS)]
+        # Nodes without a signature, so len() matches the followed rows.
+        self._unsigned: set[UUID] = set()
+        for node_id, title, body in docs:
+            self.upsert(node_id, title, body)
+
+    def __len__(self) -> int:
+        return len(self._signatures) + len(self._unsigned)
+
+    def upsert(self, node_id: UUID, title: str, body: str | None) -> None:
+        sig = signature(title, body)
+        if node_id in self._signatures and self._signatures[node_id] == sig:
+            return
+        self.remove(node_id)
+        if sig is None:
+            self._unsigned.add(node_id)
+            return
+        self._signatures[node_id] = sig
+        for band, key in enumerate(self._band_keys(sig)):
+            self._buckets[band].setdefault(key, set()).add(node_id)
+
+    def remove(self, node_id: UUID) -> None:
+        self._unsigned.discard(node_id)
+        sig = self._signatures.pop(node_id, None)
+        if sig is None:
+            return
+        for band, key in enumerate(self._band_keys(sig)):
+            bucket = self._buckets[band][key]
+            bucket.discard(node_id)
+            if not bucket:
+                del self._buckets[band][key]
+
+    def candidates(
+        self, node_id: UUID, threshold: float = DEFAULT_THRESHOLD
+    ) -> list[tuple[UUID, float]]:
+        """Indexed nodes likely to duplicate *node_id*, most similar first."""
+        return self.similar_to(self._signatures.get(node_id), node_id, threshold)
+
+    def similar_to(
+        self,
+        sig: Signature | None,
+        exclude: UUID | None = None,
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> list[tuple[UUID, float]]:
+        """Indexed nodes likely to duplicate a text with signature *sig*."""
+        if sig is None:
+            return []
+        seen: set[UUID] = {exclude} if exclude is not None else set()
+        found = []
+        for band, key in enumerate(self._band_keys(sig)):
+            for other in self._buckets[band].get(key, ()):
+                if other in seen:
+                    continue
+                seen.add(other)
+                score = similarity(sig, self._signatures[other])
+                if score >= threshold:
+                    found.append((other, score))
+        found.sort(key=lambda f: f[1], reverse=True)
+        return found
+
+    def groups(
+        self, threshold: float = DEFAULT_THRESHOLD
+    ) -> list[tuple[list[UUID], float]]:
+        """Clusters of likely duplicates with their weakest link.
+
+        Every bucket member is compared with the bucket's first member
+        only, so a bucket of *n* nodes costs *n* comparisons; clusters
+        are then joined across buckets (union-find).
+        """
+        parent: dict[UUID, UUID] = {}
+        weakest: dict[UUID, float] = {}
+
+        def find(x: UUID) -> UUID:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for buckets in self._buckets:
+            for members in buckets.values():
+                if len(members) < 2:
+                    continue
+                first, *rest = sorted(members)
+                for other in rest:
+                    score = similarity(self._signatures[first], self._signatures[other])
+                    if score < threshold:
+                        continue
+                    parent.setdefault(first, first)
+                    parent.setdefault(other, other)
+                    a, b = find(first), find(other)
+                    link = min(score, weakest.get(a, 1.0), weakest.get(b, 1.0))
+                    if a != b:
+                        parent[b] = a
+                    weakest[a] = link
+
+        clusters: dict[UUID, list[UUID]] = {}
+        for node_id in parent:
+            clusters.setdefault(find(node_id), []).append(node_id)
+        result = [
+            (sorted(members), weakest[root])
+            for root, members in clusters.items()
+            if len(members) > 1
+        ]
+        result.sort(key=lambda g: (-g[1], g[0][0]))
+        return result
+
+    @staticmethod
+    def _band_keys(sig: Signature) -> list[int]:
+        return [hash(sig[b * _ROWS : (b + 1) * _ROWS]) for b in range(_BANDS)]
+
+
+# ---------------------------------------------------------------------------
+# Process-wide cache
+# ---------------------------------------------------------------------------
+
+_index: DuplicateIndex | None = None
+_feed = DocumentFeed(
+    SearchDocument.entity_type == "corpus_node",
+    interval_setting="DUPLICATE_INDEX_CHECK_SECONDS",
+)
+
+
+async def _load(session: AsyncSession, since: datetime | None = None):
+    stmt = _feed.select(
+        SearchDocument.entity_id,
+        SearchDocument.title,
+        SearchDocument.body,
+        since=since,
+    )
+    return (await session.execute(stmt)).all()
+
+
+async def get_duplicate_index(session: AsyncSession) -> DuplicateIndex:
+    """Return the process-wide duplicate index, refreshing it when due."""
+    global _index  # noqa: PLW0603
+
+    if _index is not None and not _feed.due():
+        return _index
+
+    count, latest = await _feed.poll(session)
+    since = _feed.changed_since(latest)
+    if _index is not None and since is not None:
+        for row in await _load(session, since=since):
+            _index.upsert(*row)
+    if _index is None or len(_index) != count:
+        _index = DuplicateIndex(await _load(session))
+        logger.debug("Duplicate index rebuilt (%d nodes)", len(_index))
+    _feed.mark(latest)
+    return _index
+
+
+def _index_node(node_id: UUID, title: str, text: str | None) -> None:
+    if _index is not None:
+        _index.upsert(node_id, title, text)
+
+
+async def check_node(
+    session: AsyncSession, node_id: UUID, title: str, description: str | None
+) -> list[tuple[UUID, float]]:
+    """Return the likely duplicates of a created or edited node.
+
+    The node itself enters the index only when *session* commits, so a
+    rolled-back write leaves nothing behind.
+    """
+    index = await get_duplicate_index(session)
+    text = tiptap_to_plain(description)
+    found = index.similar_to(signature(title, text), exclude=node_id)
+    after_commit(session, partial(_index_node, node_id, title, text))
+    if found:
+        logger.info(
+            "Node %s (%r) looks like a duplicate of %s",
+            node_id,
+            title,
+            ", ".join(str(other) for other, _score in found),
+        )
+    return found
+
+
+def reset_duplicate_index() -> None:
+    """Drop the cached index (useful for testing)."""
+    global _index  # noqa: PLW0603
+
+    _index = None
+    _feed.reset()
@@ -0,0 +1,428 @@
+"""In-memory adjacency index over the ``edge`` table.
+
+Path finding used to run a recursive CTE that carried a ``visited`` array
+for every partial path, which blows up combinatorially between distant
+nodes.  Instead we keep a compact, per-process copy of the graph topology:
+node UUIDs are interned to dense ints and neighbours are stored in
+compressed sparse row (CSR) form backed by :mod:`array` buffers.
+
+The index is refreshed in two ways:
+
+- **Incrementally** — the edge routes call :func:`note_edge_created`,
+  :func:`note_edge_updated` and :func:`note_edge_deleted`, which are
+  applied once the request commits, so local writes never force a rebuild
+  and rolled-back ones never reach the index.
+- **On signature mismatch** — :func:`get_graph_index` compares a cheap
+  ``count(*)`` / ``max(created_at)`` / ``max(updated_at)`` signature of
+  the edge table with the one the index was built from.  Writes from other
+  workers (including edge-type changes), cascading node deletes and bulk
+  imports all change the signature and trigger a full (single-query)
+  rebuild.
+"""
+
+from __future__ import annotations
+
+import logging
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bouwmeester.core.commit_hooks import after_commit
+
+if TYPE_CHECKING:
+    from bouwmeester.models.edge import Edge
+
+logger = logging.getLogger(__name__)
+
+# Fold the overlay / tombstones back into the CSR arrays once they grow
+# beyond this many edges (or 10% of the graph, whichever is larger).
+_COMPACT_MIN_CHANGES = 1024
+
+EdgeRow = tuple[UUID, UUID, UUID, str]
+"""``(edge_id, from_node_id, to_node_id, edge_type_id)``"""
+
+PathStep = tuple[UUID, UUID | None, str | None]
+"""``(node_id, edge_id, edge_type_id)`` — the edge leads *into* the node."""
+
+
+class AdjacencyIndex:
+    """Undirected adjacency of the corpus graph in CSR form.
+
+    ``_offsets[v]:_offsets[v + 1]`` slices ``_targets`` / ``_slots`` for the
+    neighbours of node *v*.  Each slot points into the per-edge arrays
+    (``_edge_ids``, ``_edge_from``, ``_edge_to``, ``_edge_type``).  Edges
+    added after the last build live in a small overlay; removed edges are
+    tombstoned until the next compaction.
+    """
+
+    def __init__(self, rows: Iterable[EdgeRow] = ()) -> None:
+        self._node_ids: list[UUID] = []
+        self._node_pos: dict[UUID, int] = {}
+        self._type_ids: list[str] = []
+        self._type_pos: dict[str, int] = {}
+        self.build(rows)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def build(self, rows: Iterable[EdgeRow]) -> None:
+        """(Re)build the CSR arrays from ``(id, from, to, type)`` rows."""
+        self._edge_ids: list[UUID] = []
+        self._edge_slot: dict[UUID, int] = {}
+        self._edge_from = array("l")
+        self._edge_to = array("l")
+        self._edge_type = array("l")
+        self._overlay: dict[int, list[tuple[int, int]]] = {}
+        self._overlay_edges = 0
+        self._removed: set[int] = set()
+
+        for edge_id, from_id, to_id, edge_type_id in rows:
+            self._append_edge(edge_id, from_id, to_id, edge_type_id)
+
+        # Counting sort of both edge directions into CSR order.
+        node_count = len(self._node_ids)
+        degree = array("l", [0]) * (node_count + 1)
+        for slot in range(len(self._edge_ids)):
+            degree[self._edge_from[slot] + 1] += 1
+            degree[self._edge_to[slot] + 1] += 1
+        for v in range(node_count):
+            degree[v + 1] += degree[v]
+        self._offsets = degree
+
+        total = self._offsets[node_count]
+        self._targets = array("l", [0]) * total
+        self._slots = array("l", [0]) * total
+        cursor = array("l", self._offsets[:node_count])
+        for slot in range(len(self._edge_ids)):
+            a, b = self._edge_from[slot], self._edge_to[slot]
+            self._targets[cursor[a]] = b
+            self._slots[cursor[a]] = slot
+            cursor[a] += 1
+            self._targets[cursor[b]] = a
+            self._slots[cursor[b]] = slot
+            cursor[b] += 1
+
+    def compact(self) -> None:
+        """Fold the overlay and tombstones back into the CSR arrays."""
+        self.build(list(self.edges()))
+
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+
+    def add_edge(
+        self, edge_id: UUID, from_id: UUID, to_id: UUID, edge_type_id: str
+    ) -> bool:
+        """Add an edge. Returns ``False`` if it was already indexed."""
+        if edge_id in self._edge_slot:
+            return False
+        slot = self._append_edge(edge_id, from_id, to_id, edge_type_id)
+        a, b = self._edge_from[slot], self._edge_to[slot]
+        self._overlay.setdefault(a, []).append((b, slot))
+        self._overlay.setdefault(b, []).append((a, slot))
+        self._overlay_edges += 1
+        self._maybe_compact()
+        return True
+
+    def remove_edge(self, edge_id: UUID) -> bool:
+        """Remove an edge. Returns ``False`` if it was not indexed."""
+        slot = self._edge_slot.pop(edge_id, None)
+        if slot is None:
+            return False
+        self._removed.add(slot)
+        self._maybe_compact()
+        return True
+
+    def set_edge_type(self, edge_id: UUID, edge_type_id: str) -> bool:
+        """Change the type of an indexed edge."""
+        slot = self._edge_slot.get(edge_id)
+        if slot is None:
+            return False
+        self._edge_type[slot] = self._intern_type(edge_type_id)
+        return True
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edge_slot)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._node_pos
+
+    def neighbors(self, node_id: UUID) -> set[UUID]:
+        """Distinct nodes sharing an edge with *node_id* (either direction)."""
+        v = self._node_pos.get(node_id)
+        if v is None:
+            return set()
+        return {self._node_ids[w] for w, _slot in self._neighbors(v) if w != v}
+
+    def edges(self) -> Iterator[EdgeRow]:
+        """Yield every live edge as an ``(id, from, to, type)`` row."""
+        for edge_id, slot in self._edge_slot.items():
+            yield (
+                edge_id,
+                self._node_ids[self._edge_from[slot]],
+                self._node_ids[self._edge_to[slot]],
+                self._type_ids[self._edge_type[slot]],
+            )
+
+    def shortest_path(
+        self, from_id: UUID, to_id: UUID, max_depth: int
+    ) -> list[PathStep] | None:
+        """Shortest undirected path via bidirectional breadth-first search.
+
+        Expands whichever frontier is smaller, one full level at a time, so
+        the work is roughly ``O(b^(d/2))`` instead of ``O(b^d)``.  Returns
+        ``None`` when no path of at most *max_depth* edges exists.
+        """
+        if from_id == to_id:
+            return [(from_id, None, None)]
+        src = self._node_pos.get(from_id)
+        dst = self._node_pos.get(to_id)
+        if src is None or dst is None:
+            return None
+
+        # node -> (previous node, edge slot, depth); -1 marks the root.
+        forward: dict[int, tuple[int, int, int]] = {src: (-1, -1, 0)}
+        backward: dict[int, tuple[int, int, int]] = {dst: (-1, -1, 0)}
+        forward_frontier = [src]
+        backward_frontier = [dst]
+
+        for _ in range(max_depth):
+            if not forward_frontier or not backward_frontier:
+                return None
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier, meet = self._expand(
+                    forward_frontier, forward, backward
+                )
+            else:
+                backward_frontier, meet = self._expand(
+                    backward_frontier, backward, forward
+                )
+            if meet is not None:
+                return self._join(meet, forward, backward)
+        return None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _intern_node(self, node_id: UUID) -> int:
+        pos = self._node_pos.get(node_id)
+        if pos is None:
+            pos = len(self._node_ids)
+            self._node_ids.append(node_id)
+            self._node_pos[node_id] = pos
+        return pos
+
+    def _intern_type(self, edge_type_id: str) -> int:
+        pos = self._type_pos.get(edge_type_id)
+        if pos is None:
+            pos = len(self._type_ids)
+            self._type_ids.append(edge_type_id)
+            self._type_pos[edge_type_id] = pos
+        return pos
+
+    def _append_edge(
+        self, edge_id: UUID, from_id: UUID, to_id: UUID, edge_type_id: str
+    ) -> int:
+        slot = len(self._edge_ids)
+        self._edge_ids.append(edge_id)
+        self._edge_slot[edge_id] = slot
+        self._edge_from.append(self._intern_node(from_id))
+        self._edge_to.append(self._intern_node(to_id))
+        self._edge_type.append(self._intern_type(edge_type_id))
+        return slot
+
+    def _maybe_compact(self) -> None:
+        threshold = max(_COMPACT_MIN_CHANGES, len(self._edge_slot) // 10)
+        if self._overlay_edges + len(self._removed) > threshold:
+            self.compact()
+
+    def _neighbors(self, v: int) -> Iterator[tuple[int, int]]:
+        # Nodes interned after the last build have no CSR range yet.
+        if v + 1 < len(self._offsets):
+            removed = self._removed
+            for i in range(self._offsets[v], self._offsets[v + 1]):
+                slot = self._slots[i]
+                if slot not in removed:
+                    yield self._targets[i], slot
+        for w, slot in self._overlay.get(v, ()):
+            if slot not in self._removed:
+                yield w, slot
+
+    def _expand(
+        self,
+        frontier: list[int],
+        own: dict[int, tuple[int, int, int]],
+        other: dict[int, tuple[int, int, int]],
+    ) -> tuple[list[int], int | None]:
+        """Expand one BFS level; return the next frontier and best meet node."""
+        next_frontier: list[int] = []
+        meet: int | None = None
+        for v in frontier:
+            depth = own[v][2] + 1
+            for w, slot in self._neighbors(v):
+                if w in own:
+                    continue
+                own[w] = (v, slot, depth)
+                next_frontier.append(w)
+                # Every node in this level has the same depth, so the
+                # shortest join is the one closest to the other root.
+                if w in other and (meet is None or other[w][2] < other[meet][2]):
+                    meet = w
+        return next_frontier, meet
+
+    def _join(
+        self,
+        meet: int,
+        forward: dict[int, tuple[int, int, int]],
+        backward: dict[int, tuple[int, int, int]],
+    ) -> list[PathStep]:
+        # Walk back from the meeting point to the source ...
+        nodes = [meet]
+        slots: list[int] = []
+        v = meet
+        while forward[v][0] != -1:
+            prev, slot, _ = forward[v]
+            slots.append(slot)
+            nodes.append(prev)
+            v = prev
+        nodes.reverse()
+        slots.reverse()
+        # ... and forward from the meeting point to the target.
+        v = meet
+        while backward[v][0] != -1:
+            nxt, slot, _ = backward[v]
+            slots.append(slot)
+            nodes.append(nxt)
+            v = nxt
+
+        steps: list[PathStep] = [(self._node_ids[nodes[0]], None, None)]
+        for node, slot in zip(nodes[1:], slots, strict=True):
+            steps.append(
+                (
+                    self._node_ids[node],
+                    self._edge_ids[slot],
+                    self._type_ids[self._edge_type[slot]],
+                )
+            )
+        return steps
+
+
+# ---------------------------------------------------------------------------
+# Process-wide cache
+# ---------------------------------------------------------------------------
+
+_index: AdjacencyIndex | None = None
+# (count(*), max(created_at), max(updated_at)) of the edge table.
+Signature = tuple[int, datetime | None, datetime | None]
+_signature: Signature | None = None
+
+
+async def _fetch_signature(session: AsyncSession) -> Signature:
+    from bouwmeester.models.edge import Edge
+
+    result = await session.execute(
+        select(
+            func.count(), func.max(Edge.created_at), func.max(Edge.updated_at)
+        ).select_from(Edge)
+    )
+    count, created, updated = result.one()
+    return count, created, updated
+
+
+async def get_graph_index(session: AsyncSession) -> AdjacencyIndex:
+    """Return the process-wide adjacency index, rebuilding it when stale."""
+    global _index, _signature  # noqa: PLW0603
+
+    from bouwmeester.models.edge import Edge
+
+    signature = await _fetch_signature(session)
+    if _index is None or signature != _signature:
+        result = await session.execute(
+            select(Edge.id, Edge.from_node_id, Edge.to_node_id, Edge.edge_type_id)
+        )
+        _index = AdjacencyIndex(result.all())
+        _signature = signature
+        logger.debug("Graph index rebuilt (%d edges)", _index.edge_count)
+    return _index
+
+
+def _later(current: datetime | None, ts: datetime | None) -> datetime | None:
+    if current is None or (ts is not None and ts > current):
+        return ts
+    return current
+
+
+def _apply_created(row: EdgeRow, created_at: datetime | None) -> None:
+    global _signature  # noqa: PLW0603
+
+    if _index is None or _signature is None:
+        return
+    if _index.add_edge(*row):
+        count, created, updated = _signature
+        _signature = (count + 1, _later(created, created_at), updated)
+
+
+def _apply_updated(
+    edge_id: UUID, edge_type_id: str, updated_at: datetime | None
+) -> None:
+    global _signature  # noqa: PLW0603
+
+    if _index is None or _signature is None:
+        return
+    _index.set_edge_type(edge_id, edge_type_id)
+    count, created, updated = _signature
+    _signature = (count, created, _later(updated, updated_at))
+
+
+def _apply_deleted(edge_id: UUID) -> None:
+    global _signature  # noqa: PLW0603
+
+    if _index is None or _signature is None:
+        return
+    if _index.remove_edge(edge_id):
+        count, created, updated = _signature
+        _signature = (count - 1, created, updated)
+
+
+def note_edge_created(session: AsyncSession, edge: Edge) -> None:
+    """Add a freshly flushed edge to the index once *session* commits."""
+    row = (edge.id, edge.from_node_id, edge.to_node_id, edge.edge_type_id)
+    after_commit(session, partial(_apply_created, row, edge.created_at))
+
+
+def note_edge_updated(session: AsyncSession, edge: Edge) -> None:
+    """Propagate an edge-type change to the index once *session* commits."""
+    after_commit(
+        session,
+        partial(_apply_updated, edge.id, edge.edge_type_id, edge.updated_at),
+    )
+
+
+def note_edge_deleted(session: AsyncSession, edge_id: UUID) -> None:
+    """Drop a deleted edge from the index once *session* commits.
+
+    ``max(created_at)`` is left as-is: if the newest edge was removed the
+    signature no longer matches and the next lookup rebuilds.
+    """
+    after_commit(session, partial(_apply_deleted, edge_id))
+
+
+def reset_graph_index() -> None:
+    """Drop the cached index (useful for testing)."""
+    global _index, _signature  # noqa: PLW0603
+
+    _index = None
+    _signature = None
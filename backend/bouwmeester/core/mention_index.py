@@ -0,0 +1,290 @@
+"""In-memory autocomplete index for ``#``/``@`` mention suggestions.
+
+The TipTap mention picker queries on every keystroke.  Instead of running
+``ILIKE '%q%'`` against four tables each time, every process keeps the
+labels of all nodes, tasks, tags and people in memory:
+
+- a **sorted word array** of ``(word, type, id)`` answers prefix lookups
+  by bisection, which is all one- and two-letter queries need;
+- **trigram postings** answer substring lookups for longer queries, so
+  "schap" still finds "Waterschapsbelasting".
+
+Labels are read from ``search_document``, which triggers keep in sync
+with the source tables.  The index is refreshed in two ways:
+
+- **Locally** — the create/update/delete routes call
+  :func:`note_mentionable_saved` and :func:`note_mentionable_deleted`,
+  which take effect only once the request's transaction commits.
+- **From the database** — at most every ``MENTION_INDEX_CHECK_SECONDS``
+  :func:`get_mention_index` reads rows updated since the last check
+  (writes by other workers, imports) and rebuilds completely when the row
+  count no longer matches (deletions elsewhere); see
+  :class:`~bouwmeester.core.document_feed.DocumentFeed`.
+
+Between checks suggestions are served without touching the database.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bouwmeester.core.commit_hooks import after_commit
+from bouwmeester.core.document_feed import DocumentFeed
+from bouwmeester.models.search_document import SearchDocument
+
+logger = logging.getLogger(__name__)
+
+# search_document.entity_type -> mention type used by the picker.
+ENTITY_MENTION_TYPES = {
+    "corpus_node": "node",
+    "task": "task",
+    "tag": "tag",
+    "person": "person",
+}
+
+_WORD_RE = re.compile(r"\w+")
+
+Key = tuple[str, UUID]
+"""``(mention_type, id)``"""
+
+
+@dataclass(frozen=True, slots=True)
+class MentionEntry:
+    type: str
+    id: UUID
+    label: str
+    subtitle: str | None
+    folded: str
+
+
+def fold(text: str) -> str:
+    """Case- and accent-insensitive form used for matching."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _trigrams(folded: str) -> set[str]:
+    return {folded[i : i + 3] for i in range(len(folded) - 2)}
+
+
+def _subtitle(mention_type: str, subtitle: str | None) -> str | None:
+    # node_type / task status are identifiers such as "politieke_input".
+    if subtitle and mention_type in ("node", "task"):
+        return subtitle.replace("_", " ")
+    return subtitle
+
+
+class MentionIndex:
+    """Prefix and substring lookup over mentionable labels."""
+
+    def __init__(self, rows: Iterable[tuple[str, UUID, str, str | None]] = ()) -> None:
+        self._entries: dict[Key, MentionEntry] = {}
+        self._words: list[tuple[str, str, UUID]] = []
+        self._grams: dict[str, set[Key]] = {}
+        for mention_type, entity_id, label, subtitle in rows:
+            self._add(self._entry(mention_type, entity_id, label, subtitle))
+        self._words.sort()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def upsert(
+        self, mention_type: str, entity_id: UUID, label: str, subtitle: str | None
+    ) -> None:
+        entry = self._entry(mention_type, entity_id, label, subtitle)
+        old = self._entries.get((mention_type, entity_id))
+        if old == entry:
+            return
+        if old is not None:
+            self.remove(mention_type, entity_id)
+        self._add(entry, keep_sorted=True)
+
+    def remove(self, mention_type: str, entity_id: UUID) -> None:
+        entry = self._entries.pop((mention_type, entity_id), None)
+        if entry is None:
+            return
+        for word in set(_WORD_RE.findall(entry.folded)):
+            item = (word, mention_type, entity_id)
+            pos = bisect_left(self._words, item)
+            if pos < len(self._words) and self._words[pos] == item:
+                del self._words[pos]
+        for gram in _trigrams(entry.folded):
+            postings = self._grams.get(gram)
+            if postings is not None:
+                postings.discard((mention_type, entity_id))
+                if not postings:
+                    del self._grams[gram]
+
+    @staticmethod
+    def _entry(
+        mention_type: str, entity_id: UUID, label: str, subtitle: str | None
+    ) -> MentionEntry:
+        return MentionEntry(
+            mention_type,
+            entity_id,
+            label,
+            _subtitle(mention_type, subtitle),
+            fold(label),
+        )
+
+    def _add(self, entry: MentionEntry, *, keep_sorted: bool = False) -> None:
+        key = (entry.type, entry.id)
+        self._entries[key] = entry
+        for word in set(_WORD_RE.findall(entry.folded)):
+            item = (word, entry.type, entry.id)
+            if keep_sorted:
+                insort(self._words, item)
+            else:
+                self._words.append(item)
+        for gram in _trigrams(entry.folded):
+            self._grams.setdefault(gram, set()).add(key)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def search(
+        self, query: str, types: Iterable[str], limit: int
+    ) -> list[MentionEntry]:
+        """Best *limit* entries of *types* whose label matches *query*.
+
+        Labels starting with the query rank first, then labels with a word
+        starting with it, then other substring matches; ties are broken
+        alphabetically.
+        """
+        q = fold(query.strip())
+        if not q:
+            return []
+        allowed = set(types)
+
+        if len(q) >= 3:
+            candidates = self._substring_matches(q)
+        else:
+            candidates = self._word_prefix_matches(q)
+
+        ranked = []
+        for key in candidates:
+            if key[0] not in allowed:
+                continue
+            entry = self._entries[key]
+            if entry.folded.startswith(q):
+                rank = 0
+            elif any(w.startswith(q) for w in _WORD_RE.findall(entry.folded)):
+                rank = 1
+            else:
+                rank = 2
+            ranked.append((rank, entry.label.lower(), entry))
+        ranked.sort(key=lambda r: (r[0], r[1]))
+        return [entry for _rank, _label, entry in ranked[:limit]]
+
+    def _word_prefix_matches(self, q: str) -> set[Key]:
+        matches: set[Key] = set()
+        pos = bisect_left(self._words, (q,))
+        while pos < len(self._words) and self._words[pos][0].startswith(q):
+            _word, mention_type, entity_id = self._words[pos]
+            matches.add((mention_type, entity_id))
+            pos += 1
+        return matches
+
+    def _substring_matches(self, q: str) -> set[Key]:
+        postings = [self._grams.get(g) for g in _trigrams(q)]
+        if not all(postings):
+            return set()
+        postings.sort(key=len)
+        matches = set(postings[0]).intersection(*postings[1:])
+        # Trigrams can match out of order; confirm the real substring.
+        return {key for key in matches if q in self._entries[key].folded}
+
+
+# ---------------------------------------------------------------------------
+# Process-wide cache
+# ---------------------------------------------------------------------------
+
+_index: MentionIndex | None = None
+_feed = DocumentFeed(
+    SearchDocument.entity_type.in_(ENTITY_MENTION_TYPES),
+    interval_setting="MENTION_INDEX_CHECK_SECONDS",
+)
+
+
+async def _load(session: AsyncSession, since: datetime | None = None):
+    stmt = _feed.select(
+        SearchDocument.entity_type,
+        SearchDocument.entity_id,
+        SearchDocument.title,
+        SearchDocument.subtitle,
+        since=since,
+    )
+    for entity_type, entity_id, title, subtitle in await session.execute(stmt):
+        yield ENTITY_MENTION_TYPES[entity_type], entity_id, title, subtitle
+
+
+async def get_mention_index(session: AsyncSession) -> MentionIndex:
+    """Return the process-wide mention index, refreshing it when due."""
+    global _index  # noqa: PLW0603
+
+    if _index is not None and not _feed.due():
+        return _index
+
+    count, latest = await _feed.poll(session)
+    since = _feed.changed_since(latest)
+    if _index is not None and since is not None:
+        async for row in _load(session, since=since):
+            _index.upsert(*row)
+    if _index is None or len(_index) != count:
+        _index = MentionIndex([row async for row in _load(session)])
+        logger.debug("Mention index rebuilt (%d entries)", len(_index))
+    _feed.mark(latest)
+    return _index
+
+
+def _upsert(
+    mention_type: str, entity_id: UUID, label: str, subtitle: str | None
+) -> None:
+    if _index is not None:
+        _index.upsert(mention_type, entity_id, label, subtitle)
+
+
+def _remove(mention_type: str, entity_id: UUID) -> None:
+    if _index is not None:
+        _index.remove(mention_type, entity_id)
+
+
+def note_mentionable_saved(
+    session: AsyncSession,
+    mention_type: str,
+    entity_id: UUID,
+    label: str,
+    subtitle: str | None = None,
+) -> None:
+    """Add or update one entry in the index once *session* commits."""
+    after_commit(session, partial(_upsert, mention_type, entity_id, label, subtitle))
+
+
+def note_mentionable_deleted(
+    session: AsyncSession, mention_type: str, entity_id: UUID
+) -> None:
+    """Drop one entry from the index once *session* commits."""
+    after_commit(session, partial(_remove, mention_type, entity_id))
+
+
+def reset_mention_index() -> None:
+    """Drop the cached index (useful for testing)."""
+    global _index  # noqa: PLW0603
+
+    _index = None
+    _feed.reset()
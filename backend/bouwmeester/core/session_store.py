@@ -5,7 +5,16 @@ is considered expired.  A background cleanup coroutine removes stale entries
 periodically.
 
 The browser cookie only contains a signed session ID (via ``itsdangerous``);
-all actual data lives server-side in the database.
+all actual data lives server-side in the database.  Each process keeps a
+small cache of decrypted sessions in front of it, so a hot session costs
+neither a query nor a decrypt per request.  Writes and deletes are
+announced with ``NOTIFY``; :func:`run_invalidation_listener` drops the
+affected entries in every other process.
+
+Timestamps that change on almost every request (:data:`TOUCH_FIELDS`) and
+the sliding expiry are stored apart from the encrypted payload.  They are
+collected in memory and written back periodically in a single multi-row
+UPDATE; the payload is only rewritten when its content changes.
 """
 
 from __future__ import annotations
@@ -14,19 +23,39 @@ import asyncio
 import base64
 import json
 import logging
+import time
+import uuid
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
-from sqlalchemy import delete, select, text
+from sqlalchemy import delete, func, select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 logger = logging.getLogger(__name__)
 
+# Session keys that only record when something was last checked.  Changing
+# them does not warrant rewriting (and re-encrypting) the whole session.
+TOUCH_FIELDS = frozenset({"token_validated_at", "is_admin_checked_at"})
+
+# NOTIFY channel announcing "<origin> <session_id>" on every write/delete.
+SESSION_CHANNEL = "http_session_changed"
+
+
+def split_touch_fields(
+    data: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split session *data* into ``(payload, touch fields)``."""
+    payload = {k: v for k, v in data.items() if k not in TOUCH_FIELDS}
+    touch = {k: v for k, v in data.items() if k in TOUCH_FIELDS}
+    return payload, touch
+
 
 def _derive_fernet_key(secret: str) -> bytes:
     """Derive a 32-byte Fernet key from an arbitrary secret string using HKDF.
@@ -66,12 +95,89 @@ class SessionStore(ABC):
     async def cleanup(self) -> int:
         """Remove expired sessions.  Returns the number of sessions removed."""
 
+    async def touch(self, session_id: str, data: dict[str, Any]) -> None:
+        """Record use of an unchanged session: refresh its TTL and touch fields.
+
+        Stores may defer this write; the default persists it immediately.
+        """
+        await self.set(session_id, data)
+
+    async def flush(self) -> int:
+        """Write deferred touches.  Returns the number of sessions written."""
+        return 0
+
+
+@dataclass
+class CachedSession:
+    data: str  # decrypted JSON payload
+    touch: dict[str, Any]
+    version: int
+    expires_at: datetime
+
+    def session_data(self) -> dict[str, Any]:
+        # Parsed on every call: callers mutate the returned dict.
+        return {**json.loads(self.data), **self.touch}
+
+
+class SessionCache:
+    """Bounded LRU cache of decrypted sessions, keyed by session ID.
+
+    Entries carry the ``http_sessions.version`` they were read at, so the
+    store can check a whole batch of them against the database at once.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CachedSession] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, session_id: str) -> CachedSession | None:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        if entry.expires_at < datetime.now(UTC):
+            del self._entries[session_id]
+            return None
+        self._entries.move_to_end(session_id)
+        return entry
+
+    def put(self, session_id: str, entry: CachedSession) -> None:
+        self._entries[session_id] = entry
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, session_id: str) -> None:
+        self._entries.pop(session_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def versions(self) -> dict[str, int]:
+        return {sid: entry.version for sid, entry in self._entries.items()}
+
 
 class DatabaseSessionStore(SessionStore):
     """Database-backed session store.
 
     Sessions survive backend restarts and work across replicas.
     Uses the ``http_sessions`` table.
+
+    Reads are served from a per-process :class:`SessionCache` when possible.
+    Writes and deletes in this process update the cache directly and send
+    a ``NOTIFY`` on :data:`SESSION_CHANNEL` with the commit; other replicas
+    drop the entry when :func:`run_invalidation_listener` delivers it.
+    While no listener is connected, a cached session is only served after
+    its row version has been confirmed, so a logout or rotation elsewhere
+    is never missed.  As a safety net, all cached sessions are also
+    compared with their rows at most every *cache_check_seconds*.
+    Touches only bump the version when they come with a payload change, so
+    another replica may briefly see older touch fields.
+
+    :meth:`touch` only queues the new expiry and touch fields; :meth:`flush`
+    writes everything queued in one statement.
     """
 
     def __init__(
@@ -79,16 +185,89 @@ class DatabaseSessionStore(SessionStore):
         session_factory: async_sessionmaker[AsyncSession],
         ttl_seconds: int = 3600,
         encryption_key: str = "",
+        cache_size: int = 1024,
+        cache_check_seconds: float = 2.0,
     ) -> None:
         self._session_factory = session_factory
         self._ttl = ttl_seconds
         self._fernet: Fernet | None = None
         if encryption_key:
             self._fernet = Fernet(_derive_fernet_key(encryption_key))
+        self._cache = SessionCache(cache_size) if cache_size > 0 else None
+        self._cache_check_seconds = cache_check_seconds
+        self._cache_checked_at = time.monotonic()
+        self._pending_touches: dict[str, tuple[dict[str, Any], datetime]] = {}
+        # Tags this process's own notifications, which need no handling.
+        self._origin = uuid.uuid4().hex
+        self.listening = False
+
+    def set_listening(self, listening: bool) -> None:
+        """Record whether invalidations are being received.
+
+        Notifications sent while no listener was connected are lost, so
+        the cache starts empty whenever listening (re)starts.
+        """
+        if listening and self._cache is not None:
+            self._cache.clear()
+        self.listening = listening
+
+    def handle_notification(self, payload: str) -> None:
+        """Drop the session named in a :data:`SESSION_CHANNEL` payload."""
+        origin, _, session_id = payload.partition(" ")
+        if origin != self._origin and self._cache is not None:
+            self._cache.discard(session_id)
+
+    async def _notify(self, db: AsyncSession, session_id: str) -> None:
+        # Delivered on commit, and not at all if the transaction rolls back.
+        await db.execute(
+            select(func.pg_notify(SESSION_CHANNEL, f"{self._origin} {session_id}"))
+        )
+
+    async def _current_version(self, session_id: str) -> int | None:
+        from bouwmeester.models.http_session import HttpSession
+
+        async with self._session_factory() as db:
+            result = await db.execute(
+                select(HttpSession.version).where(HttpSession.session_id == session_id)
+            )
+            return result.scalar_one_or_none()
+
+    async def _revalidate_cache(self) -> None:
+        """Drop cached sessions that another replica changed or deleted."""
+        from bouwmeester.models.http_session import HttpSession
+
+        if self._cache is None or not self._cache:
+            return
+        now = time.monotonic()
+        if now - self._cache_checked_at < self._cache_check_seconds:
+            return
+        self._cache_checked_at = now
+        cached = self._cache.versions()
+        async with self._session_factory() as db:
+            result = await db.execute(
+                select(HttpSession.session_id, HttpSession.version).where(
+                    HttpSession.session_id.in_(cached)
+                )
+            )
+            current = dict(result.all())
+        for session_id, version in cached.items():
+            if current.get(session_id) != version:
+                self._cache.discard(session_id)
 
     async def get(self, session_id: str) -> dict[str, Any] | None:
         from bouwmeester.models.http_session import HttpSession
 
+        if self._cache is not None:
+            await self._revalidate_cache()
+            entry = self._cache.get(session_id)
+            if entry is not None and not self.listening:
+                # Nothing pushes invalidations to this process right now.
+                if await self._current_version(session_id) != entry.version:
+                    self._cache.discard(session_id)
+                    entry = None
+            if entry is not None:
+                return entry.session_data()
+
         async with self._session_factory() as db:
             stmt = select(HttpSession).where(HttpSession.session_id == session_id)
             result = await db.execute(stmt)
@@ -108,14 +287,21 @@ class DatabaseSessionStore(SessionStore):
                     await db.delete(row)
                     await db.commit()
                     return None
-            return json.loads(raw)
+            entry = CachedSession(raw, dict(row.touch), row.version, row.expires_at)
+            if self._cache is not None:
+                self._cache.put(session_id, entry)
+            return entry.session_data()
 
     async def set(self, session_id: str, data: dict[str, Any]) -> None:
         from bouwmeester.models.http_session import HttpSession
 
+        # A full write supersedes any queued touch.
+        self._pending_touches.pop(session_id, None)
+        payload, touch = split_touch_fields(data)
         async with self._session_factory() as db:
             expires_at = datetime.now(UTC) + timedelta(seconds=self._ttl)
-            data_json = json.dumps(data)
+            plain_json = json.dumps(payload)
+            data_json = plain_json
             if self._fernet:
                 data_json = self._fernet.encrypt(data_json.encode()).decode()
             stmt = (
@@ -123,22 +309,87 @@ class DatabaseSessionStore(SessionStore):
                 .values(
                     session_id=session_id,
                     data=data_json,
+                    touch=touch,
                     expires_at=expires_at,
+                    version=1,
                 )
                 .on_conflict_do_update(
                     index_elements=["session_id"],
-                    set_={"data": data_json, "expires_at": expires_at},
+                    set_={
+                        "data": data_json,
+                        "touch": touch,
+                        "expires_at": expires_at,
+                        "version": HttpSession.version + 1,
+                    },
                 )
+                .returning(HttpSession.version)
             )
-            await db.execute(stmt)
+            result = await db.execute(stmt)
+            version = result.scalar_one()
+            await self._notify(db, session_id)
             await db.commit()
+        if self._cache is not None:
+            self._cache.put(
+                session_id, CachedSession(plain_json, touch, version, expires_at)
+            )
+
+    async def touch(self, session_id: str, data: dict[str, Any]) -> None:
+        _payload, touch = split_touch_fields(data)
+        expires_at = datetime.now(UTC) + timedelta(seconds=self._ttl)
+        self._pending_touches[session_id] = (touch, expires_at)
+        if self._cache is not None:
+            entry = self._cache.get(session_id)
+            if entry is not None:
+                entry.touch = touch
+                entry.expires_at = expires_at
+
+    async def flush(self) -> int:
+        if not self._pending_touches:
+            return 0
+        pending, self._pending_touches = self._pending_touches, {}
+        # Merge per key, keeping the later timestamp: another replica may
+        # have flushed a newer touch for the same session in the meantime.
+        stmt = text("""
+            UPDATE http_sessions AS s
+            SET touch = s.touch || coalesce((
+                    SELECT jsonb_object_agg(n.key, greatest(n.value, s.touch -> n.key))
+                    FROM jsonb_each(t.touch::jsonb) AS n
+                ), '{}'::jsonb),
+                expires_at = greatest(s.expires_at, t.expires_at)
+            FROM unnest(
+                CAST(:session_ids AS text[]),
+                CAST(:touches AS text[]),
+                CAST(:expiries AS timestamptz[])
+            ) AS t(session_id, touch, expires_at)
+            WHERE s.session_id = t.session_id
+        """)
+        params = {
+            "session_ids": list(pending),
+            "touches": [json.dumps(touch) for touch, _ in pending.values()],
+            "expiries": [expires_at for _, expires_at in pending.values()],
+        }
+        try:
+            async with self._session_factory() as db:
+                await db.execute(stmt, params)
+                await db.commit()
+        except Exception:
+            # Keep the touches for the next attempt, unless newer ones
+            # arrived meanwhile.
+            for session_id, value in pending.items():
+                self._pending_touches.setdefault(session_id, value)
+            raise
+        return len(pending)
 
     async def delete(self, session_id: str) -> None:
         from bouwmeester.models.http_session import HttpSession
 
+        self._pending_touches.pop(session_id, None)
+        if self._cache is not None:
+            self._cache.discard(session_id)
         async with self._session_factory() as db:
             stmt = delete(HttpSession).where(HttpSession.session_id == session_id)
             await db.execute(stmt)
+            await self._notify(db, session_id)
             await db.commit()
 
     async def cleanup(self) -> int:
@@ -159,6 +410,52 @@ class DatabaseSessionStore(SessionStore):
         return count
 
 
+async def run_flush_loop(
+    store: SessionStore,
+    interval_seconds: float = 30.0,
+) -> None:
+    """Background task that periodically writes deferred session touches."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await store.flush()
+        except Exception:
+            logger.exception("Session touch flush failed")
+
+
+async def run_invalidation_listener(
+    store: DatabaseSessionStore,
+    engine: AsyncEngine,
+    retry_seconds: float = 5.0,
+) -> None:
+    """Background task that LISTENs for session changes made elsewhere.
+
+    Holds one dedicated connection; when it drops, the store falls back to
+    confirming versions on every read until the listener reconnects.
+    """
+    while True:
+        try:
+            async with engine.connect() as conn:
+                raw = await conn.get_raw_connection()
+                pg = raw.driver_connection
+                lost = asyncio.Event()
+
+                def on_notify(_conn, _pid, _channel, payload: str) -> None:
+                    store.handle_notification(payload)
+
+                pg.add_termination_listener(lambda _conn: lost.set())
+                await pg.add_listener(SESSION_CHANNEL, on_notify)
+                store.set_listening(True)
+                try:
+                    await lost.wait()
+                finally:
+                    store.set_listening(False)
+            logger.warning("Session invalidation listener disconnected")
+        except Exception:
+            logger.exception("Session invalidation listener failed")
+        await asyncio.sleep(retry_seconds)
+
+
 async def run_cleanup_loop(
     store: SessionStore,
     interval_seconds: int = 300,
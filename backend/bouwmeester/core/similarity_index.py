@@ -0,0 +1,221 @@
+"""In-memory TF-IDF index for "more like this" over corpus nodes.
+
+Related-node suggestions must not send policy text to an external LLM,
+so similarity is computed locally: every node is a sparse TF-IDF vector
+and :meth:`SimilarityIndex.similar` returns the top-k by cosine
+similarity, scoring only the nodes that share a term with the query node
+(via inverted postings).
+
+Terms come straight from ``search_document.search_vector``, so they are
+the Dutch-stemmed, stop-word-free lexemes full-text search already uses.
+Title lexemes (weight ``A``) count double.
+
+Like :mod:`~bouwmeester.core.mention_index`, the index is refreshed at
+most every ``SIMILARITY_INDEX_CHECK_SECONDS``: nodes whose
+``search_document`` row changed since the last check are re-read, and a
+row-count mismatch (deletions) triggers a full rebuild.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+from collections.abc import Iterable
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Float, func, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bouwmeester.core.document_feed import DocumentFeed
+from bouwmeester.models.search_document import SearchDocument
+
+logger = logging.getLogger(__name__)
+
+# Terms in more than this share of the documents carry almost no signal
+# but would make every node a candidate; they are skipped when scoring
+# (only once the corpus is large enough for frequencies to mean much).
+_MAX_DOC_FREQUENCY = 0.5
+_MIN_DOCS_FOR_CUTOFF = 20
+
+_TITLE_WEIGHT = 2.0
+
+TermCounts = dict[str, float]
+
+
+class SimilarityIndex:
+    """Sparse TF-IDF vectors with inverted postings.
+
+    Raw term counts are stored per document; IDF weights and vector norms
+    are derived on demand and cached until the document set changes, so
+    adding or updating one node is cheap.
+    """
+
+    def __init__(self, docs: Iterable[tuple[UUID, TermCounts]] = ()) -> None:
+        self._docs: dict[UUID, TermCounts] = {}
+        self._postings: dict[str, set[UUID]] = {}
+        self._norms: dict[UUID, float] = {}
+        for doc_id, counts in docs:
+            self.upsert(doc_id, counts)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._docs
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def upsert(self, doc_id: UUID, counts: TermCounts) -> None:
+        if self._docs.get(doc_id) == counts:
+            return
+        self.remove(doc_id)
+        self._docs[doc_id] = counts
+        for term in counts:
+            self._postings.setdefault(term, set()).add(doc_id)
+        self._norms.clear()
+
+    def remove(self, doc_id: UUID) -> None:
+        counts = self._docs.pop(doc_id, None)
+        if counts is None:
+            return
+        for term in counts:
+            postings = self._postings[term]
+            postings.discard(doc_id)
+            if not postings:
+                del self._postings[term]
+        self._norms.clear()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def similar(
+        self,
+        doc_id: UUID,
+        limit: int = 10,
+        *,
+        exclude: set[UUID] | None = None,
+    ) -> list[tuple[UUID, float]]:
+        """Top *limit* ``(node_id, cosine)`` pairs most similar to *doc_id*."""
+        counts = self._docs.get(doc_id)
+        if not counts:
+            return []
+        max_df = len(self._docs)
+        if max_df >= _MIN_DOCS_FOR_CUTOFF:
+            max_df = int(max_df * _MAX_DOC_FREQUENCY)
+        query = self._weights(counts)
+        query_norm = self._norm(doc_id)
+        if not query_norm:
+            return []
+
+        dots: dict[UUID, float] = {}
+        for term, weight in query.items():
+            postings = self._postings[term]
+            if len(postings) > max_df:
+                continue
+            idf = self._idf(term)
+            for other in postings:
+                tf = self._tf(self._docs[other][term])
+                dots[other] = dots.get(other, 0.0) + weight * tf * idf
+        dots.pop(doc_id, None)
+        for other in exclude or ():
+            dots.pop(other, None)
+
+        scored = (
+            (dot / (query_norm * self._norm(other)), other)
+            for other, dot in dots.items()
+        )
+        return [
+            (other, score)
+            for score, other in heapq.nlargest(limit, scored, key=lambda s: s[0])
+        ]
+
+    # ------------------------------------------------------------------
+    # Weighting
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _tf(count: float) -> float:
+        return 1.0 + math.log(count)
+
+    def _idf(self, term: str) -> float:
+        return math.log((len(self._docs) + 1) / (len(self._postings[term]) + 1)) + 1
+
+    def _weights(self, counts: TermCounts) -> dict[str, float]:
+        return {t: self._tf(c) * self._idf(t) for t, c in counts.items()}
+
+    def _norm(self, doc_id: UUID) -> float:
+        norm = self._norms.get(doc_id)
+        if norm is None:
+            weights = self._weights(self._docs[doc_id])
+            norm = math.sqrt(sum(w * w for w in weights.values()))
+            self._norms[doc_id] = norm
+        return norm
+
+
+# ---------------------------------------------------------------------------
+# Process-wide cache
+# ---------------------------------------------------------------------------
+
+_index: SimilarityIndex | None = None
+# Nodes without any lexeme have no vector and are not followed.
+_feed = DocumentFeed(
+    SearchDocument.entity_type == "corpus_node",
+    func.length(SearchDocument.search_vector) > 0,
+    interval_setting="SIMILARITY_INDEX_CHECK_SECONDS",
+)
+
+
+async def _load(
+    session: AsyncSession, since: datetime | None = None
+) -> dict[UUID, TermCounts]:
+    """Term counts per node from the stored tsvectors, in one query."""
+    lexemes = func.unnest(SearchDocument.search_vector).table_valued(
+        "lexeme", "positions", "weights"
+    )
+    # Title positions (weight A) count double.
+    title_positions = func.cardinality(
+        func.array_positions(lexemes.c.weights, "A")
+    ).cast(Float)
+    count = func.cardinality(lexemes.c.positions).cast(Float) + title_positions * (
+        _TITLE_WEIGHT - 1
+    )
+    stmt = _feed.select(
+        SearchDocument.entity_id, lexemes.c.lexeme, count, since=since
+    ).join(lexemes, true())
+
+    docs: dict[UUID, TermCounts] = {}
+    for node_id, lexeme, term_count in await session.execute(stmt):
+        docs.setdefault(node_id, {})[lexeme] = term_count
+    return docs
+
+
+async def get_similarity_index(session: AsyncSession) -> SimilarityIndex:
+    """Return the process-wide similarity index, refreshing it when due."""
+    global _index  # noqa: PLW0603
+
+    if _index is not None and not _feed.due():
+        return _index
+
+    count, latest = await _feed.poll(session)
+    since = _feed.changed_since(latest)
+    if _index is not None and since is not None:
+        for node_id, counts in (await _load(session, since=since)).items():
+            _index.upsert(node_id, counts)
+    if _index is None or len(_index) != count:
+        _index = SimilarityIndex((await _load(session)).items())
+        logger.debug("Similarity index rebuilt (%d nodes)", len(_index))
+    _feed.mark(latest)
+    return _index
+
+
+def reset_similarity_index() -> None:
+    """Drop the cached index (useful for testing)."""
+    global _index  # noqa: PLW0603
+
+    _index = None
+    _feed.reset()
@@ -103,72 +103,58 @@ class AuthRequiredMiddleware:
         On success, stores the matched person's UUID in
         ``scope["_api_key_person_id"]`` so downstream dependencies can
         load the Person by PK instead of re-hashing the key.
+
+        Resolved keys are cached briefly (see ``core/api_key``), so repeat
+        calls with the same key need no database session at all.
         """
-        from bouwmeester.core.api_key import hash_api_key
+        from bouwmeester.core.api_key import (
+            cache_identity,
+            get_cached_identity,
+            hash_api_key,
+        )
         from bouwmeester.core.database import async_session
         from bouwmeester.models.person import Person
 
         key_hash = hash_api_key(token)
-        try:
-            from sqlalchemy import select
-
-            async with async_session() as session:
-                stmt = select(Person.id).where(
-                    Person.api_key_hash == key_hash,
-                    Person.is_active == True,  # noqa: E712
-                    Person.is_agent == True,  # noqa: E712
-                )
-                result = await session.execute(stmt)
-                person_id = result.scalar_one_or_none()
-                if person_id is not None:
-                    scope["_api_key_person_id"] = person_id
-                    return True
+        identity = get_cached_identity(key_hash)
+        if identity is None:
+            try:
+                from sqlalchemy import select
+
+                async with async_session() as session:
+                    stmt = select(Person.id, Person.is_active, Person.is_agent).where(
+                        Person.api_key_hash == key_hash
+                    )
+                    result = await session.execute(stmt)
+                    row = result.one_or_none()
+            except (SQLAlchemyError, OSError):
+                logger.exception("API key validation failed")
                 return False
-        except (SQLAlchemyError, OSError):
-            logger.exception("API key validation failed")
+            if row is None:
+                return False
+            identity = (row.id, row.is_active and row.is_agent)
+            cache_identity(key_hash, *identity)
+
+        person_id, usable = identity
+        if not usable:
             return False
+        scope["_api_key_person_id"] = person_id
+        return True
 
     async def _validate_bearer(self, token: str) -> bool:
         """Validate a Bearer token using the shared auth helpers.
 
         Tries local JWT validation first (no network call), then falls back
-        to the OIDC userinfo endpoint with HTTPS enforcement.
+        to the OIDC userinfo endpoint with HTTPS enforcement.  Results are
+        cached per token, so repeat calls skip both steps.
         """
         if not self.settings:
             return False
 
-        from bouwmeester.core.auth import (
-            get_http_client,
-            get_jwks,
-            get_oidc_metadata,
-            require_https,
-            validate_jwt_locally,
-        )
-
-        # 1. Try local JWT validation (fast, no network).
-        jwks = await get_jwks(self.settings)
-        if jwks:
-            claims = validate_jwt_locally(token, jwks, self.settings)
-            if claims:
-                return True
-
-        # 2. Fall back to userinfo endpoint.
-        metadata = await get_oidc_metadata(self.settings)
-        if not metadata:
-            return False
-        userinfo_url = metadata.get("userinfo_endpoint")
-        if not userinfo_url:
-            return False
-        if not require_https(userinfo_url, "Userinfo endpoint"):
-            return False
+        from bouwmeester.core.auth import validate_bearer_token
 
-        client = get_http_client()
         try:
-            resp = await client.get(
-                userinfo_url,
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            return resp.status_code == 200
+            return await validate_bearer_token(token, self.settings) is not None
         except httpx.HTTPError:
             return False
 
@@ -3,7 +3,9 @@
 Reads a signed session-ID cookie from the request, loads session data from the
 :class:`~bouwmeester.core.session_store.SessionStore`, and exposes it via
 ``request.session``.  On the way out it persists any changes and
-sets/clears the cookie.
+sets/clears the cookie.  Requests that only change touch fields (see
+:data:`~bouwmeester.core.session_store.TOUCH_FIELDS`), or nothing at all,
+are recorded with :meth:`SessionStore.touch` instead of a full write.
 
 The cookie itself only contains a random, signed session ID -- all actual data
 lives in the server-side store.
@@ -20,7 +22,7 @@ from starlette.datastructures import MutableHeaders
 from starlette.requests import HTTPConnection
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from bouwmeester.core.session_store import SessionStore
+from bouwmeester.core.session_store import SessionStore, split_touch_fields
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +92,7 @@ class ServerSideSessionMiddleware:
                 session_id = None
 
         scope["session"] = session_data
-        initial_data = dict(session_data)
+        initial_payload, _ = split_touch_fields(session_data)
 
         async def send_wrapper(message: Message) -> None:
             if message["type"] == "http.response.start":
@@ -110,10 +112,14 @@ class ServerSideSessionMiddleware:
                         session_id = None
 
                     if current_data:
-                        if session_id is None:
+                        is_new = session_id is None
+                        if is_new:
                             session_id = secrets.token_urlsafe(32)
-                        if current_data != initial_data or needs_rotation:
+                        payload, _ = split_touch_fields(current_data)
+                        if is_new or needs_rotation or payload != initial_payload:
                             await self.store.set(session_id, current_data)
+                        else:
+                            await self.store.touch(session_id, current_data)
                         signed = self.signer.sign(session_id).decode("utf-8")
                         headers.append(
                             "set-cookie",
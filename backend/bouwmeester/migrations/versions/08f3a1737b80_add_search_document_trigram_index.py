@@ -0,0 +1,41 @@
+"""add search_document trigram index
+
+Revision ID: 08f3a1737b80
+Revises: ed6be9159817
+Create Date: 2026-10-16 21:51:02.411390
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "08f3a1737b80"
+down_revision: str | None = "ed6be9159817"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # pg_trgm ships with the contrib package; without it search falls back
+    # to ILIKE on titles (see SearchRepository), so skip rather than fail.
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'
+            ) THEN
+                CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                CREATE INDEX IF NOT EXISTS ix_search_document_title_trgm
+                ON search_document USING GIN (title gin_trgm_ops);
+            ELSE
+                RAISE NOTICE 'pg_trgm not available, skipping trigram index';
+            END IF;
+        END
+        $$
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_search_document_title_trgm")
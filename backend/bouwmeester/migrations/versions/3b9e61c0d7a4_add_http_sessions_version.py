@@ -0,0 +1,27 @@
+"""add http_sessions version
+
+Revision ID: 3b9e61c0d7a4
+Revises: fa4d299d592f
+Create Date: 2026-10-16 22:41:37.108254
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9e61c0d7a4"
+down_revision: str | None = "fa4d299d592f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE http_sessions ADD COLUMN version integer NOT NULL DEFAULT 1"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE http_sessions DROP COLUMN version")
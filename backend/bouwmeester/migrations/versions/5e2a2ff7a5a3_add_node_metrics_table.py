@@ -0,0 +1,54 @@
+"""add node_metrics table
+
+Revision ID: 5e2a2ff7a5a3
+Revises: 76f60edf7c9c
+Create Date: 2026-10-16 20:24:04.568147
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2a2ff7a5a3"
+down_revision: str | None = "76f60edf7c9c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "node_metrics",
+        sa.Column("node_id", sa.UUID(), nullable=False),
+        sa.Column("degree", sa.Integer(), nullable=False),
+        sa.Column("in_degree", sa.Integer(), nullable=False),
+        sa.Column("out_degree", sa.Integer(), nullable=False),
+        sa.Column("pagerank", sa.Float(), nullable=False),
+        sa.Column("betweenness", sa.Float(), nullable=False),
+        sa.Column("component_id", sa.Integer(), nullable=False),
+        sa.Column("component_size", sa.Integer(), nullable=False),
+        sa.Column("is_orphan", sa.Boolean(), nullable=False),
+        sa.Column(
+            "computed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["node_id"], ["corpus_node.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("node_id"),
+    )
+    for column in ("degree", "pagerank", "betweenness", "component_id", "is_orphan"):
+        op.create_index(
+            op.f(f"ix_node_metrics_{column}"),
+            "node_metrics",
+            [column],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    for column in ("degree", "pagerank", "betweenness", "component_id", "is_orphan"):
+        op.drop_index(op.f(f"ix_node_metrics_{column}"), table_name="node_metrics")
+    op.drop_table("node_metrics")
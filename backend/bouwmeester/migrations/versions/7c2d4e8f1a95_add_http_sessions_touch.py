@@ -0,0 +1,25 @@
+"""add http_sessions touch
+
+Revision ID: 7c2d4e8f1a95
+Revises: 3b9e61c0d7a4
+Create Date: 2026-10-16 23:02:51.447310
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2d4e8f1a95"
+down_revision: str | None = "3b9e61c0d7a4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE http_sessions ADD COLUMN touch jsonb NOT NULL DEFAULT '{}'")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE http_sessions DROP COLUMN touch")
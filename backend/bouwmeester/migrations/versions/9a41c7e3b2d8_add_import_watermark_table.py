@@ -0,0 +1,43 @@
+"""add import_watermark table
+
+Revision ID: 9a41c7e3b2d8
+Revises: 7c2d4e8f1a95
+Create Date: 2026-10-16 23:31:08.902117
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a41c7e3b2d8"
+down_revision: str | None = "7c2d4e8f1a95"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "import_watermark",
+        sa.Column("item_type", sa.String(), nullable=False),
+        sa.Column(
+            "bron",
+            sa.String(),
+            nullable=False,
+            comment="tweede_kamer|eerste_kamer",
+        ),
+        sa.Column("gewijzigd_op", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("item_type", "bron"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("import_watermark")
@@ -0,0 +1,55 @@
+"""add llm_cache table
+
+Revision ID: b5d83f2a6c17
+Revises: 9a41c7e3b2d8
+Create Date: 2026-10-17 00:12:44.518302
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d83f2a6c17"
+down_revision: str | None = "9a41c7e3b2d8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_cache",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("operation", sa.String(), nullable=False),
+        sa.Column("model", sa.String(), nullable=False),
+        sa.Column("response", sa.Text(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "last_used_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(
+        op.f("ix_llm_cache_last_used_at"), "llm_cache", ["last_used_at"], unique=False
+    )
+    op.create_index(
+        op.f("ix_llm_cache_expires_at"), "llm_cache", ["expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_llm_cache_expires_at"), table_name="llm_cache")
+    op.drop_index(op.f("ix_llm_cache_last_used_at"), table_name="llm_cache")
+    op.drop_table("llm_cache")
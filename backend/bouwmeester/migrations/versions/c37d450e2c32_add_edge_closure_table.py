@@ -0,0 +1,82 @@
+"""add edge_closure table
+
+Revision ID: c37d450e2c32
+Revises: 5e2a2ff7a5a3
+Create Date: 2026-10-16 20:28:48.704889
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c37d450e2c32"
+down_revision: str | None = "5e2a2ff7a5a3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+HIERARCHICAL_EDGE_TYPES = (
+    "onderdeel_van",
+    "implementeert",
+    "vloeit_voort_uit",
+    "draagt_bij_aan",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "edge_closure",
+        sa.Column("ancestor_id", sa.UUID(), nullable=False),
+        sa.Column("edge_type_id", sa.String(), nullable=False),
+        sa.Column("descendant_id", sa.UUID(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["ancestor_id"], ["corpus_node.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["descendant_id"], ["corpus_node.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["edge_type_id"], ["edge_type.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("ancestor_id", "edge_type_id", "descendant_id"),
+    )
+    op.create_index(
+        "ix_edge_closure_descendant",
+        "edge_closure",
+        ["descendant_id", "edge_type_id", "depth"],
+        unique=False,
+    )
+
+    # Initial fill for the default hierarchical types; the path array
+    # guards against cycles.  The worker rebuilds on start-up anyway.
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO edge_closure (ancestor_id, edge_type_id, descendant_id, depth)
+            WITH RECURSIVE reach(descendant_id, edge_type_id, ancestor_id, depth, path)
+            AS (
+                SELECT from_node_id, edge_type_id, to_node_id, 1,
+                       ARRAY[from_node_id, to_node_id]
+                FROM edge
+                WHERE edge_type_id = ANY(:types) AND from_node_id <> to_node_id
+                UNION ALL
+                SELECT r.descendant_id, r.edge_type_id, e.to_node_id, r.depth + 1,
+                       r.path || e.to_node_id
+                FROM reach r
+                JOIN edge e
+                  ON e.from_node_id = r.ancestor_id
+                 AND e.edge_type_id = r.edge_type_id
+                WHERE NOT e.to_node_id = ANY(r.path)
+            )
+            SELECT ancestor_id, edge_type_id, descendant_id, min(depth)
+            FROM reach
+            GROUP BY ancestor_id, edge_type_id, descendant_id
+            """
+        ).bindparams(types=list(HIERARCHICAL_EDGE_TYPES))
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_edge_closure_descendant", table_name="edge_closure")
+    op.drop_table("edge_closure")
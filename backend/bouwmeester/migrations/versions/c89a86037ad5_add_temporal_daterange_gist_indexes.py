@@ -0,0 +1,38 @@
+"""add temporal daterange gist indexes
+
+Revision ID: c89a86037ad5
+Revises: c37d450e2c32
+Create Date: 2026-10-16 20:52:11.203114
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c89a86037ad5"
+down_revision: str | None = "c37d450e2c32"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# The expression must match bouwmeester.repositories.temporal.valid_on.
+_INDEXES = [
+    ("ix_corpus_node_geldig_range", "corpus_node"),
+    ("ix_corpus_node_title_geldig_range", "corpus_node_title"),
+    ("ix_corpus_node_status_geldig_range", "corpus_node_status"),
+]
+
+
+def upgrade() -> None:
+    for name, table in _INDEXES:
+        op.execute(
+            f"CREATE INDEX {name} ON {table} "
+            "USING gist "
+            "(daterange(least(geldig_van, geldig_tot), geldig_tot, '[)'))"
+        )
+
+
+def downgrade() -> None:
+    for name, table in _INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,31 @@
+"""add edge.updated_at
+
+Revision ID: e3a9c1f07d42
+Revises: b5d83f2a6c17
+Create Date: 2026-10-17 09:12:44.318205
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a9c1f07d42"
+down_revision: str | None = "b5d83f2a6c17"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "edge",
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(op.f("ix_edge_updated_at"), "edge", ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_edge_updated_at"), table_name="edge")
+    op.drop_column("edge", "updated_at")
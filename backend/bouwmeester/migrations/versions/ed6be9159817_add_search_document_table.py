@@ -0,0 +1,130 @@
+"""add search_document table
+
+Revision ID: ed6be9159817
+Revises: c89a86037ad5
+Create Date: 2026-10-16 21:24:40.118532
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ed6be9159817"
+down_revision: str | None = "c89a86037ad5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, title column, subtitle column, body column, body is TipTap JSON)
+_SOURCES = [
+    ("corpus_node", "title", "node_type", "description", True),
+    ("task", "title", "status", "description", True),
+    ("person", "naam", "functie", "email", False),
+    ("organisatie_eenheid", "naam", "type", "beschrijving", False),
+    ("parlementair_item", "titel", "type", "onderwerp", False),
+    ("tag", "name", None, "description", False),
+]
+
+# Per-table GIN indexes superseded by ix_search_document_search.
+_OLD_INDEXES = [
+    ("ix_corpus_node_search", "corpus_node"),
+    ("ix_task_search", "task"),
+    ("ix_person_search", "person"),
+    ("ix_org_eenheid_search", "organisatie_eenheid"),
+    ("ix_parlementair_search", "parlementair_item"),
+    ("ix_tag_search", "tag"),
+]
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE search_document (
+            entity_type text NOT NULL,
+            entity_id uuid NOT NULL,
+            title text NOT NULL,
+            subtitle text,
+            body text,
+            search_vector tsvector NOT NULL,
+            PRIMARY KEY (entity_type, entity_id)
+        )
+    """)
+    op.execute("""
+        CREATE INDEX ix_search_document_search
+        ON search_document USING GIN (search_vector)
+    """)
+
+    # One generic AFTER trigger per source table.  AFTER (not BEFORE) so
+    # the generated search_vector column of the source row is available;
+    # the column names are passed as trigger arguments.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION search_document_sync()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            r jsonb;
+            body text;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                DELETE FROM search_document
+                WHERE entity_type = TG_ARGV[0] AND entity_id = OLD.id;
+                RETURN OLD;
+            END IF;
+
+            r := to_jsonb(NEW);
+            body := r->>TG_ARGV[3];
+            IF TG_ARGV[4] = 'tiptap' THEN
+                body := tiptap_to_plain(body);
+            END IF;
+
+            INSERT INTO search_document
+                (entity_type, entity_id, title, subtitle, body, search_vector)
+            VALUES (
+                TG_ARGV[0],
+                NEW.id,
+                coalesce(r->>TG_ARGV[1], ''),
+                r->>TG_ARGV[2],
+                nullif(body, ''),
+                NEW.search_vector
+            )
+            ON CONFLICT (entity_type, entity_id) DO UPDATE SET
+                title = EXCLUDED.title,
+                subtitle = EXCLUDED.subtitle,
+                body = EXCLUDED.body,
+                search_vector = EXCLUDED.search_vector;
+            RETURN NEW;
+        END;
+        $$
+    """)
+
+    for table, title, subtitle, body, tiptap in _SOURCES:
+        body_sql = f"tiptap_to_plain({body})" if tiptap else body
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_search_document
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION search_document_sync(
+                '{table}', '{title}', '{subtitle or ""}', '{body}',
+                '{"tiptap" if tiptap else "plain"}'
+            )
+        """)
+        op.execute(f"""
+            INSERT INTO search_document
+                (entity_type, entity_id, title, subtitle, body, search_vector)
+            SELECT '{table}', id, coalesce({title}, ''),
+                   {subtitle or "NULL"}::text, nullif({body_sql}, ''),
+                   search_vector
+            FROM {table}
+        """)
+
+    for name, _table in _OLD_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    for name, table in _OLD_INDEXES:
+        op.execute(f"CREATE INDEX {name} ON {table} USING GIN (search_vector)")
+    for table, *_rest in _SOURCES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_search_document ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS search_document_sync()")
+    op.execute("DROP TABLE IF EXISTS search_document")
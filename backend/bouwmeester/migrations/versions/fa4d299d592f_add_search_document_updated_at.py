@@ -0,0 +1,77 @@
+"""add search_document updated_at
+
+Revision ID: fa4d299d592f
+Revises: 08f3a1737b80
+Create Date: 2026-10-16 22:20:14.571962
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "fa4d299d592f"
+down_revision: str | None = "08f3a1737b80"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# search_document_sync() from ed6be9159817; {extra_set} adds the
+# updated_at bump to the ON CONFLICT branch.
+_SYNC_FUNCTION = """
+    CREATE OR REPLACE FUNCTION search_document_sync()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        r jsonb;
+        body text;
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            DELETE FROM search_document
+            WHERE entity_type = TG_ARGV[0] AND entity_id = OLD.id;
+            RETURN OLD;
+        END IF;
+
+        r := to_jsonb(NEW);
+        body := r->>TG_ARGV[3];
+        IF TG_ARGV[4] = 'tiptap' THEN
+            body := tiptap_to_plain(body);
+        END IF;
+
+        INSERT INTO search_document
+            (entity_type, entity_id, title, subtitle, body, search_vector)
+        VALUES (
+            TG_ARGV[0],
+            NEW.id,
+            coalesce(r->>TG_ARGV[1], ''),
+            r->>TG_ARGV[2],
+            nullif(body, ''),
+            NEW.search_vector
+        )
+        ON CONFLICT (entity_type, entity_id) DO UPDATE SET
+            title = EXCLUDED.title,
+            subtitle = EXCLUDED.subtitle,
+            body = EXCLUDED.body,
+            search_vector = EXCLUDED.search_vector{extra_set};
+        RETURN NEW;
+    END;
+    $$
+"""
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE search_document "
+        "ADD COLUMN updated_at timestamptz NOT NULL DEFAULT now()"
+    )
+    op.execute(
+        "CREATE INDEX ix_search_document_updated_at ON search_document (updated_at)"
+    )
+    op.execute(_SYNC_FUNCTION.format(extra_set=",\n            updated_at = now()"))
+
+
+def downgrade() -> None:
+    op.execute(_SYNC_FUNCTION.format(extra_set=""))
+    op.execute("DROP INDEX IF EXISTS ix_search_document_updated_at")
+    op.execute("ALTER TABLE search_document DROP COLUMN updated_at")
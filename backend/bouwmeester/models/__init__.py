@@ -13,12 +13,16 @@ from bouwmeester.models.corpus_node import CorpusNode  # noqa: F401
 from bouwmeester.models.doel import Doel  # noqa: F401
 from bouwmeester.models.dossier import Dossier  # noqa: F401
 from bouwmeester.models.edge import Edge  # noqa: F401
+from bouwmeester.models.edge_closure import EdgeClosure  # noqa: F401
 from bouwmeester.models.edge_type import EdgeType  # noqa: F401
 from bouwmeester.models.effect import Effect  # noqa: F401
 from bouwmeester.models.http_session import HttpSession  # noqa: F401
+from bouwmeester.models.import_watermark import ImportWatermark  # noqa: F401
 from bouwmeester.models.instrument import Instrument  # noqa: F401
+from bouwmeester.models.llm_cache import LLMCacheEntry  # noqa: F401
 from bouwmeester.models.maatregel import Maatregel  # noqa: F401
 from bouwmeester.models.mention import Mention  # noqa: F401
+from bouwmeester.models.node_metrics import NodeMetrics  # noqa: F401
 from bouwmeester.models.node_stakeholder import NodeStakeholder  # noqa: F401
 from bouwmeester.models.node_status import CorpusNodeStatus  # noqa: F401
 from bouwmeester.models.node_title import CorpusNodeTitle  # noqa: F401
@@ -37,6 +41,7 @@ from bouwmeester.models.person_organisatie import PersonOrganisatieEenheid  # no
 from bouwmeester.models.person_phone import PersonPhone  # noqa: F401
 from bouwmeester.models.politieke_input import PolitiekeInput  # noqa: F401
 from bouwmeester.models.probleem import Probleem  # noqa: F401
+from bouwmeester.models.search_document import SearchDocument  # noqa: F401
 from bouwmeester.models.tag import NodeTag, Tag  # noqa: F401
 from bouwmeester.models.task import Task  # noqa: F401
 from bouwmeester.models.team import Team, TeamMember  # noqa: F401
@@ -58,13 +63,17 @@ __all__ = [
     "Doel",
     "Dossier",
     "Edge",
+    "EdgeClosure",
     "EdgeType",
     "Effect",
     "HttpSession",
+    "ImportWatermark",
     "Instrument",
+    "LLMCacheEntry",
     "Maatregel",
     "Mention",
     "ParlementairItem",
+    "NodeMetrics",
     "NodeStakeholder",
     "NodeTag",
     "Notification",
@@ -78,6 +87,7 @@ __all__ = [
     "PersonPhone",
     "PolitiekeInput",
     "Probleem",
+    "SearchDocument",
     "SuggestedEdge",
     "Tag",
     "Task",
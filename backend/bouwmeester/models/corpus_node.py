@@ -12,6 +12,7 @@ from bouwmeester.core.database import Base
 
 if TYPE_CHECKING:
     from bouwmeester.models.edge import Edge
+    from bouwmeester.models.node_metrics import NodeMetrics
     from bouwmeester.models.node_stakeholder import NodeStakeholder
     from bouwmeester.models.node_status import CorpusNodeStatus
     from bouwmeester.models.node_title import CorpusNodeTitle
@@ -83,3 +84,11 @@ class CorpusNode(Base):
         back_populates="node",
         cascade="all, delete-orphan",
     )
+    # Written only by the worker; the FK cascades on delete.  Must be
+    # eager-loaded explicitly (see CorpusNodeRepository.get_all).
+    metrics: Mapped["NodeMetrics | None"] = relationship(
+        "NodeMetrics",
+        uselist=False,
+        viewonly=True,
+        lazy="raise",
+    )
@@ -53,6 +53,9 @@ class Edge(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now(), nullable=True, index=True
+    )
 
     # Relationships
     from_node: Mapped["CorpusNode"] = relationship(
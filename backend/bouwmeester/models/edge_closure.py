@@ -0,0 +1,45 @@
+"""EdgeClosure model - transitive closure of hierarchical edge types."""
+
+import uuid
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from bouwmeester.core.database import Base
+
+
+class EdgeClosure(Base):
+    """One row per (ancestor, descendant) pair reachable via one edge type.
+
+    Edges point from child to parent (``onderdeel_van``: part -> whole), so
+    ``descendant_id`` reaches ``ancestor_id`` by following ``depth`` edges
+    of ``edge_type_id``; ``depth`` is the shortest such path.  Maintained by
+    :class:`~bouwmeester.repositories.edge_closure.EdgeClosureRepository`.
+    """
+
+    __tablename__ = "edge_closure"
+    __table_args__ = (
+        Index(
+            "ix_edge_closure_descendant",
+            "descendant_id",
+            "edge_type_id",
+            "depth",
+        ),
+    )
+
+    ancestor_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("corpus_node.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    edge_type_id: Mapped[str] = mapped_column(
+        ForeignKey("edge_type.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    descendant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("corpus_node.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    depth: Mapped[int] = mapped_column(nullable=False)
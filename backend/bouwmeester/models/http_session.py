@@ -2,7 +2,8 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, Text
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from bouwmeester.core.database import Base
@@ -13,6 +14,15 @@ class HttpSession(Base):
 
     session_id: Mapped[str] = mapped_column(String(64), primary_key=True)
     data: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    # Frequently refreshed bookkeeping fields (see ``TOUCH_FIELDS``), kept
+    # out of the encrypted payload so they can be updated in bulk.
+    touch: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, default=dict, server_default="{}"
+    )
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, index=True
     )
+    # Bumped on every write so per-process caches can spot stale copies.
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
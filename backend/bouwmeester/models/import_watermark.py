@@ -0,0 +1,29 @@
+"""High-water marks for incremental parliamentary imports."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from bouwmeester.core.database import Base
+
+
+class ImportWatermark(Base):
+    """Latest ``GewijzigdOp`` imported per item type and chamber.
+
+    The next poll only asks the API for records changed after it.
+    """
+
+    __tablename__ = "import_watermark"
+
+    item_type: Mapped[str] = mapped_column(primary_key=True)
+    bron: Mapped[str] = mapped_column(
+        primary_key=True,
+        comment="tweede_kamer|eerste_kamer",
+    )
+    gewijzigd_op: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,31 @@
+"""Precomputed graph metrics per CorpusNode, maintained by the worker."""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from bouwmeester.core.database import Base
+
+
+class NodeMetrics(Base):
+    __tablename__ = "node_metrics"
+
+    node_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("corpus_node.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    degree: Mapped[int] = mapped_column(nullable=False, index=True)
+    in_degree: Mapped[int] = mapped_column(nullable=False)
+    out_degree: Mapped[int] = mapped_column(nullable=False)
+    pagerank: Mapped[float] = mapped_column(nullable=False, index=True)
+    betweenness: Mapped[float] = mapped_column(nullable=False, index=True)
+    component_id: Mapped[int] = mapped_column(nullable=False, index=True)
+    component_size: Mapped[int] = mapped_column(nullable=False)
+    is_orphan: Mapped[bool] = mapped_column(nullable=False, index=True)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
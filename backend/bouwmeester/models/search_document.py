@@ -0,0 +1,36 @@
+"""Denormalised search row per searchable entity, kept in sync by triggers.
+
+Rows are written by the ``search_document_sync()`` trigger on each source
+table (corpus_node, task, person, organisatie_eenheid, parlementair_item,
+tag); application code only reads them.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Text, func
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from bouwmeester.core.database import Base
+
+
+class SearchDocument(Base):
+    __tablename__ = "search_document"
+    __table_args__ = (
+        Index(
+            "ix_search_document_search",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+    )
+
+    entity_type: Mapped[str] = mapped_column(Text, primary_key=True)
+    entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    subtitle: Mapped[str | None] = mapped_column(Text)
+    body: Mapped[str | None] = mapped_column(Text)
+    search_vector: Mapped[str] = mapped_column(TSVECTOR, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
@@ -7,14 +7,22 @@ Overrides BaseRepository.create() and update() to manage temporal records
 from datetime import date
 from uuid import UUID
 
-from sqlalchemy import func, select, text
-from sqlalchemy.orm import selectinload
+from sqlalchemy import func, select, union_all
+from sqlalchemy.orm import contains_eager, selectinload
 
+from bouwmeester.core.duplicate_index import check_node
 from bouwmeester.models.corpus_node import CorpusNode
 from bouwmeester.models.edge import Edge
+from bouwmeester.models.node_metrics import NodeMetrics
 from bouwmeester.models.node_status import CorpusNodeStatus
 from bouwmeester.models.node_title import CorpusNodeTitle
 from bouwmeester.repositories.base import BaseRepository
+from bouwmeester.repositories.edge_closure import EdgeClosureRepository
+from bouwmeester.repositories.temporal import (
+    edge_existed_on,
+    select_nodes_as_of,
+    valid_on,
+)
 from bouwmeester.schema.corpus_node import CorpusNodeCreate, CorpusNodeUpdate
 
 
@@ -56,6 +64,7 @@ class CorpusNodeRepository(BaseRepository[CorpusNode]):
 
         await self.session.flush()
         await self.session.refresh(node)
+        await check_node(self.session, node.id, node.title, node.description)
         return node
 
     async def update(
@@ -92,8 +101,20 @@ class CorpusNodeRepository(BaseRepository[CorpusNode]):
 
         await self.session.flush()
         await self.session.refresh(node)
+        if "title" in changes or "description" in changes:
+            await check_node(self.session, node.id, node.title, node.description)
         return node
 
+    async def delete(self, id: UUID) -> bool:
+        # Hierarchy paths running through this node disappear with it.
+        closure = EdgeClosureRepository(self.session)
+        regions = await closure.regions_for_node(id)
+        if not await super().delete(id):
+            return False
+        for region in regions:
+            await closure.repair(region)
+        return True
+
     # ------------------------------------------------------------------
     # Queries
     # ------------------------------------------------------------------
@@ -117,12 +138,33 @@ class CorpusNodeRepository(BaseRepository[CorpusNode]):
         node_type: str | None = None,
         *,
         active_only: bool = True,
+        sort_by: str | None = None,
+        orphan: bool | None = None,
+        component_id: int | None = None,
     ) -> list[CorpusNode]:
-        stmt = select(CorpusNode).offset(skip).limit(limit)
+        """List nodes with their precomputed metrics eager-loaded.
+
+        *sort_by* names a ``node_metrics`` column to sort on (descending,
+        nodes without metrics last); *orphan* and *component_id* filter on
+        the same table.
+        """
+        stmt = (
+            select(CorpusNode)
+            .outerjoin(NodeMetrics, NodeMetrics.node_id == CorpusNode.id)
+            .options(contains_eager(CorpusNode.metrics))
+            .offset(skip)
+            .limit(limit)
+        )
         if node_type is not None:
             stmt = stmt.where(CorpusNode.node_type == node_type)
         if active_only:
             stmt = stmt.where(CorpusNode.geldig_tot.is_(None))
+        if orphan is not None:
+            stmt = stmt.where(NodeMetrics.is_orphan.is_(orphan))
+        if component_id is not None:
+            stmt = stmt.where(NodeMetrics.component_id == component_id)
+        if sort_by is not None:
+            stmt = stmt.order_by(getattr(NodeMetrics, sort_by).desc().nulls_last())
         stmt = stmt.order_by(CorpusNode.created_at.desc())
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
@@ -157,58 +199,135 @@ class CorpusNodeRepository(BaseRepository[CorpusNode]):
 
         return {"node": node, "neighbors": neighbors}
 
-    async def get_graph(self, node_id: UUID, depth: int = 2) -> dict:
-        """Return a subgraph around a node using a recursive CTE for BFS traversal."""
-        # Use a recursive CTE to find all nodes within `depth` hops
-        cte_query = text(
-            """
-            WITH RECURSIVE graph_walk AS (
-                -- Base case: the starting node
-                SELECT
-                    id AS node_id,
-                    0 AS level
-                FROM corpus_node
-                WHERE id = :start_id
-
-                UNION
-
-                -- Recursive case: follow edges in both directions
-                SELECT
-                    CASE
-                        WHEN e.from_node_id = gw.node_id THEN e.to_node_id
-                        ELSE e.from_node_id
-                    END AS node_id,
-                    gw.level + 1 AS level
-                FROM graph_walk gw
-                JOIN edge e ON e.from_node_id = gw.node_id
-                             OR e.to_node_id = gw.node_id
-                WHERE gw.level < :max_depth
+    async def get_graph(
+        self,
+        node_id: UUID,
+        depth: int = 2,
+        *,
+        max_nodes: int = 500,
+        edge_types: list[str] | None = None,
+        node_types: list[str] | None = None,
+        as_of: date | None = None,
+    ) -> dict:
+        """Return a bounded subgraph around a node via frontier expansion.
+
+        Expands one level at a time, deduplicating against every node seen
+        so far, so hub nodes never produce the path explosion of a
+        recursive ``UNION`` CTE.  Neighbours are restricted by
+        *edge_types* / *node_types* (the start node is always included).
+        Expansion stops as soon as *max_nodes* is reached; per level the
+        neighbours with the most links into the frontier are kept first.
+
+        With *as_of* the subgraph is taken as it was on that date: only
+        nodes valid then (with that date's title and status, as plain rows)
+        and edges created by then.
+
+        Returns ``{"nodes", "edges", "truncated", "level_counts"}`` where
+        ``level_counts[i]`` is the number of nodes first reached at depth
+        ``i``.
+        """
+        start_stmt = select(CorpusNode.id).where(CorpusNode.id == node_id)
+        if as_of is not None:
+            start_stmt = start_stmt.where(valid_on(CorpusNode, as_of))
+        if (await self.session.execute(start_stmt)).scalar_one_or_none() is None:
+            return {"nodes": [], "edges": [], "truncated": False, "level_counts": []}
+
+        visited: list[UUID] = [node_id]
+        frontier: list[UUID] = [node_id]
+        level_counts = [1]
+        truncated = False
+
+        for _ in range(depth):
+            if not frontier:
+                break
+            remaining = max_nodes - len(visited)
+            # Ask for one extra row so we know whether the budget cut
+            # anything off.
+            new_ids = await self._expand_frontier(
+                frontier,
+                exclude=visited,
+                limit=remaining + 1,
+                edge_types=edge_types,
+                node_types=node_types,
+                as_of=as_of,
             )
-            SELECT DISTINCT node_id FROM graph_walk
-            """
-        )
-        result = await self.session.execute(
-            cte_query, {"start_id": str(node_id), "max_depth": depth}
-        )
-        node_ids = [row[0] for row in result.all()]
-
-        if not node_ids:
-            return {"nodes": [], "edges": []}
+            if len(new_ids) > remaining:
+                new_ids = new_ids[:remaining]
+                truncated = True
+            if new_ids:
+                visited.extend(new_ids)
+                level_counts.append(len(new_ids))
+            frontier = new_ids
+            if truncated:
+                break
 
         # Fetch all nodes
-        nodes_stmt = select(CorpusNode).where(CorpusNode.id.in_(node_ids))
-        nodes_result = await self.session.execute(nodes_stmt)
-        nodes = list(nodes_result.scalars().all())
+        if as_of is not None:
+            nodes_stmt = select_nodes_as_of(as_of).where(CorpusNode.id.in_(visited))
+            nodes = list((await self.session.execute(nodes_stmt)).all())
+        else:
+            nodes_stmt = select(CorpusNode).where(CorpusNode.id.in_(visited))
+            nodes_result = await self.session.execute(nodes_stmt)
+            nodes = list(nodes_result.scalars().all())
 
         # Fetch all edges between these nodes
         edges_stmt = select(Edge).where(
-            Edge.from_node_id.in_(node_ids),
-            Edge.to_node_id.in_(node_ids),
+            Edge.from_node_id.in_(visited),
+            Edge.to_node_id.in_(visited),
         )
+        if edge_types:
+            edges_stmt = edges_stmt.where(Edge.edge_type_id.in_(edge_types))
+        if as_of is not None:
+            edges_stmt = edges_stmt.where(edge_existed_on(as_of))
         edges_result = await self.session.execute(edges_stmt)
         edges = list(edges_result.scalars().all())
 
-        return {"nodes": nodes, "edges": edges}
+        return {
+            "nodes": nodes,
+            "edges": edges,
+            "truncated": truncated,
+            "level_counts": level_counts,
+        }
+
+    async def _expand_frontier(
+        self,
+        frontier: list[UUID],
+        *,
+        exclude: list[UUID],
+        limit: int,
+        edge_types: list[str] | None,
+        node_types: list[str] | None,
+        as_of: date | None = None,
+    ) -> list[UUID]:
+        """Return unseen neighbours of *frontier*, most-linked first."""
+        outgoing = select(Edge.to_node_id.label("node_id")).where(
+            Edge.from_node_id.in_(frontier)
+        )
+        incoming = select(Edge.from_node_id.label("node_id")).where(
+            Edge.to_node_id.in_(frontier)
+        )
+        if edge_types:
+            outgoing = outgoing.where(Edge.edge_type_id.in_(edge_types))
+            incoming = incoming.where(Edge.edge_type_id.in_(edge_types))
+        if as_of is not None:
+            outgoing = outgoing.where(edge_existed_on(as_of))
+            incoming = incoming.where(edge_existed_on(as_of))
+        hop = union_all(outgoing, incoming).subquery("hop")
+
+        stmt = (
+            select(CorpusNode.id)
+            .join(hop, hop.c.node_id == CorpusNode.id)
+            .where(CorpusNode.id.not_in(exclude))
+            .group_by(CorpusNode.id)
+            .order_by(func.count().desc(), CorpusNode.id)
+            .limit(limit)
+        )
+        if node_types:
+            stmt = stmt.where(CorpusNode.node_type.in_(node_types))
+        if as_of is not None:
+            stmt = stmt.where(valid_on(CorpusNode, as_of))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
 
     async def count(self, node_type: str | None = None) -> int:
         stmt = select(func.count()).select_from(CorpusNode)
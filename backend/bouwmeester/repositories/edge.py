@@ -1,17 +1,51 @@
-"""Repository for Edge CRUD."""
+"""Repository for Edge CRUD.
+
+Create, update and delete keep the ``edge_closure`` reachability table in
+step (see :class:`EdgeClosureRepository`).
+"""
 
 from uuid import UUID
 
+from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from bouwmeester.models.edge import Edge
 from bouwmeester.repositories.base import BaseRepository
+from bouwmeester.repositories.edge_closure import EdgeClosureRepository
 
 
 class EdgeRepository(BaseRepository[Edge]):
     model = Edge
 
+    async def create(self, data: BaseModel) -> Edge:
+        edge = await super().create(data)
+        await EdgeClosureRepository(self.session).add_edge(
+            edge.from_node_id, edge.to_node_id, edge.edge_type_id
+        )
+        return edge
+
+    async def update(self, id: UUID, data: BaseModel) -> Edge | None:
+        edge = await self.session.get(Edge, id)
+        old_type = edge.edge_type_id if edge is not None else None
+        edge = await super().update(id, data)
+        if edge is not None and edge.edge_type_id != old_type:
+            closure = EdgeClosureRepository(self.session)
+            await closure.remove_edge(edge.from_node_id, edge.to_node_id, old_type)
+            await closure.add_edge(
+                edge.from_node_id, edge.to_node_id, edge.edge_type_id
+            )
+        return edge
+
+    async def delete(self, id: UUID) -> bool:
+        edge = await self.session.get(Edge, id)
+        if edge is None:
+            return False
+        from_id, to_id, type_id = edge.from_node_id, edge.to_node_id, edge.edge_type_id
+        await super().delete(id)
+        await EdgeClosureRepository(self.session).remove_edge(from_id, to_id, type_id)
+        return True
+
     async def get(self, id: UUID) -> Edge | None:
         stmt = (
             select(Edge)
@@ -0,0 +1,317 @@
+"""Repository maintaining and querying the ``edge_closure`` table.
+
+Hierarchical edge types (see ``HIERARCHICAL_EDGE_TYPES``) are closed
+transitively per type, so "everything that ultimately rolls up into this
+doel" is a single index range scan instead of a recursive walk.
+
+The table is maintained incrementally:
+
+- adding ``child -> parent`` joins every descendant of *child* to every
+  ancestor of *parent* in one ``INSERT ... SELECT``;
+- removing an edge (or a node) drops the pairs that may have depended on
+  it and re-derives them for the affected descendants only, trusting the
+  existing rows of every node outside that region.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from sqlalchemy import delete, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bouwmeester.core.config import get_settings
+from bouwmeester.models.corpus_node import CorpusNode
+from bouwmeester.models.edge import Edge
+from bouwmeester.models.edge_closure import EdgeClosure
+
+_INSERT_BATCH_SIZE = 1000
+
+
+@dataclass
+class ClosureRegion:
+    """Pairs of one edge type that may be invalidated by a removal."""
+
+    edge_type_id: str
+    ancestors: set[UUID] = field(default_factory=set)
+    descendants: set[UUID] = field(default_factory=set)
+
+
+def hierarchical_edge_types() -> list[str]:
+    return get_settings().HIERARCHICAL_EDGE_TYPES
+
+
+class EdgeClosureRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    async def get_related(
+        self,
+        node_id: UUID,
+        *,
+        direction: str,
+        edge_types: list[str] | None = None,
+        node_types: list[str] | None = None,
+        max_depth: int | None = None,
+        limit: int = 500,
+    ) -> list[tuple[CorpusNode, int, list[str]]]:
+        """Return ``(node, depth, edge_types)`` reachable from *node_id*.
+
+        *direction* is ``"descendants"`` or ``"ancestors"``.  A node
+        reachable through several edge types is returned once with its
+        shortest depth and every type it is reachable through.
+        """
+        if direction == "descendants":
+            anchor, other = EdgeClosure.ancestor_id, EdgeClosure.descendant_id
+        else:
+            anchor, other = EdgeClosure.descendant_id, EdgeClosure.ancestor_id
+
+        depth = func.min(EdgeClosure.depth).label("depth")
+        types = func.array_agg(EdgeClosure.edge_type_id.distinct()).label("types")
+        stmt = (
+            select(CorpusNode, depth, types)
+            .join(EdgeClosure, other == CorpusNode.id)
+            .where(anchor == node_id)
+            .group_by(CorpusNode.id)
+            .order_by(depth, CorpusNode.title)
+            .limit(limit)
+        )
+        if edge_types:
+            stmt = stmt.where(EdgeClosure.edge_type_id.in_(edge_types))
+        if node_types:
+            stmt = stmt.where(CorpusNode.node_type.in_(node_types))
+        if max_depth is not None:
+            stmt = stmt.where(EdgeClosure.depth <= max_depth)
+        result = await self.session.execute(stmt)
+        return [(node, d, sorted(t)) for node, d, t in result.all()]
+
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+
+    async def add_edge(self, from_id: UUID, to_id: UUID, edge_type_id: str) -> None:
+        """Record a new ``from_id -> to_id`` edge (child -> parent)."""
+        if edge_type_id not in hierarchical_edge_types() or from_id == to_id:
+            return
+
+        ancestors = union_all(
+            select(
+                EdgeClosure.ancestor_id.label("node_id"),
+                EdgeClosure.depth.label("depth"),
+            ).where(
+                EdgeClosure.edge_type_id == edge_type_id,
+                EdgeClosure.descendant_id == to_id,
+            ),
+            select(literal(to_id).label("node_id"), literal(0).label("depth")),
+        ).subquery("anc")
+        descendants = union_all(
+            select(
+                EdgeClosure.descendant_id.label("node_id"),
+                EdgeClosure.depth.label("depth"),
+            ).where(
+                EdgeClosure.edge_type_id == edge_type_id,
+                EdgeClosure.ancestor_id == from_id,
+            ),
+            select(literal(from_id).label("node_id"), literal(0).label("depth")),
+        ).subquery("desc")
+
+        pairs = select(
+            ancestors.c.node_id,
+            literal(edge_type_id),
+            descendants.c.node_id,
+            ancestors.c.depth + descendants.c.depth + 1,
+        ).where(ancestors.c.node_id != descendants.c.node_id)
+        stmt = pg_insert(EdgeClosure).from_select(
+            ["ancestor_id", "edge_type_id", "descendant_id", "depth"], pairs
+        )
+        await self.session.execute(self._keep_shortest(stmt))
+
+    async def remove_edge(self, from_id: UUID, to_id: UUID, edge_type_id: str) -> None:
+        """Repair the closure after ``from_id -> to_id`` was deleted.
+
+        Call after the edge row has been flushed away.
+        """
+        if edge_type_id not in hierarchical_edge_types() or from_id == to_id:
+            return
+        region = ClosureRegion(edge_type_id)
+        region.descendants = await self._related_ids(
+            edge_type_id, from_id, descendants=True
+        )
+        region.descendants.add(from_id)
+        region.ancestors = await self._related_ids(
+            edge_type_id, to_id, descendants=False
+        )
+        region.ancestors.add(to_id)
+        await self.repair(region)
+
+    async def regions_for_node(self, node_id: UUID) -> list[ClosureRegion]:
+        """Capture what deleting *node_id* may invalidate (call before)."""
+        stmt = select(
+            EdgeClosure.edge_type_id,
+            EdgeClosure.ancestor_id,
+            EdgeClosure.descendant_id,
+        ).where(
+            (EdgeClosure.ancestor_id == node_id)
+            | (EdgeClosure.descendant_id == node_id)
+        )
+        regions: dict[str, ClosureRegion] = {}
+        for type_id, ancestor_id, descendant_id in await self.session.execute(stmt):
+            region = regions.setdefault(type_id, ClosureRegion(type_id))
+            if ancestor_id == node_id:
+                region.descendants.add(descendant_id)
+            else:
+                region.ancestors.add(ancestor_id)
+        return [r for r in regions.values() if r.ancestors and r.descendants]
+
+    async def repair(self, region: ClosureRegion) -> None:
+        """Drop and re-derive the ancestor x descendant pairs of *region*."""
+        type_id = region.edge_type_id
+        await self.session.execute(
+            delete(EdgeClosure).where(
+                EdgeClosure.edge_type_id == type_id,
+                EdgeClosure.descendant_id.in_(region.descendants),
+                EdgeClosure.ancestor_id.in_(region.ancestors),
+            )
+        )
+
+        parents = await self._parents(type_id, region.descendants)
+        boundary = {p for ps in parents.values() for p in ps} - region.descendants
+        trusted: dict[UUID, list[tuple[UUID, int]]] = {}
+        if boundary:
+            stmt = select(
+                EdgeClosure.descendant_id, EdgeClosure.ancestor_id, EdgeClosure.depth
+            ).where(
+                EdgeClosure.edge_type_id == type_id,
+                EdgeClosure.descendant_id.in_(boundary),
+            )
+            for descendant_id, ancestor_id, depth in await self.session.execute(stmt):
+                trusted.setdefault(descendant_id, []).append((ancestor_id, depth))
+
+        rows = []
+        for start in region.descendants:
+            reach = _ancestor_depths(start, parents, trusted, region.descendants)
+            rows.extend(
+                {
+                    "ancestor_id": ancestor_id,
+                    "edge_type_id": type_id,
+                    "descendant_id": start,
+                    "depth": depth,
+                }
+                for ancestor_id, depth in reach.items()
+                if ancestor_id in region.ancestors
+            )
+        await self._insert(rows)
+
+    async def rebuild(self) -> int:
+        """Recompute the whole table for the configured edge types."""
+        types = hierarchical_edge_types()
+        await self.session.execute(delete(EdgeClosure))
+        total = 0
+        for type_id in types:
+            result = await self.session.execute(
+                select(Edge.from_node_id, Edge.to_node_id).where(
+                    Edge.edge_type_id == type_id
+                )
+            )
+            parents: dict[UUID, list[UUID]] = {}
+            for from_id, to_id in result:
+                if from_id != to_id:
+                    parents.setdefault(from_id, []).append(to_id)
+            children = set(parents)
+            rows = [
+                {
+                    "ancestor_id": ancestor_id,
+                    "edge_type_id": type_id,
+                    "descendant_id": start,
+                    "depth": depth,
+                }
+                for start in children
+                for ancestor_id, depth in _ancestor_depths(
+                    start, parents, {}, children
+                ).items()
+            ]
+            await self._insert(rows)
+            total += len(rows)
+        return total
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _keep_shortest(stmt):
+        return stmt.on_conflict_do_update(
+            index_elements=["ancestor_id", "edge_type_id", "descendant_id"],
+            set_={"depth": func.least(EdgeClosure.depth, stmt.excluded.depth)},
+        )
+
+    async def _insert(self, rows: list[dict]) -> None:
+        for start in range(0, len(rows), _INSERT_BATCH_SIZE):
+            stmt = pg_insert(EdgeClosure).values(
+                rows[start : start + _INSERT_BATCH_SIZE]
+            )
+            await self.session.execute(self._keep_shortest(stmt))
+
+    async def _related_ids(
+        self, edge_type_id: str, node_id: UUID, *, descendants: bool
+    ) -> set[UUID]:
+        if descendants:
+            stmt = select(EdgeClosure.descendant_id).where(
+                EdgeClosure.ancestor_id == node_id
+            )
+        else:
+            stmt = select(EdgeClosure.ancestor_id).where(
+                EdgeClosure.descendant_id == node_id
+            )
+        stmt = stmt.where(EdgeClosure.edge_type_id == edge_type_id)
+        return set((await self.session.execute(stmt)).scalars())
+
+    async def _parents(
+        self, edge_type_id: str, node_ids: set[UUID]
+    ) -> dict[UUID, list[UUID]]:
+        stmt = select(Edge.from_node_id, Edge.to_node_id).where(
+            Edge.edge_type_id == edge_type_id,
+            Edge.from_node_id.in_(node_ids),
+            Edge.from_node_id != Edge.to_node_id,
+        )
+        parents: dict[UUID, list[UUID]] = {}
+        for from_id, to_id in await self.session.execute(stmt):
+            parents.setdefault(from_id, []).append(to_id)
+        return parents
+
+
+def _ancestor_depths(
+    start: UUID,
+    parents: dict[UUID, list[UUID]],
+    trusted: dict[UUID, list[tuple[UUID, int]]],
+    expand: set[UUID],
+) -> dict[UUID, int]:
+    """Shortest distance from *start* to each ancestor.
+
+    Walks parent edges breadth-first through the nodes in *expand*; any
+    other node reached is a boundary whose own ancestors are taken from
+    *trusted* instead of being walked.
+    """
+    best: dict[UUID, int] = {}
+    seen = {start}
+    queue = deque([(start, 0)])
+    while queue:
+        node, dist = queue.popleft()
+        for parent in parents.get(node, ()):
+            if parent != start and dist + 1 < best.get(parent, dist + 2):
+                best[parent] = dist + 1
+            if parent in expand:
+                if parent not in seen:
+                    seen.add(parent)
+                    queue.append((parent, dist + 1))
+                continue
+            for ancestor_id, depth in trusted.get(parent, ()):
+                total = dist + 1 + depth
+                if ancestor_id != start and total < best.get(ancestor_id, total + 1):
+                    best[ancestor_id] = total
+    return best
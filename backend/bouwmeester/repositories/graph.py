@@ -1,14 +1,94 @@
-"""Repository for graph-wide queries (path-finding, full graph)."""
+"""Repository for graph-wide queries (path-finding, full graph, diffs)."""
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import select, text
+from sqlalchemy import Date, RowMapping, Select, and_, cast, exists, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from bouwmeester.core.graph_index import get_graph_index
+from bouwmeester.models.activity import Activity
 from bouwmeester.models.corpus_node import CorpusNode
 from bouwmeester.models.edge import Edge
+from bouwmeester.repositories.temporal import (
+    edge_existed_on,
+    select_nodes_as_of,
+    valid_on,
+)
+
+# Plain columns (not ORM entities) are streamed so rows never accumulate in
+# the session's identity map.
+_NODE_COLUMNS = (
+    CorpusNode.id,
+    CorpusNode.title,
+    CorpusNode.description,
+    CorpusNode.node_type,
+    CorpusNode.status,
+    CorpusNode.geldig_van,
+    CorpusNode.geldig_tot,
+    CorpusNode.created_at,
+    CorpusNode.updated_at,
+)
+_EDGE_COLUMNS = (
+    Edge.id,
+    Edge.from_node_id,
+    Edge.to_node_id,
+    Edge.edge_type_id,
+    Edge.weight,
+    Edge.description,
+    Edge.created_at,
+)
+
+
+def _created_within(column, from_date: date, to_date: date):
+    """``from_date < column::date <= to_date``, written to use the index."""
+    return and_(
+        column >= cast(from_date + timedelta(days=1), Date),
+        column < cast(to_date + timedelta(days=1), Date),
+    )
+
+
+def _existed_on(created_at: str | None, day: date) -> bool:
+    """Whether an ISO *created_at* recorded in activity details is <= *day*.
+
+    Events logged before the timestamp was recorded count as existing.
+    """
+    if created_at is None:
+        return True
+    return datetime.fromisoformat(created_at).date() <= day
+
+
+def _restrict_edges(
+    edges_stmt: Select, node_types: list[str] | None, as_of: date | None
+) -> Select:
+    """Keep only edges whose *both* endpoints pass the node filters.
+
+    Joined in SQL against ``corpus_node`` rather than an in-memory id set,
+    so the statement size does not grow with the corpus.
+    """
+    if not node_types and as_of is None:
+        return edges_stmt
+    from_node = aliased(CorpusNode)
+    to_node = aliased(CorpusNode)
+    edges_stmt = edges_stmt.join(from_node, from_node.id == Edge.from_node_id).join(
+        to_node, to_node.id == Edge.to_node_id
+    )
+    if node_types:
+        edges_stmt = edges_stmt.where(
+            from_node.node_type.in_(node_types),
+            to_node.node_type.in_(node_types),
+        )
+    if as_of is not None:
+        edges_stmt = edges_stmt.where(
+            valid_on(from_node, as_of),
+            valid_on(to_node, as_of),
+            edge_existed_on(as_of),
+        )
+    return edges_stmt
 
 
 class GraphRepository:
@@ -16,7 +96,7 @@ class GraphRepository:
         self.session = session
 
     # ------------------------------------------------------------------
-    # Path finding -- shortest path via recursive CTE (BFS)
+    # Path finding -- bidirectional BFS over the in-memory graph index
     # ------------------------------------------------------------------
 
     async def find_path(
@@ -25,116 +105,43 @@ class GraphRepository:
         to_id: UUID,
         max_depth: int = 10,
     ) -> list[dict]:
-        """Find the shortest path between two nodes using a recursive CTE.
+        """Find the shortest path between two nodes.
 
-        The CTE performs a breadth-first search over the ``edge`` table,
-        treating edges as *undirected* (traversable in both directions).
-        It returns one row per step with the full path encoded as arrays
-        so we can reconstruct the route.
+        The search runs as a bidirectional breadth-first search over the
+        process-wide :class:`~bouwmeester.core.graph_index.AdjacencyIndex`,
+        treating edges as *undirected*.  Edge ids and types come from the
+        index, so node metadata for the whole route is fetched in a single
+        batched query.
 
         Returns a list of dicts -- one per step -- each containing:
           - ``node_id``, ``node_title``, ``node_type``
           - ``edge_id``, ``edge_type_id`` (``None`` for the starting node)
         """
-        query = text(
-            """
-            WITH RECURSIVE path_walk AS (
-                -- Base: start from the source node.
-                SELECT
-                    cn.id        AS node_id,
-                    cn.title     AS node_title,
-                    cn.node_type AS node_type,
-                    NULL::uuid   AS edge_id,
-                    NULL::text   AS edge_type_id,
-                    ARRAY[cn.id] AS visited,
-                    0            AS depth
-                FROM corpus_node cn
-                WHERE cn.id = :from_id
-
-                UNION ALL
-
-                -- Recursive: follow edges in both directions.
-                SELECT
-                    next_node.id,
-                    next_node.title,
-                    next_node.node_type,
-                    e.id,
-                    e.edge_type_id,
-                    pw.visited || next_node.id,
-                    pw.depth + 1
-                FROM path_walk pw
-                JOIN edge e
-                    ON (e.from_node_id = pw.node_id OR e.to_node_id = pw.node_id)
-                JOIN corpus_node next_node
-                    ON next_node.id = CASE
-                        WHEN e.from_node_id = pw.node_id THEN e.to_node_id
-                        ELSE e.from_node_id
-                    END
-                WHERE pw.depth < :max_depth
-                  AND NOT (next_node.id = ANY(pw.visited))
-            )
-            SELECT
-                node_id,
-                node_title,
-                node_type,
-                edge_id,
-                edge_type_id,
-                visited,
-                depth
-            FROM path_walk
-            WHERE node_id = :to_id
-            ORDER BY depth
-            LIMIT 1
-            """
-        )
-
-        result = await self.session.execute(
-            query,
-            {
-                "from_id": str(from_id),
-                "to_id": str(to_id),
-                "max_depth": max_depth,
-            },
-        )
-        row = result.first()
-
-        if row is None:
+        index = await get_graph_index(self.session)
+        steps = index.shortest_path(from_id, to_id, max_depth)
+        if not steps:
             return []
 
-        # ``visited`` contains the ordered list of node IDs from source to
-        # target.  We now reconstruct the full path with node + edge info.
-        visited_ids: list[UUID] = list(row.visited)
-
-        # Fetch all nodes on the path.
-        nodes_stmt = select(CorpusNode).where(CorpusNode.id.in_(visited_ids))
+        nodes_stmt = select(
+            CorpusNode.id, CorpusNode.title, CorpusNode.node_type
+        ).where(CorpusNode.id.in_([node_id for node_id, _, _ in steps]))
         nodes_result = await self.session.execute(nodes_stmt)
-        node_map = {n.id: n for n in nodes_result.scalars().all()}
-
-        # Fetch all edges between consecutive nodes on the path.
-        path_steps: list[dict] = []
-        for i, nid in enumerate(visited_ids):
-            node = node_map.get(nid)
-            step: dict = {
-                "node_id": nid,
-                "node_title": node.title if node else None,
-                "node_type": node.node_type if node else None,
-                "edge_id": None,
-                "edge_type_id": None,
-            }
-            if i > 0:
-                prev_id = visited_ids[i - 1]
-                edge_stmt = select(Edge).where(
-                    ((Edge.from_node_id == prev_id) & (Edge.to_node_id == nid))
-                    | ((Edge.from_node_id == nid) & (Edge.to_node_id == prev_id))
-                )
-                edge_result = await self.session.execute(edge_stmt)
-                edge = edge_result.scalar_one_or_none()
-                if edge:
-                    step["edge_id"] = edge.id
-                    step["edge_type_id"] = edge.edge_type_id
-            path_steps.append(step)
+        node_map = {row.id: row for row in nodes_result.all()}
+        if len(node_map) != len(steps):
+            # Endpoint does not exist (or the index is momentarily ahead
+            # of this transaction) -- behave as "no path".
+            return []
 
-        return path_steps
+        return [
+            {
+                "node_id": node_id,
+                "node_title": node_map[node_id].title,
+                "node_type": node_map[node_id].node_type,
+                "edge_id": edge_id,
+                "edge_type_id": edge_type_id,
+            }
+            for node_id, edge_id, edge_type_id in steps
+        ]
 
     # ------------------------------------------------------------------
     # Full graph -- all nodes and edges, optionally filtered
@@ -144,32 +151,248 @@ class GraphRepository:
         self,
         node_types: list[str] | None = None,
         edge_types: list[str] | None = None,
+        as_of: date | None = None,
     ) -> dict:
         """Return all nodes and edges, optionally filtered by type.
 
+        With *as_of* the graph is shown as it was on that date: only nodes
+        valid then, with the title and status of that date (as plain rows
+        rather than ORM objects), and only edges created by then.
+
         Returns ``{"nodes": [...], "edges": [...]}``.
         """
         # -- Nodes --
-        nodes_stmt = select(CorpusNode)
+        if as_of is not None:
+            nodes_stmt = select_nodes_as_of(as_of)
+        else:
+            nodes_stmt = select(CorpusNode)
         if node_types:
             nodes_stmt = nodes_stmt.where(CorpusNode.node_type.in_(node_types))
         nodes_stmt = nodes_stmt.order_by(CorpusNode.created_at.desc())
         nodes_result = await self.session.execute(nodes_stmt)
-        nodes = list(nodes_result.scalars().all())
-
-        node_ids = {n.id for n in nodes}
+        if as_of is not None:
+            nodes = list(nodes_result.all())
+        else:
+            nodes = list(nodes_result.scalars().all())
 
         # -- Edges --
         edges_stmt = select(Edge)
         if edge_types:
             edges_stmt = edges_stmt.where(Edge.edge_type_id.in_(edge_types))
-        # Only include edges whose *both* endpoints are in the node set.
-        if node_types:
-            edges_stmt = edges_stmt.where(
-                Edge.from_node_id.in_(node_ids),
-                Edge.to_node_id.in_(node_ids),
-            )
+        edges_stmt = _restrict_edges(edges_stmt, node_types, as_of)
         edges_result = await self.session.execute(edges_stmt)
         edges = list(edges_result.scalars().all())
 
         return {"nodes": nodes, "edges": edges}
+
+    async def stream_full_graph(
+        self,
+        node_types: list[str] | None = None,
+        edge_types: list[str] | None = None,
+        batch_size: int = 500,
+        as_of: date | None = None,
+    ) -> AsyncIterator[tuple[str, list[RowMapping]]]:
+        """Stream all nodes, then all edges, through a server-side cursor.
+
+        Yields ``("node", rows)`` and ``("edge", rows)`` batches of at most
+        *batch_size* row mappings, so memory stays flat regardless of graph
+        size.  Filtering matches :meth:`get_full_graph`.  Row order is
+        unspecified.
+        """
+        if as_of is not None:
+            nodes_stmt = select_nodes_as_of(as_of)
+        else:
+            nodes_stmt = select(*_NODE_COLUMNS)
+        nodes_stmt = nodes_stmt.execution_options(yield_per=batch_size)
+        if node_types:
+            nodes_stmt = nodes_stmt.where(CorpusNode.node_type.in_(node_types))
+        nodes_result = await self.session.stream(nodes_stmt)
+        async for batch in nodes_result.mappings().partitions():
+            yield "node", batch
+
+        edges_stmt = select(*_EDGE_COLUMNS).execution_options(yield_per=batch_size)
+        if edge_types:
+            edges_stmt = edges_stmt.where(Edge.edge_type_id.in_(edge_types))
+        edges_stmt = _restrict_edges(edges_stmt, node_types, as_of)
+        edges_result = await self.session.stream(edges_stmt)
+        async for batch in edges_result.mappings().partitions():
+            yield "edge", batch
+
+    # ------------------------------------------------------------------
+    # Diff -- what changed between two dates
+    # ------------------------------------------------------------------
+
+    async def diff(self, from_date: date, to_date: date) -> dict:
+        """Return nodes and edges added, removed or changed in a period.
+
+        - nodes: a full outer join of the corpus as of *from_date* and as
+          of *to_date* (temporal title/status records), plus nodes with a
+          ``node.updated`` event in between.  This compares every node
+          valid on either date, so its cost grows with the corpus.
+          Hard-deleted nodes come from ``node.deleted`` events, skipping
+          nodes created within the period.
+        - edges: edges created in the period, ``edge.updated`` events on
+          edges that still exist, ``edge.deleted`` events for edges that
+          were not also created in the period, and the edges a
+          ``node.deleted`` event records as removed by its cascade.  These
+          are read from the activity log and scale with the change.
+
+        The period is ``(from_date, to_date]``, matching ``as_of``.
+        Returns a dict with ``nodes_added``, ``nodes_removed``,
+        ``nodes_changed``, ``edges_added``, ``edges_removed`` and
+        ``edges_changed``.
+        """
+        before = select_nodes_as_of(from_date).subquery("before")
+        after = select_nodes_as_of(to_date).subquery("after")
+        updated = select(Activity.node_id).where(
+            Activity.event_type == "node.updated",
+            Activity.node_id.is_not(None),
+            _created_within(Activity.created_at, from_date, to_date),
+        )
+        nodes_stmt = (
+            select(
+                before.c.id.label("before_id"),
+                before.c.title.label("before_title"),
+                before.c.status.label("before_status"),
+                before.c.node_type.label("before_type"),
+                after.c.id.label("after_id"),
+                after.c.title.label("after_title"),
+                after.c.status.label("after_status"),
+                after.c.node_type.label("after_type"),
+            )
+            .select_from(before.join(after, before.c.id == after.c.id, full=True))
+            .where(
+                or_(
+                    before.c.id.is_(None),
+                    after.c.id.is_(None),
+                    before.c.title.is_distinct_from(after.c.title),
+                    before.c.status.is_distinct_from(after.c.status),
+                    after.c.id.in_(updated),
+                )
+            )
+        )
+
+        nodes_added: list[dict] = []
+        nodes_removed: list[dict] = []
+        nodes_changed: list[dict] = []
+        for row in await self.session.execute(nodes_stmt):
+            if row.before_id is None:
+                nodes_added.append(
+                    {
+                        "id": row.after_id,
+                        "node_type": row.after_type,
+                        "title": row.after_title,
+                        "status": row.after_status,
+                    }
+                )
+            elif row.after_id is None:
+                nodes_removed.append(
+                    {
+                        "id": row.before_id,
+                        "node_type": row.before_type,
+                        "title": row.before_title,
+                        "status": row.before_status,
+                    }
+                )
+            else:
+                nodes_changed.append(
+                    {
+                        "id": row.after_id,
+                        "node_type": row.after_type,
+                        "title": row.after_title,
+                        "status": row.after_status,
+                        "previous_title": (
+                            row.before_title
+                            if row.before_title != row.after_title
+                            else None
+                        ),
+                        "previous_status": (
+                            row.before_status
+                            if row.before_status != row.after_status
+                            else None
+                        ),
+                    }
+                )
+
+        deleted_nodes = select(Activity.details).where(
+            Activity.event_type == "node.deleted",
+            _created_within(Activity.created_at, from_date, to_date),
+        )
+        cascaded_edges: list[dict] = []
+        for (details,) in await self.session.execute(deleted_nodes):
+            if not details or not details.get("node_id"):
+                continue
+            cascaded_edges.extend(
+                edge
+                for edge in details.get("edges") or ()
+                if _existed_on(edge.get("created_at"), from_date)
+            )
+            if _existed_on(details.get("created_at"), from_date):
+                nodes_removed.append(
+                    {
+                        "id": details["node_id"],
+                        "node_type": details.get("node_type"),
+                        "title": details.get("title"),
+                        "status": None,
+                    }
+                )
+
+        # -- Edges --
+        added_edges = select(*_EDGE_COLUMNS).where(
+            _created_within(Edge.created_at, from_date, to_date)
+        )
+        edges_added = [
+            dict(r) for r in (await self.session.execute(added_edges)).mappings()
+        ]
+
+        changed_edges = select(*_EDGE_COLUMNS).where(
+            Edge.id.in_(
+                select(Activity.edge_id).where(
+                    Activity.event_type == "edge.updated",
+                    _created_within(Activity.created_at, from_date, to_date),
+                )
+            ),
+            ~_created_within(Edge.created_at, from_date, to_date),
+        )
+        edges_changed = [
+            dict(r) for r in (await self.session.execute(changed_edges)).mappings()
+        ]
+
+        deleted = aliased(Activity)
+        created = aliased(Activity)
+        created_in_period = exists().where(
+            created.event_type == "edge.created",
+            _created_within(created.created_at, from_date, to_date),
+            created.created_at <= deleted.created_at,
+            *(
+                created.details[key].as_string() == deleted.details[key].as_string()
+                for key in ("from_node_id", "to_node_id", "edge_type")
+            ),
+        )
+        removed_stmt = select(deleted.details).where(
+            deleted.event_type == "edge.deleted",
+            _created_within(deleted.created_at, from_date, to_date),
+            ~created_in_period,
+        )
+        edges_removed = [
+            {
+                "id": details["edge_id"],
+                "from_node_id": details.get("from_node_id"),
+                "to_node_id": details.get("to_node_id"),
+                "edge_type_id": details.get("edge_type"),
+            }
+            for details in [
+                *(d for (d,) in await self.session.execute(removed_stmt)),
+                *cascaded_edges,
+            ]
+            if details and details.get("edge_id")
+        ]
+
+        return {
+            "nodes_added": nodes_added,
+            "nodes_removed": nodes_removed,
+            "nodes_changed": nodes_changed,
+            "edges_added": edges_added,
+            "edges_removed": edges_removed,
+            "edges_changed": edges_changed,
+        }
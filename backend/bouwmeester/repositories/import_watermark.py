@@ -0,0 +1,41 @@
+"""Repository for per-type, per-chamber import watermarks."""
+
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bouwmeester.models.import_watermark import ImportWatermark
+
+
+class ImportWatermarkRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_all(self) -> dict[tuple[str, str], datetime]:
+        """All watermarks as ``{(item_type, bron): gewijzigd_op}``."""
+        result = await self.session.execute(
+            select(
+                ImportWatermark.item_type,
+                ImportWatermark.bron,
+                ImportWatermark.gewijzigd_op,
+            )
+        )
+        return {(t, b): ts for t, b, ts in result.all()}
+
+    async def advance(self, item_type: str, bron: str, gewijzigd_op: datetime) -> None:
+        """Move the watermark forward; it never moves back."""
+        stmt = pg_insert(ImportWatermark).values(
+            item_type=item_type, bron=bron, gewijzigd_op=gewijzigd_op
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["item_type", "bron"],
+            set_={
+                "gewijzigd_op": func.greatest(
+                    ImportWatermark.gewijzigd_op, stmt.excluded.gewijzigd_op
+                ),
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
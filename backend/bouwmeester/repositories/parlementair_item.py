@@ -2,7 +2,8 @@
 
 from uuid import UUID
 
-from sqlalchemy import or_, select
+from sqlalchemy import String, any_, bindparam, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -70,6 +71,17 @@ class ParlementairItemRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_existing_zaak_ids(self, zaak_ids: list[str]) -> set[str]:
+        """Which of *zaak_ids* are already imported, in one query."""
+        if not zaak_ids:
+            return set()
+        ids = bindparam("ids", zaak_ids, type_=ARRAY(String))
+        stmt = select(ParlementairItem.zaak_id).where(
+            ParlementairItem.zaak_id == any_(ids)
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
     async def create(self, **kwargs) -> ParlementairItem:
         item = ParlementairItem(**kwargs)
         self.session.add(item)
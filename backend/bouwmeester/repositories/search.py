@@ -1,220 +1,210 @@
-"""Repository for omni full-text search across all entity types."""
-
-from sqlalchemy import text
+"""Repository for omni full-text search across all entity types.
+
+Every searchable entity has a row in ``search_document`` (maintained by
+triggers on the source tables), so a search is a single ranked top-k
+query over one GIN index instead of a UNION across six tables.
+
+Queries are matched as you type: finished words are stemmed as usual and
+the last word is a prefix term, so "waterschapsbel" already finds
+"waterschapsbelasting".  When ``pg_trgm`` is installed, titles are also
+matched on trigram word similarity, which catches misspellings.
+"""
+
+import base64
+import json
+import re
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import ARRAY, Text, bindparam, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from bouwmeester.utils.tiptap import tiptap_to_plain
+_URL_MAP = {
+    "corpus_node": "/nodes/{id}",
+    "task": "/tasks?task={id}",
+    "person": "/people?person={id}",
+    "organisatie_eenheid": "/organisatie?eenheid={id}",
+    "parlementair_item": "/parlementair?item={id}",
+    "tag": "/corpus?tag={id}",
+}
+
+_HEADLINE_OPTIONS = (
+    "StartSel=<mark>,StopSel=</mark>,MaxWords=35,MinWords=15,MaxFragments=2"
+)
+
+# The prefix term is expanded with both configurations: 'simple' keeps
+# partial words that happen to be Dutch stop words ("wat" -> "water"),
+# 'dutch' stems a completely typed word so it still matches its lexeme.
+_TSQUERY = """
+    plainto_tsquery('dutch', :complete)
+    && (to_tsquery('simple', :prefix_term) || to_tsquery('dutch', :prefix_term))
+"""
+
+_trigram_available: bool | None = None
+
+
+@dataclass
+class SearchPage:
+    results: list[dict]
+    facets: dict[str, int]
+    next_cursor: str | None
+
+
+def encode_cursor(score: float, entity_id: UUID) -> str:
+    """Opaque keyset cursor for the row ``(score, entity_id)``."""
+    raw = json.dumps([score, str(entity_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[float, UUID]:
+    """Inverse of :func:`encode_cursor`; raises ``ValueError`` if invalid."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        score, entity_id = json.loads(raw)
+        return float(score), UUID(entity_id)
+    except (TypeError, ValueError, json.JSONDecodeError) as exc:
+        raise ValueError("Invalid search cursor") from exc
+
+
+def _split_query(query: str) -> tuple[str, str] | None:
+    """Split *query* into finished words and a ``word:*`` prefix term."""
+    words = re.findall(r"\w+", query.lower())
+    if not words:
+        return None
+    return " ".join(words[:-1]), f"{words[-1]}:*"
 
 
 class SearchRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    async def _has_trigram(self) -> bool:
+        """Whether ``pg_trgm`` is installed (checked once per process)."""
+        global _trigram_available  # noqa: PLW0603
+        if _trigram_available is None:
+            _trigram_available = bool(
+                await self.session.scalar(
+                    text(
+                        "SELECT EXISTS "
+                        "(SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+                    )
+                )
+            )
+        return _trigram_available
+
     async def full_text_search(
         self,
         query: str,
         result_types: list[str] | None = None,
         limit: int = 50,
-    ) -> list[dict]:
-        """Search across all entity types using stored tsvector + GIN indexes.
-
-        Returns unified results from corpus_node, task, person,
-        organisatie_eenheid, parlementair_item, and tag tables.
-        """
-        all_types = {
-            "corpus_node",
-            "task",
-            "person",
-            "organisatie_eenheid",
-            "parlementair_item",
-            "tag",
-        }
-        active_types = set(result_types) if result_types else all_types
-
-        short_query = len(query.strip()) < 4
-
-        sub_queries = []
-
-        # title_col per entity for ILIKE fallback on short queries
-        entity_title_cols = {
-            "corpus_node": "title",
-            "task": "title",
-            "person": "naam",
-            "organisatie_eenheid": "naam",
-            "parlementair_item": "titel",
-            "tag": "name",
-        }
-
-        def _where(title_col: str) -> str:
-            fts = "search_vector @@ plainto_tsquery('dutch', :query)"
-            if short_query:
-                return f"({fts} OR {title_col} ILIKE :prefix)"
-            return fts
-
-        def _score(title_col: str) -> str:
-            rank = "ts_rank(search_vector, plainto_tsquery('dutch', :query))"
-            if short_query:
-                return (
-                    f"GREATEST({rank}, "
-                    f"CASE WHEN {title_col} ILIKE :prefix THEN 0.1 ELSE 0 END)"
-                )
-            return rank
-
-        if "corpus_node" in active_types:
-            tc = entity_title_cols["corpus_node"]
-            sub_queries.append(f"""
-                SELECT
-                    id,
-                    'corpus_node' AS result_type,
-                    title,
-                    node_type AS subtitle,
-                    description,
-                    {_score(tc)} AS score
-                FROM corpus_node
-                WHERE {_where(tc)}
-            """)
-
-        if "task" in active_types:
-            tc = entity_title_cols["task"]
-            sub_queries.append(f"""
-                SELECT
-                    id,
-                    'task' AS result_type,
-                    title,
-                    status AS subtitle,
-                    description,
-                    {_score(tc)} AS score
-                FROM task
-                WHERE {_where(tc)}
-            """)
-
-        if "person" in active_types:
-            tc = entity_title_cols["person"]
-            sub_queries.append(f"""
-                SELECT
-                    id,
-                    'person' AS result_type,
-                    naam AS title,
-                    functie AS subtitle,
-                    email AS description,
-                    {_score(tc)} AS score
-                FROM person
-                WHERE {_where(tc)}
-            """)
-
-        if "organisatie_eenheid" in active_types:
-            tc = entity_title_cols["organisatie_eenheid"]
-            sub_queries.append(f"""
-                SELECT
-                    id,
-                    'organisatie_eenheid' AS result_type,
-                    naam AS title,
-                    type AS subtitle,
-                    beschrijving AS description,
-                    {_score(tc)} AS score
-                FROM organisatie_eenheid
-                WHERE {_where(tc)}
-            """)
-
-        if "parlementair_item" in active_types:
-            tc = entity_title_cols["parlementair_item"]
-            sub_queries.append(f"""
-                SELECT
-                    id,
-                    'parlementair_item' AS result_type,
-                    titel AS title,
-                    type AS subtitle,
-                    onderwerp AS description,
-                    {_score(tc)} AS score
-                FROM parlementair_item
-                WHERE {_where(tc)}
-            """)
-
-        if "tag" in active_types:
-            tc = entity_title_cols["tag"]
-            sub_queries.append(f"""
-                SELECT
-                    id,
-                    'tag' AS result_type,
-                    name AS title,
-                    NULL AS subtitle,
-                    description,
-                    {_score(tc)} AS score
-                FROM tag
-                WHERE {_where(tc)}
-            """)
-
-        if not sub_queries:
-            return []
-
-        union_sql = " UNION ALL ".join(sub_queries)
-        full_sql = f"""
-            SELECT * FROM ({union_sql}) AS combined
-            ORDER BY score DESC
-            LIMIT :limit
+        after: tuple[float, UUID] | None = None,
+    ) -> SearchPage:
+        """Search across all entity types in ``search_document``.
+
+        Returns one page of unified results from corpus_node, task,
+        person, organisatie_eenheid, parlementair_item, and tag rows,
+        ordered by ``(score DESC, id)``.  *after* is the ``(score, id)``
+        of the last row of the previous page; the next page continues
+        strictly after it, so earlier pages are never re-sorted or
+        skipped over.  Facet counts (matches per type, regardless of
+        *result_types*) and highlights come from the same statement.
         """
-
-        params: dict = {"query": query, "limit": limit}
-        if short_query:
+        params: dict = {"query": query.strip(), "limit": limit + 1}
+        split = _split_query(query)
+        if split:
+            params["complete"], params["prefix_term"] = split
+            tsquery = _TSQUERY
+        else:
+            tsquery = "CAST(NULL AS tsquery)"
+
+        rank = "ts_rank(d.search_vector, q.tsq)"
+        match = "d.search_vector @@ q.tsq"
+        if await self._has_trigram():
+            # <% is served by the ix_search_document_title_trgm GIN index.
+            rank = f"GREATEST({rank}, word_similarity(:query, d.title))"
+            match = f"({match} OR :query <% d.title)"
+        elif len(query.strip()) < 4:
+            prefix_score = "CASE WHEN d.title ILIKE :prefix THEN 0.1 ELSE 0 END"
+            rank = f"GREATEST({rank}, {prefix_score})"
+            match = f"({match} OR d.title ILIKE :prefix)"
             params["prefix"] = query.strip() + "%"
 
-        result = await self.session.execute(text(full_sql), params)
-        rows = result.all()
-
-        url_map = {
-            "corpus_node": "/nodes/{id}",
-            "task": "/tasks?task={id}",
-            "person": "/people?person={id}",
-            "organisatie_eenheid": "/organisatie?eenheid={id}",
-            "parlementair_item": "/parlementair?item={id}",
-            "tag": "/corpus?tag={id}",
-        }
-
-        # Build results, converting TipTap JSON descriptions to plain text
-        results = []
-        for row in rows:
-            url = url_map[row.result_type].format(id=row.id)
-            description = tiptap_to_plain(row.description)
-            results.append(
-                {
-                    "id": row.id,
-                    "result_type": row.result_type,
-                    "title": row.title,
-                    "subtitle": row.subtitle,
-                    "description": description,
-                    "score": float(row.score),
-                    "highlights": None,
-                    "url": url,
-                }
+        page_where = ["true"]
+        if result_types:
+            page_where.append("m.entity_type = ANY(:types)")
+            params["types"] = list(result_types)
+        if after:
+            # Scores are REAL on both sides so equality is exact.
+            page_where.append(
+                "(m.score < CAST(:after_score AS real)"
+                " OR (m.score = CAST(:after_score AS real)"
+                " AND m.entity_id > :after_id))"
             )
-
-        # Generate highlights for rows that have descriptions
-        if results:
-            ids_with_desc = [(i, r) for i, r in enumerate(results) if r["description"]]
-            if ids_with_desc:
-                await self._add_highlights(ids_with_desc, query)
-
-        return results
-
-    async def _add_highlights(
-        self, indexed_results: list[tuple[int, dict]], query: str
-    ) -> None:
-        """Add ts_headline highlights to results that have descriptions."""
-        for _idx, result in indexed_results:
-            desc = result["description"] or ""
-            if not desc:
-                continue
-            hl_result = await self.session.execute(
-                text("""
-                    SELECT ts_headline(
-                        'dutch',
-                        :desc,
-                        plainto_tsquery('dutch', :query),
-                        'StartSel=<mark>,StopSel=</mark>,MaxWords=35,MinWords=15,MaxFragments=2'
-                    ) AS headline
-                """),
-                {"desc": desc, "query": query},
+            params["after_score"], params["after_id"] = after
+
+        stmt = text(f"""
+            WITH q AS (SELECT {tsquery} AS tsq),
+            matches AS (
+                SELECT d.entity_type, d.entity_id, CAST({rank} AS real) AS score
+                FROM search_document AS d, q
+                WHERE {match}
+            ),
+            facets AS (
+                SELECT coalesce(jsonb_object_agg(entity_type, n), '{{}}') AS counts
+                FROM (
+                    SELECT entity_type, count(*) AS n
+                    FROM matches
+                    GROUP BY entity_type
+                ) AS c
+            ),
+            page AS (
+                SELECT m.*
+                FROM matches AS m
+                WHERE {" AND ".join(page_where)}
+                ORDER BY m.score DESC, m.entity_id
+                LIMIT :limit
             )
-            headline = hl_result.scalar()
-            if headline and "<mark>" in headline:
-                result["highlights"] = [headline]
+            SELECT
+                f.counts AS facets,
+                p.entity_type, p.entity_id, p.score,
+                d.title, d.subtitle, d.body,
+                CASE WHEN d.body IS NOT NULL THEN ts_headline(
+                    'dutch', d.body, q.tsq, '{_HEADLINE_OPTIONS}'
+                ) END AS headline
+            FROM facets AS f
+            CROSS JOIN q
+            LEFT JOIN page AS p ON true
+            LEFT JOIN search_document AS d
+              ON d.entity_type = p.entity_type AND d.entity_id = p.entity_id
+            ORDER BY p.score DESC, p.entity_id
+        """)
+        if result_types:
+            stmt = stmt.bindparams(bindparam("types", type_=ARRAY(Text)))
+
+        rows = (await self.session.execute(stmt.columns(facets=JSONB), params)).all()
+        facets = rows[0].facets if rows else {}
+        hits = [row for row in rows if row.entity_id is not None]
+        next_cursor = None
+        if len(hits) > limit:
+            hits = hits[:limit]
+            next_cursor = encode_cursor(hits[-1].score, hits[-1].entity_id)
+
+        results = [
+            {
+                "id": row.entity_id,
+                "result_type": row.entity_type,
+                "title": row.title,
+                "subtitle": row.subtitle,
+                "description": row.body,
+                "score": float(row.score),
+                "highlights": (
+                    [row.headline]
+                    if row.headline and "<mark>" in row.headline
+                    else None
+                ),
+                "url": _URL_MAP[row.entity_type].format(id=row.entity_id),
+            }
+            for row in hits
+        ]
+        return SearchPage(results, facets, next_cursor)
@@ -0,0 +1,90 @@
+"""Shared helpers for "as of date" queries over temporal records.
+
+Temporal rows are valid on the half-open range ``[geldig_van,
+geldig_tot)``; an open ``geldig_tot`` means "still valid".  The predicate
+is written as a ``daterange(...) @> day`` containment so it
+matches the GiST expression indexes on ``corpus_node``,
+``corpus_node_title`` and ``corpus_node_status``.
+"""
+
+from datetime import date
+
+from sqlalchemy import (
+    Boolean,
+    ColumnElement,
+    Date,
+    Select,
+    and_,
+    cast,
+    func,
+    literal_column,
+    select,
+)
+from sqlalchemy.orm import AliasedClass, aliased
+
+from bouwmeester.models.corpus_node import CorpusNode
+from bouwmeester.models.edge import Edge
+from bouwmeester.models.node_status import CorpusNodeStatus
+from bouwmeester.models.node_title import CorpusNodeTitle
+
+# Models with a ``geldig_van``/``geldig_tot`` period, or aliases of them.
+TemporalModel = (
+    type[CorpusNode]
+    | type[CorpusNodeTitle]
+    | type[CorpusNodeStatus]
+    | AliasedClass[CorpusNode]
+    | AliasedClass[CorpusNodeTitle]
+    | AliasedClass[CorpusNodeStatus]
+)
+
+
+def valid_on(model: TemporalModel, day: date) -> ColumnElement[bool]:
+    """SQL predicate: *model*'s ``geldig_van``/``geldig_tot`` cover *day*."""
+    # LEAST turns records closed before they started (e.g. a backdated
+    # wijzig_datum) into empty ranges instead of raising; NULL (open-ended)
+    # geldig_tot is ignored by LEAST.
+    period = func.daterange(
+        func.least(model.geldig_van, model.geldig_tot),
+        model.geldig_tot,
+        # Inline literal: a bind parameter would not match the index.
+        literal_column("'[)'"),
+    )
+    return period.op("@>", return_type=Boolean)(cast(day, Date))
+
+
+def edge_existed_on(day: date) -> ColumnElement[bool]:
+    """SQL predicate: the edge had been created by the end of *day*.
+
+    Edges carry no validity period; deleted edges are gone and cannot be
+    shown in historical views.
+    """
+    return cast(Edge.created_at, Date) <= day
+
+
+def select_nodes_as_of(day: date) -> Select:
+    """Select node rows as they were on *day*, in one set-based query.
+
+    Only nodes valid on *day* are included; ``title`` and ``status`` come
+    from the temporal record valid on that day, falling back to the
+    current value when no such record exists.  Columns match
+    ``CorpusNodeResponse`` so rows can be validated directly.
+    """
+    title = aliased(CorpusNodeTitle)
+    status = aliased(CorpusNodeStatus)
+    return (
+        select(
+            CorpusNode.id,
+            func.coalesce(title.title, CorpusNode.title).label("title"),
+            CorpusNode.description,
+            CorpusNode.node_type,
+            func.coalesce(status.status, CorpusNode.status).label("status"),
+            CorpusNode.geldig_van,
+            CorpusNode.geldig_tot,
+            CorpusNode.created_at,
+            CorpusNode.updated_at,
+        )
+        .select_from(CorpusNode)
+        .outerjoin(title, and_(title.node_id == CorpusNode.id, valid_on(title, day)))
+        .outerjoin(status, and_(status.node_id == CorpusNode.id, valid_on(status, day)))
+        .where(valid_on(CorpusNode, day))
+    )
@@ -24,6 +24,14 @@ class NodeType(enum.StrEnum):
     bron = "bron"
 
 
+class NodeSortField(enum.StrEnum):
+    """Precomputed graph metrics ``GET /api/nodes`` can sort on."""
+
+    degree = "degree"
+    pagerank = "pagerank"
+    betweenness = "betweenness"
+
+
 # --- Temporal record schemas ---
 
 
@@ -98,6 +106,37 @@ class CorpusNodeResponse(CorpusNodeBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class NodeMetricsRecord(BaseModel):
+    degree: int
+    in_degree: int
+    out_degree: int
+    pagerank: float
+    betweenness: float
+    component_id: int
+    component_size: int
+    is_orphan: bool
+    computed_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CorpusNodeWithMetrics(CorpusNodeResponse):
+    # None until the worker has computed metrics for a new node.
+    metrics: NodeMetricsRecord | None = None
+
+
+class SimilarNode(BaseModel):
+    node: CorpusNodeResponse
+    # Cosine similarity of the TF-IDF vectors, 0..1.
+    score: float
+
+
+class DuplicateGroup(BaseModel):
+    nodes: list[CorpusNodeResponse]
+    # Lowest estimated Jaccard similarity between linked nodes, 0..1.
+    similarity: float
+
+
 class CorpusNodeWithEdges(CorpusNodeResponse):
     edges_from: list["EdgeResponse"] = []
     edges_to: list["EdgeResponse"] = []
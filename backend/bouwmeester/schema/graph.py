@@ -1,5 +1,9 @@
 """Pydantic schemas for graph-related operations."""
 
+from datetime import date
+from typing import Literal
+from uuid import UUID
+
 from pydantic import BaseModel
 
 from bouwmeester.schema.corpus_node import CorpusNodeResponse, NodeType
@@ -25,3 +29,48 @@ class GraphSearchParams(BaseModel):
 class GraphViewResponse(BaseModel):
     nodes: list[CorpusNodeResponse]
     edges: list[EdgeResponse]
+
+
+class SubgraphViewResponse(GraphViewResponse):
+    truncated: bool = False
+    level_counts: list[int] = []
+
+
+class ReachableNode(BaseModel):
+    node: CorpusNodeResponse
+    depth: int
+    edge_types: list[str]
+
+
+class ReachabilityResponse(BaseModel):
+    node_id: UUID
+    direction: Literal["descendants", "ancestors"]
+    nodes: list[ReachableNode]
+
+
+class NodeDiffEntry(BaseModel):
+    id: UUID
+    node_type: str | None = None
+    title: str | None = None
+    status: str | None = None
+    # Changed nodes only: the value on the ``from`` date, when it differs.
+    previous_title: str | None = None
+    previous_status: str | None = None
+
+
+class EdgeDiffEntry(BaseModel):
+    id: UUID
+    from_node_id: UUID | None = None
+    to_node_id: UUID | None = None
+    edge_type_id: str | None = None
+
+
+class GraphDiffResponse(BaseModel):
+    from_date: date
+    to_date: date
+    nodes_added: list[NodeDiffEntry]
+    nodes_removed: list[NodeDiffEntry]
+    nodes_changed: list[NodeDiffEntry]
+    edges_added: list[EdgeDiffEntry]
+    edges_removed: list[EdgeDiffEntry]
+    edges_changed: list[EdgeDiffEntry]
@@ -28,5 +28,10 @@ class SearchResult(BaseModel):
 
 class SearchResponse(BaseModel):
     results: list[SearchResult]
+    # Matches across all pages for the requested result types.
     total: int
     query: str
+    # Matches per result type, ignoring the result_types filter.
+    facets: dict[SearchResultType, int] = {}
+    # Pass as ``cursor`` to fetch the next page; None on the last page.
+    next_cursor: str | None = None
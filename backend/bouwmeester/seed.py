@@ -25,6 +25,7 @@ from bouwmeester.models import (  # noqa: F401 – ensure metadata is populated
     PolitiekeInput,
     Task,
 )
+from bouwmeester.repositories.edge_closure import EdgeClosureRepository
 
 
 async def seed() -> None:
@@ -547,6 +548,8 @@ async def seed() -> None:
 
     async with async_session() as session:
         session.add_all(edges)
+        await session.flush()
+        await EdgeClosureRepository(session).rebuild()
         await session.commit()
     print(f"  -> {len(edges)} edges created.")
 
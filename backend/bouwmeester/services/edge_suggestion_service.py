@@ -1,37 +1,79 @@
 """Service for suggesting edges between corpus nodes.
 
-Uses tag overlap (fast, no LLM) to find candidates, then LLM scoring
-for content relevance.
+Candidates are ranked without any LLM call by a link predictor that
+combines:
+
+- **Adamic-Adar** over the edge graph: every neighbour a candidate shares
+  with the node counts ``1 / log(degree)``, so a shared niche neighbour
+  weighs more than a shared hub;
+- the same weighting over **tags** (nodes sharing a rarely used tag are
+  more related than nodes sharing a popular one; parent tags count 0.7);
+- local TF-IDF **text similarity**.
+
+Nodes that are already connected are never suggested.  The ranking is
+served as-is by :meth:`EdgeSuggestionService.suggest_connections`, or
+refined by LLM relevance scoring in :meth:`~EdgeSuggestionService.suggest_edges`,
+which scores all candidates in one batched prompt.
 """
 
 import asyncio
 import logging
+import math
 import uuid
+from dataclasses import dataclass
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from bouwmeester.core.graph_index import get_graph_index
+from bouwmeester.core.similarity_index import get_similarity_index
 from bouwmeester.models.corpus_node import CorpusNode
 from bouwmeester.models.edge_type import EdgeType
-from bouwmeester.models.tag import NodeTag
-from bouwmeester.repositories.tag import TagRepository
+from bouwmeester.models.tag import NodeTag, Tag
 from bouwmeester.schema.llm import EdgeSuggestionItem
-from bouwmeester.services.llm.base import BaseLLMService, EdgeRelevanceResult
+from bouwmeester.services.llm.base import BaseLLMService, EdgeCandidate
 
 logger = logging.getLogger(__name__)
 
-# Overall timeout for all LLM scoring calls combined.
+# Overall timeout for the batched LLM scoring (including fallbacks).
 LLM_SCORING_TIMEOUT_SECONDS = 30
 _DEFAULT_EDGE_TYPE = "verwijst_naar"
+# A perfect text match counts as much as two shared tags.
+_TEXT_SIMILARITY_WEIGHT = 2.0
+_PARENT_TAG_WEIGHT = 0.7
+# How many text-similar nodes to consider as extra candidates.
+_TEXT_CANDIDATES = 50
+
+
+@dataclass
+class LinkCandidate:
+    node_id: uuid.UUID
+    score: float = 0.0
+    common_neighbors: int = 0
+    shared_tags: int = 0
+    text_similarity: float = 0.0
+
+    @property
+    def reason(self) -> str:
+        parts = []
+        if self.common_neighbors:
+            parts.append(f"{self.common_neighbors} gemeenschappelijke buren")
+        if self.shared_tags:
+            label = "gedeelde tag" if self.shared_tags == 1 else "gedeelde tags"
+            parts.append(f"{self.shared_tags} {label}")
+        if self.text_similarity:
+            parts.append(f"tekstovereenkomst {self.text_similarity:.0%}")
+        return ", ".join(parts)
 
 
 class EdgeSuggestionService:
-    """Orchestrates tag-overlap + LLM scoring for edge suggestions."""
+    """Structural link prediction, optionally refined by LLM scoring."""
 
-    def __init__(self, session: AsyncSession, llm_service: BaseLLMService) -> None:
+    def __init__(
+        self, session: AsyncSession, llm_service: BaseLLMService | None = None
+    ) -> None:
         self.session = session
         self.llm_service = llm_service
-        self.tag_repo = TagRepository(session)
         self._valid_edge_types: set[str] | None = None
 
     async def _get_valid_edge_types(self) -> set[str]:
@@ -41,6 +83,106 @@ class EdgeSuggestionService:
             self._valid_edge_types = {row[0] for row in result.all()}
         return self._valid_edge_types
 
+    async def rank_candidates(
+        self, node_uuid: uuid.UUID, limit: int = 10
+    ) -> list[LinkCandidate]:
+        """Best *limit* unconnected nodes to link *node_uuid* to."""
+        candidates: dict[uuid.UUID, LinkCandidate] = {}
+
+        def candidate(nid: uuid.UUID) -> LinkCandidate:
+            if nid not in candidates:
+                candidates[nid] = LinkCandidate(nid)
+            return candidates[nid]
+
+        # Adamic-Adar over the in-memory adjacency index.
+        graph = await get_graph_index(self.session)
+        linked = graph.neighbors(node_uuid)
+        for via in linked:
+            via_neighbors = graph.neighbors(via)
+            if len(via_neighbors) < 2:
+                continue
+            weight = 1.0 / math.log(len(via_neighbors))
+            for nid in via_neighbors:
+                if nid != node_uuid:
+                    c = candidate(nid)
+                    c.score += weight
+                    c.common_neighbors += 1
+
+        for nid, weight in (await self._shared_tag_weights(node_uuid)).items():
+            c = candidate(nid)
+            c.score += weight[0]
+            c.shared_tags += weight[1]
+
+        index = await get_similarity_index(self.session)
+        for nid, similarity in index.similar(node_uuid, _TEXT_CANDIDATES):
+            c = candidate(nid)
+            c.score += similarity * _TEXT_SIMILARITY_WEIGHT
+            c.text_similarity = similarity
+
+        ranked = [
+            c for nid, c in candidates.items() if nid not in linked and nid != node_uuid
+        ]
+        ranked.sort(key=lambda c: c.score, reverse=True)
+        return ranked[:limit]
+
+    async def _shared_tag_weights(
+        self, node_uuid: uuid.UUID
+    ) -> dict[uuid.UUID, tuple[float, int]]:
+        """``{node: (Adamic-Adar weight, shared tag count)}`` via tags."""
+        result = await self.session.execute(
+            select(NodeTag.tag_id, Tag.parent_id)
+            .join(Tag, Tag.id == NodeTag.tag_id)
+            .where(NodeTag.node_id == node_uuid)
+        )
+        tag_weight: dict[uuid.UUID, float] = {}
+        for tag_id, parent_id in result.all():
+            tag_weight[tag_id] = 1.0
+            if parent_id is not None:
+                tag_weight.setdefault(parent_id, _PARENT_TAG_WEIGHT)
+        if not tag_weight:
+            return {}
+
+        # Other nodes with these tags, plus how widely each tag is used.
+        usage = func.count().over(partition_by=NodeTag.tag_id)
+        result = await self.session.execute(
+            select(NodeTag.tag_id, NodeTag.node_id, usage).where(
+                NodeTag.tag_id.in_(tag_weight)
+            )
+        )
+        weights: dict[uuid.UUID, tuple[float, int]] = {}
+        for tag_id, nid, tag_usage in result.all():
+            if nid == node_uuid:
+                continue
+            score, shared = weights.get(nid, (0.0, 0))
+            weight = tag_weight[tag_id] / math.log(1 + tag_usage)
+            weights[nid] = (score + weight, shared + 1)
+        return weights
+
+    async def suggest_connections(
+        self, node_id: uuid.UUID, limit: int = 10
+    ) -> list[EdgeSuggestionItem]:
+        """Structural suggestions only: no LLM, milliseconds per call."""
+        ranked = await self.rank_candidates(node_id, limit)
+        if not ranked:
+            return []
+        nodes_result = await self.session.execute(
+            select(CorpusNode).where(CorpusNode.id.in_([c.node_id for c in ranked]))
+        )
+        nodes_by_id = {n.id: n for n in nodes_result.scalars().all()}
+        return [
+            EdgeSuggestionItem(
+                target_node_id=str(c.node_id),
+                target_node_title=nodes_by_id[c.node_id].title,
+                target_node_type=nodes_by_id[c.node_id].node_type,
+                # Squash the unbounded score into 0..1.
+                confidence=c.score / (c.score + 1),
+                suggested_edge_type=_DEFAULT_EDGE_TYPE,
+                reason=c.reason,
+            )
+            for c in ranked
+            if c.node_id in nodes_by_id
+        ]
+
     async def suggest_edges(
         self,
         node_id: str,
@@ -57,41 +199,10 @@ class EdgeSuggestionService:
         if not source_node:
             return []
 
-        # Get the source node's tags
-        node_tags = await self.tag_repo.get_by_node(node_uuid)
-        if not node_tags:
+        ranked = await self.rank_candidates(node_uuid, max_candidates)
+        if not ranked or self.llm_service is None:
             return []
-
-        tag_ids = {nt.tag_id for nt in node_tags}
-
-        # Also include parent tags for broader matching
-        tag_objects = await self.tag_repo.get_all()
-        tag_by_id = {t.id: t for t in tag_objects}
-        all_tag_ids = set(tag_ids)
-        for tid in tag_ids:
-            tag = tag_by_id.get(tid)
-            if tag and tag.parent_id:
-                all_tag_ids.add(tag.parent_id)
-
-        # Find other nodes sharing these tags
-        tag_node_stmt = select(NodeTag.tag_id, NodeTag.node_id).where(
-            NodeTag.tag_id.in_(all_tag_ids),
-            NodeTag.node_id != node_uuid,
-        )
-        tag_node_result = await self.session.execute(tag_node_stmt)
-
-        node_scores: dict[uuid.UUID, float] = {}
-        for row_tag_id, row_node_id in tag_node_result.all():
-            weight = 1.0 if row_tag_id in tag_ids else 0.7
-            node_scores[row_node_id] = node_scores.get(row_node_id, 0.0) + weight
-
-        if not node_scores:
-            return []
-
-        # Sort by overlap score, take top candidates
-        sorted_candidates = sorted(
-            node_scores.items(), key=lambda x: x[1], reverse=True
-        )[:max_candidates]
+        sorted_candidates = [(c.node_id, c.score) for c in ranked]
 
         # Load candidate nodes
         candidate_ids = [nid for nid, _ in sorted_candidates]
@@ -99,7 +210,7 @@ class EdgeSuggestionService:
         nodes_result = await self.session.execute(nodes_stmt)
         nodes_by_id = {n.id: n for n in nodes_result.scalars().all()}
 
-        # LLM-score top candidates concurrently with overall timeout
+        # LLM-score top candidates in one batched prompt, with overall timeout
         to_score = []
         for nid, _overlap_score in sorted_candidates[:max_llm_scored]:
             target = nodes_by_id.get(nid)
@@ -109,24 +220,16 @@ class EdgeSuggestionService:
         if not to_score:
             return []
 
-        async def _score_one(
-            nid: uuid.UUID, target: CorpusNode
-        ) -> tuple[uuid.UUID, CorpusNode, EdgeRelevanceResult | None]:
-            try:
-                r = await self.llm_service.score_edge_relevance(
+        try:
+            scores = await asyncio.wait_for(
+                self.llm_service.score_edges_batch(
                     source_title=source_node.title,
                     source_description=source_node.description,
-                    target_title=target.title,
-                    target_description=target.description,
-                )
-                return nid, target, r
-            except Exception:
-                logger.exception("LLM scoring failed for edge to %s", nid)
-                return nid, target, None
-
-        try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*[_score_one(nid, t) for nid, t in to_score]),
+                    candidates=[
+                        EdgeCandidate(title=t.title, description=t.description)
+                        for _, t in to_score
+                    ],
+                ),
                 timeout=LLM_SCORING_TIMEOUT_SECONDS,
             )
         except TimeoutError:
@@ -135,12 +238,15 @@ class EdgeSuggestionService:
                 LLM_SCORING_TIMEOUT_SECONDS,
             )
             return []
+        except Exception:
+            logger.exception("LLM scoring failed for edges from %s", node_id)
+            return []
 
         valid_edge_types = await self._get_valid_edge_types()
 
         suggestions: list[EdgeSuggestionItem] = []
-        for nid, target, llm_result in results:
-            if llm_result is None or llm_result.score < 0.3:
+        for (nid, target), llm_result in zip(to_score, scores, strict=True):
+            if llm_result.score < 0.3:
                 continue
             # Validate edge type — fall back to default if LLM returns unknown type
             edge_type = llm_result.suggested_edge_type
@@ -0,0 +1,296 @@
+"""Precomputed graph metrics: degree, PageRank, betweenness, components.
+
+"Which dossiers are the most connected?" and "which nodes are orphaned?"
+used to require loading the full graph client-side.  The background
+worker now computes these metrics over ``corpus_node`` / ``edge`` and
+stores them in ``node_metrics``, so ranking and orphan queries on
+``/api/nodes`` become indexed lookups.
+
+Recomputation is skipped while no node or edge was added, removed or
+updated.  Otherwise every metric is recomputed from scratch (PageRank and
+betweenness depend on the whole graph), and only rows whose values
+actually changed are written back.
+"""
+
+import asyncio
+import logging
+import math
+import random
+from collections import deque
+from dataclasses import astuple, dataclass
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bouwmeester.models.corpus_node import CorpusNode
+from bouwmeester.models.edge import Edge
+from bouwmeester.models.node_metrics import NodeMetrics
+
+logger = logging.getLogger(__name__)
+
+PAGERANK_DAMPING = 0.85
+PAGERANK_MAX_ITERATIONS = 100
+PAGERANK_TOLERANCE = 1e-10
+# Number of BFS sources sampled for the betweenness approximation.
+BETWEENNESS_SAMPLES = 64
+_UPSERT_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class NodeMetricValues:
+    degree: int
+    in_degree: int
+    out_degree: int
+    pagerank: float
+    betweenness: float
+    component_id: int
+    component_size: int
+    is_orphan: bool
+
+
+def compute_graph_metrics(
+    node_ids: list[UUID],
+    edges: list[tuple[UUID, UUID]],
+    *,
+    betweenness_samples: int = BETWEENNESS_SAMPLES,
+    seed: int = 0,
+) -> dict[UUID, NodeMetricValues]:
+    """Compute per-node metrics for a directed multigraph.
+
+    - ``degree`` / ``in_degree`` / ``out_degree`` count edges.
+    - ``pagerank`` follows edge direction; dangling mass is spread evenly.
+    - ``betweenness`` treats the graph as undirected and is estimated with
+      Brandes' algorithm from *betweenness_samples* random sources
+      (exact when the graph is smaller), normalised to ``[0, 1]``.
+    - ``component_id`` numbers undirected connected components by
+      descending size, so component 1 is the largest cluster.
+    """
+    n = len(node_ids)
+    pos = {nid: i for i, nid in enumerate(node_ids)}
+    out_links: list[list[int]] = [[] for _ in range(n)]
+    neighbours: list[set[int]] = [set() for _ in range(n)]
+    in_degree = [0] * n
+    for from_id, to_id in edges:
+        a, b = pos.get(from_id), pos.get(to_id)
+        if a is None or b is None:
+            continue
+        out_links[a].append(b)
+        in_degree[b] += 1
+        if a != b:
+            neighbours[a].add(b)
+            neighbours[b].add(a)
+
+    pagerank = _pagerank(out_links)
+    betweenness = _approximate_betweenness(neighbours, betweenness_samples, seed)
+    component, component_size = _components(neighbours)
+
+    metrics: dict[UUID, NodeMetricValues] = {}
+    for i, nid in enumerate(node_ids):
+        degree = len(out_links[i]) + in_degree[i]
+        metrics[nid] = NodeMetricValues(
+            degree=degree,
+            in_degree=in_degree[i],
+            out_degree=len(out_links[i]),
+            pagerank=pagerank[i],
+            betweenness=betweenness[i],
+            component_id=component[i],
+            component_size=component_size[component[i]],
+            is_orphan=degree == 0,
+        )
+    return metrics
+
+
+def _pagerank(out_links: list[list[int]]) -> list[float]:
+    n = len(out_links)
+    if n == 0:
+        return []
+    rank = [1.0 / n] * n
+    base = (1.0 - PAGERANK_DAMPING) / n
+    for _ in range(PAGERANK_MAX_ITERATIONS):
+        dangling = sum(rank[v] for v in range(n) if not out_links[v])
+        nxt = [base + PAGERANK_DAMPING * dangling / n] * n
+        for v, targets in enumerate(out_links):
+            if targets:
+                share = PAGERANK_DAMPING * rank[v] / len(targets)
+                for w in targets:
+                    nxt[w] += share
+        delta = sum(abs(a - b) for a, b in zip(nxt, rank, strict=True))
+        rank = nxt
+        if delta < PAGERANK_TOLERANCE:
+            break
+    return rank
+
+
+def _approximate_betweenness(
+    neighbours: list[set[int]], samples: int, seed: int
+) -> list[float]:
+    n = len(neighbours)
+    centrality = [0.0] * n
+    if n < 3:
+        return centrality
+    sources = list(range(n))
+    if samples < n:
+        sources = random.Random(seed).sample(sources, samples)
+
+    for s in sources:
+        # Brandes: BFS from s, then accumulate dependencies in reverse.
+        order: list[int] = []
+        preds: list[list[int]] = [[] for _ in range(n)]
+        sigma = [0] * n
+        dist = [-1] * n
+        sigma[s], dist[s] = 1, 0
+        queue = deque([s])
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            for w in neighbours[v]:
+                if dist[w] < 0:
+                    dist[w] = dist[v] + 1
+                    queue.append(w)
+                if dist[w] == dist[v] + 1:
+                    sigma[w] += sigma[v]
+                    preds[w].append(v)
+        delta = [0.0] * n
+        for w in reversed(order):
+            for v in preds[w]:
+                delta[v] += sigma[v] / sigma[w] * (1.0 + delta[w])
+            if w != s:
+                centrality[w] += delta[w]
+
+    # Each undirected pair is counted from both ends when every node is a
+    # source; scale the sample up to the full population and normalise.
+    scale = n / len(sources) / 2.0 / ((n - 1) * (n - 2) / 2.0)
+    return [c * scale for c in centrality]
+
+
+def _components(neighbours: list[set[int]]) -> tuple[list[int], dict[int, int]]:
+    n = len(neighbours)
+    label = [-1] * n
+    members: list[list[int]] = []
+    for start in range(n):
+        if label[start] >= 0:
+            continue
+        label[start] = len(members)
+        group = [start]
+        queue = deque([start])
+        while queue:
+            v = queue.popleft()
+            for w in neighbours[v]:
+                if label[w] < 0:
+                    label[w] = label[start]
+                    group.append(w)
+                    queue.append(w)
+        members.append(group)
+
+    # Renumber 1..k by descending size (ties by first appearance).
+    ranked = sorted(range(len(members)), key=lambda c: -len(members[c]))
+    component_id = [0] * len(members)
+    sizes: dict[int, int] = {}
+    for rank, c in enumerate(ranked, start=1):
+        component_id[c] = rank
+        sizes[rank] = len(members[c])
+    return [component_id[label[v]] for v in range(n)], sizes
+
+
+def _same(a: NodeMetricValues, b: NodeMetricValues) -> bool:
+    return all(
+        math.isclose(x, y, rel_tol=1e-9, abs_tol=1e-12)
+        if isinstance(x, float)
+        else x == y
+        for x, y in zip(astuple(a), astuple(b), strict=True)
+    )
+
+
+# ``(node count, edge count, max node created_at, max edge created_at,
+# max edge updated_at)`` of the graph the stored metrics were computed from
+# (per worker process); lets the worker skip recomputation while nothing
+# changed.
+Signature = tuple[int, int, datetime | None, datetime | None, datetime | None]
+_last_signature: Signature | None = None
+
+
+class GraphMetricsService:
+    """Recomputes ``node_metrics`` when the nodes or edges changed."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def _signature(self) -> Signature:
+        node_stats = select(func.count(), func.max(CorpusNode.created_at)).select_from(
+            CorpusNode
+        )
+        edge_stats = select(
+            func.count(), func.max(Edge.created_at), func.max(Edge.updated_at)
+        ).select_from(Edge)
+        node_count, node_latest = (await self.session.execute(node_stats)).one()
+        edge_count, edge_latest, edge_updated = (
+            await self.session.execute(edge_stats)
+        ).one()
+        return node_count, edge_count, node_latest, edge_latest, edge_updated
+
+    async def refresh(self, *, force: bool = False) -> int | None:
+        """Recompute all metrics if the graph changed since the last run.
+
+        Returns the number of rows written, or ``None`` when skipped
+        because the graph is unchanged since the previous run.  The caller
+        owns the transaction.
+        """
+        global _last_signature  # noqa: PLW0603
+
+        signature = await self._signature()
+        if not force and signature == _last_signature:
+            return None
+
+        node_ids = list((await self.session.execute(select(CorpusNode.id))).scalars())
+        edges = [
+            (row.from_node_id, row.to_node_id)
+            for row in await self.session.execute(
+                select(Edge.from_node_id, Edge.to_node_id)
+            )
+        ]
+        # Pure-Python and CPU bound: keep it off the worker's event loop,
+        # which the import loop shares.
+        metrics = await asyncio.to_thread(compute_graph_metrics, node_ids, edges)
+
+        existing = {
+            row.node_id: NodeMetricValues(
+                degree=row.degree,
+                in_degree=row.in_degree,
+                out_degree=row.out_degree,
+                pagerank=row.pagerank,
+                betweenness=row.betweenness,
+                component_id=row.component_id,
+                component_size=row.component_size,
+                is_orphan=row.is_orphan,
+            )
+            for row in (await self.session.execute(select(NodeMetrics))).scalars()
+        }
+        changed = [
+            {"node_id": nid, **values.__dict__}
+            for nid, values in metrics.items()
+            if nid not in existing or not _same(existing[nid], values)
+        ]
+
+        for start in range(0, len(changed), _UPSERT_BATCH_SIZE):
+            batch = changed[start : start + _UPSERT_BATCH_SIZE]
+            stmt = pg_insert(NodeMetrics).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[NodeMetrics.node_id],
+                set_={
+                    **{col: stmt.excluded[col] for col in batch[0] if col != "node_id"},
+                    "computed_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
+
+        _last_signature = signature
+        logger.info(
+            "Graph metrics: %d nodes, %d edges, %d rows updated",
+            len(node_ids),
+            len(edges),
+            len(changed),
+        )
+        return len(changed)
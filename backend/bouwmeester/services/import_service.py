@@ -11,6 +11,7 @@ from bouwmeester.models.corpus_node import CorpusNode
 from bouwmeester.models.edge import Edge
 from bouwmeester.models.edge_type import EdgeType
 from bouwmeester.models.politieke_input import PolitiekeInput
+from bouwmeester.repositories.edge_closure import EdgeClosureRepository
 from bouwmeester.schema.import_export import ImportResult
 
 
@@ -251,6 +252,9 @@ class ImportService:
                 )
                 self.session.add(edge)
                 await self.session.flush()
+                await EdgeClosureRepository(self.session).add_edge(
+                    edge.from_node_id, edge.to_node_id, edge.edge_type_id
+                )
 
                 imported += 1
 
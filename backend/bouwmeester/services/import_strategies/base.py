@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import date
+from datetime import date, datetime
 
 
 @dataclass
@@ -22,6 +22,8 @@ class FetchedItem:
     ministerie: str | None = None
     extra_data: dict | None = None
     raw_api_response: dict | None = None
+    # API modification time; drives the per-type import watermark.
+    gewijzigd_op: datetime | None = None
 
 
 class ImportStrategy(ABC):
@@ -53,7 +55,7 @@ class ImportStrategy(ABC):
     def supports_ek(self) -> bool:
         """Whether this type exists in the Eerste Kamer API.
 
-        When False, _import_type skips polling EK entirely.
+        When False, the import cycle skips polling EK entirely.
         """
         return True
 
@@ -72,10 +74,13 @@ class ImportStrategy(ABC):
     async def fetch_items(
         self,
         client: object,
-        since: date | None,
+        since: datetime | None,
         limit: int,
     ) -> list[FetchedItem]:
-        """Fetch items from the parliamentary API."""
+        """Fetch items from the parliamentary API.
+
+        With *since*, only items changed after it are fetched, oldest first.
+        """
         ...
 
     def calculate_deadline(self, item: FetchedItem) -> date | None:
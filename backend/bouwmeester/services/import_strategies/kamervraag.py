@@ -1,6 +1,6 @@
 """Kamervraag import strategy — fetches schriftelijke vragen from TK."""
 
-from datetime import date, datetime
+from datetime import datetime
 
 from bouwmeester.services.import_strategies.base import FetchedItem, ImportStrategy
 from bouwmeester.services.tk_api_client import TweedeKamerClient
@@ -36,17 +36,16 @@ class KamervraagStrategy(ImportStrategy):
     async def fetch_items(
         self,
         client: object,
-        since: date | None,
+        since: datetime | None,
         limit: int,
     ) -> list[FetchedItem]:
         if not isinstance(client, TweedeKamerClient):
             return []
 
-        since_dt = datetime.combine(since, datetime.min.time()) if since else None
         effective_limit = min(limit, MAX_KAMERVRAAG_FETCH)
         zaken = await client.fetch_zaak_by_soort(
             soort="Schriftelijke vragen",
-            since=since_dt,
+            since=since,
             limit=effective_limit,
         )
         return [
@@ -61,6 +60,7 @@ class KamervraagStrategy(ImportStrategy):
                 document_url=z.document_url,
                 bron=z.bron,
                 deadline=z.termijn.date() if z.termijn else None,
+                gewijzigd_op=z.gewijzigd_op,
             )
             for z in zaken
         ]
@@ -1,6 +1,6 @@
 """Motie import strategy — fetches adopted moties from TK/EK."""
 
-from datetime import date, datetime
+from datetime import datetime
 
 from bouwmeester.services.import_strategies.base import FetchedItem, ImportStrategy
 from bouwmeester.services.tk_api_client import TweedeKamerClient
@@ -20,11 +20,10 @@ class MotieStrategy(ImportStrategy):
     async def fetch_items(
         self,
         client: TweedeKamerClient,
-        since: date | None,
+        since: datetime | None,
         limit: int,
     ) -> list[FetchedItem]:
-        since_dt = datetime.combine(since, datetime.min.time()) if since else None
-        moties = await client.fetch_moties(since=since_dt, limit=limit)
+        moties = await client.fetch_moties(since=since, limit=limit)
         return [
             FetchedItem(
                 zaak_id=m.zaak_id,
@@ -36,6 +35,7 @@ class MotieStrategy(ImportStrategy):
                 document_tekst=m.document_tekst,
                 document_url=m.document_url,
                 bron=m.bron,
+                gewijzigd_op=m.gewijzigd_op,
             )
             for m in moties
         ]
@@ -1,6 +1,6 @@
 """Toezegging import strategy — fetches government commitments from TK."""
 
-from datetime import date, datetime
+from datetime import datetime
 
 from bouwmeester.services.import_strategies.base import FetchedItem, ImportStrategy
 from bouwmeester.services.tk_api_client import TweedeKamerClient
@@ -39,16 +39,15 @@ class ToezeggingStrategy(ImportStrategy):
     async def fetch_items(
         self,
         client: object,
-        since: date | None,
+        since: datetime | None,
         limit: int,
     ) -> list[FetchedItem]:
         if not isinstance(client, TweedeKamerClient):
             return []
 
-        since_dt = datetime.combine(since, datetime.min.time()) if since else None
         toezeggingen = await client.fetch_toezeggingen(
             ministerie=BZK_MINISTERIE,
-            since=since_dt,
+            since=since,
             limit=limit,
         )
         return [
@@ -66,6 +65,7 @@ class ToezeggingStrategy(ImportStrategy):
                     "status": t.status,
                     "activiteit_nummer": t.activiteit_nummer,
                 },
+                gewijzigd_op=t.gewijzigd_op,
             )
             for t in toezeggingen
         ]
@@ -3,9 +3,11 @@
 from bouwmeester.services.llm.base import (
     BaseLLMService,
     DataSensitivity,
+    EdgeCandidate,
     EdgeRelevanceResult,
     ProviderCapabilities,
     SummarizeResult,
+    TagExtractionInput,
     TagExtractionResult,
     TagSuggestionResult,
 )
@@ -18,9 +20,11 @@ from bouwmeester.services.llm.factory import (
 __all__ = [
     "BaseLLMService",
     "DataSensitivity",
+    "EdgeCandidate",
     "EdgeRelevanceResult",
     "ProviderCapabilities",
     "SummarizeResult",
+    "TagExtractionInput",
     "TagExtractionResult",
     "TagSuggestionResult",
     "clear_config_cache",
@@ -1,11 +1,18 @@
 """Abstract base class for LLM providers with capability-based data classification."""
 
+import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from enum import StrEnum
+from functools import partial
+from typing import TYPE_CHECKING
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+
+if TYPE_CHECKING:
+    from bouwmeester.services.llm.cache import LLMResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -48,10 +55,29 @@ class SummarizeResult(BaseModel):
     summary: str
 
 
+class TagExtractionInput(BaseModel):
+    """One parliamentary item for :meth:`BaseLLMService.extract_tags_batch`."""
+
+    titel: str
+    onderwerp: str
+    document_tekst: str | None = None
+
+
+class EdgeCandidate(BaseModel):
+    """One target node for :meth:`BaseLLMService.score_edges_batch`."""
+
+    title: str
+    description: str | None = None
+
+
 class BaseLLMService(ABC):
     """Abstract base for all LLM providers."""
 
     capabilities: ProviderCapabilities
+    # Model identifier, part of the cache key.
+    _model: str = ""
+    # Persistent response cache, attached by the factory.
+    cache: "LLMResultCache | None" = None
 
     def _parse_json(self, content: str) -> dict:
         """Parse JSON from LLM response, handling markdown code blocks."""
@@ -61,11 +87,64 @@ class BaseLLMService(ABC):
             content = content.split("```")[1].split("```")[0]
         return json.loads(content.strip())
 
+    def _parse_batch(self, content: str, count: int) -> dict[int, dict]:
+        """Entries of a batched answer, keyed by their 1-based item number.
+
+        Raises if the answer as a whole is unusable.  Malformed or unknown
+        entries are dropped, so those items fall back to a single call.
+        """
+        data = self._parse_json(content)
+        entries = data.get("items") if isinstance(data, dict) else None
+        if not isinstance(entries, list):
+            raise ValueError("Batch-antwoord zonder items-lijst")
+        parsed: dict[int, dict] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                nummer = int(entry.get("item"))
+            except (TypeError, ValueError):
+                continue
+            if 1 <= nummer <= count:
+                parsed.setdefault(nummer, entry)
+        return parsed
+
     @abstractmethod
     async def _complete(self, prompt: str, max_tokens: int = 1024) -> str:
         """Send a prompt to the LLM and return the text response."""
         ...
 
+    async def _complete_cached[T](
+        self,
+        operation: str,
+        prompt: str,
+        parse: Callable[[str], T],
+        max_tokens: int = 1024,
+    ) -> T:
+        """``parse(_complete(prompt))``, answered from the cache if possible.
+
+        Only responses that *parse* accepts are stored, so a malformed
+        answer is retried next time instead of being served until expiry.
+        """
+        if self.cache is None:
+            return parse(await self._complete(prompt, max_tokens))
+
+        from bouwmeester.services.llm.cache import cache_key
+
+        model = f"{type(self).__name__}:{self._model}"
+        key = cache_key(operation, model, prompt)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            try:
+                return parse(cached)
+            except Exception:
+                logger.warning("Ongeldige LLM-cache-entry voor %s", operation)
+
+        text = await self._complete(prompt, max_tokens)
+        result = parse(text)
+        await self.cache.put(key, operation, model, text)
+        return result
+
     async def extract_tags(
         self,
         titel: str,
@@ -89,8 +168,9 @@ class BaseLLMService(ABC):
             context_hint=context_hint,
         )
         try:
-            text = await self._complete(prompt)
-            result = self._parse_json(text)
+            result = await self._complete_cached(
+                "extract_tags", prompt, self._parse_json
+            )
             return TagExtractionResult(
                 matched_tags=result.get("matched_tags", []),
                 suggested_new_tags=result.get("suggested_new_tags", []),
@@ -104,6 +184,75 @@ class BaseLLMService(ABC):
                 samenvatting="Tag-extractie mislukt",
             )
 
+    async def extract_tags_batch(
+        self,
+        items: list[TagExtractionInput],
+        bestaande_tags: list[str],
+        context_hint: str = "motie",
+    ) -> list[TagExtractionResult]:
+        """:meth:`extract_tags` for many items, sending the tag list once.
+
+        Items are batched per prompt by count and document length (see
+        :func:`~bouwmeester.services.llm.prompts.batch_chunks`).  Items
+        missing from the answer, or with a malformed entry, are extracted
+        one by one, concurrently.  Results are in the order of *items*.
+        """
+        from bouwmeester.services.llm.prompts import (
+            batch_chunks,
+            build_extract_tags_batch_prompt,
+        )
+
+        results: list[TagExtractionResult] = []
+        for chunk in batch_chunks(items, lambda i: i.document_tekst):
+            entries: dict[int, dict] = {}
+            if len(chunk) > 1:
+                prompt = build_extract_tags_batch_prompt(
+                    items=[(i.titel, i.onderwerp, i.document_tekst) for i in chunk],
+                    bestaande_tags=bestaande_tags,
+                    context_hint=context_hint,
+                )
+                try:
+                    entries = await self._complete_cached(
+                        "extract_tags_batch",
+                        prompt,
+                        partial(self._parse_batch, count=len(chunk)),
+                        max_tokens=256 + 300 * len(chunk),
+                    )
+                except Exception:
+                    logger.exception("Fout bij gebundelde LLM tag-extractie")
+
+            chunk_results: list[TagExtractionResult | None] = []
+            for nummer in range(1, len(chunk) + 1):
+                result = None
+                if entry := entries.get(nummer):
+                    try:
+                        result = TagExtractionResult(
+                            matched_tags=entry.get("matched_tags", []),
+                            suggested_new_tags=entry.get("suggested_new_tags", []),
+                            samenvatting=entry.get("samenvatting", ""),
+                        )
+                    except ValidationError:
+                        logger.warning("Ongeldig batch-antwoord voor item %d", nummer)
+                chunk_results.append(result)
+
+            missing = [i for i, r in enumerate(chunk_results) if r is None]
+            singles = await asyncio.gather(
+                *(
+                    self.extract_tags(
+                        titel=chunk[i].titel,
+                        onderwerp=chunk[i].onderwerp,
+                        document_tekst=chunk[i].document_tekst,
+                        bestaande_tags=bestaande_tags,
+                        context_hint=context_hint,
+                    )
+                    for i in missing
+                )
+            )
+            for i, result in zip(missing, singles, strict=True):
+                chunk_results[i] = result
+            results.extend(r for r in chunk_results if r is not None)
+        return results
+
     async def suggest_tags(
         self,
         title: str,
@@ -121,8 +270,9 @@ class BaseLLMService(ABC):
             bestaande_tags=bestaande_tags,
         )
         try:
-            text = await self._complete(prompt)
-            result = self._parse_json(text)
+            result = await self._complete_cached(
+                "suggest_tags", prompt, self._parse_json
+            )
             return TagSuggestionResult(
                 matched_tags=result.get("matched_tags", []),
                 suggested_new_tags=result.get("suggested_new_tags", []),
@@ -148,8 +298,9 @@ class BaseLLMService(ABC):
             target_description=target_description,
         )
         try:
-            text = await self._complete(prompt)
-            result = self._parse_json(text)
+            result = await self._complete_cached(
+                "score_edge_relevance", prompt, self._parse_json
+            )
             return EdgeRelevanceResult(
                 score=float(result.get("score", 0.0)),
                 suggested_edge_type=result.get(
@@ -165,6 +316,79 @@ class BaseLLMService(ABC):
                 reason="Scoring mislukt",
             )
 
+    async def score_edges_batch(
+        self,
+        source_title: str,
+        source_description: str | None,
+        candidates: list[EdgeCandidate],
+    ) -> list[EdgeRelevanceResult]:
+        """:meth:`score_edge_relevance` for all candidates of one source.
+
+        Candidates missing from the answer, or with a malformed entry, are
+        scored one by one, concurrently, so a bad answer costs one extra
+        round trip rather than one per candidate.  Results are in the order
+        of *candidates*.
+        """
+        from bouwmeester.services.llm.prompts import (
+            MAX_ITEMS_PER_BATCH,
+            build_edge_relevance_batch_prompt,
+        )
+
+        results: list[EdgeRelevanceResult] = []
+        for start in range(0, len(candidates), MAX_ITEMS_PER_BATCH):
+            chunk = candidates[start : start + MAX_ITEMS_PER_BATCH]
+            entries: dict[int, dict] = {}
+            if len(chunk) > 1:
+                prompt = build_edge_relevance_batch_prompt(
+                    source_title=source_title,
+                    source_description=source_description,
+                    targets=[(c.title, c.description) for c in chunk],
+                )
+                try:
+                    entries = await self._complete_cached(
+                        "score_edges_batch",
+                        prompt,
+                        partial(self._parse_batch, count=len(chunk)),
+                        max_tokens=256 + 150 * len(chunk),
+                    )
+                except Exception:
+                    logger.exception("Fout bij gebundelde LLM edge-scoring")
+
+            chunk_results: list[EdgeRelevanceResult | None] = []
+            for nummer in range(1, len(chunk) + 1):
+                result = None
+                if entry := entries.get(nummer):
+                    try:
+                        result = EdgeRelevanceResult(
+                            score=float(entry.get("score", 0.0)),
+                            suggested_edge_type=entry.get(
+                                "suggested_edge_type", "gerelateerd_aan"
+                            ),
+                            reason=entry.get("reason", ""),
+                        )
+                    except (TypeError, ValueError):
+                        logger.warning(
+                            "Ongeldig batch-antwoord voor kandidaat %d", nummer
+                        )
+                chunk_results.append(result)
+
+            missing = [i for i, r in enumerate(chunk_results) if r is None]
+            singles = await asyncio.gather(
+                *(
+                    self.score_edge_relevance(
+                        source_title=source_title,
+                        source_description=source_description,
+                        target_title=chunk[i].title,
+                        target_description=chunk[i].description,
+                    )
+                    for i in missing
+                )
+            )
+            for i, result in zip(missing, singles, strict=True):
+                chunk_results[i] = result
+            results.extend(r for r in chunk_results if r is not None)
+        return results
+
     async def summarize(
         self,
         text: str,
@@ -175,8 +399,10 @@ class BaseLLMService(ABC):
 
         prompt = build_summarize_prompt(text=text, max_words=max_words)
         try:
-            response = await self._complete(prompt, max_tokens=512)
-            return SummarizeResult(summary=response.strip())
+            summary = await self._complete_cached(
+                "summarize", prompt, str.strip, max_tokens=512
+            )
+            return SummarizeResult(summary=summary)
         except Exception:
             logger.exception("Fout bij LLM samenvatting")
             return SummarizeResult(summary="Samenvatting mislukt")
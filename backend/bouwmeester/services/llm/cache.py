@@ -0,0 +1,126 @@
+"""Persistent, content-addressed cache for LLM responses.
+
+Entries are keyed by a sha256 of (operation, model, prompt), so identical
+requests (e.g. re-extracting tags for an unchanged item, or re-scoring the
+same node pair) are answered from the ``llm_cache`` table instead of the
+provider.  Entries expire after a TTL; every so many writes, expired rows
+and the least recently used rows beyond the size limit are deleted.
+
+The cache runs on its own short sessions so a hit or a write never joins
+the caller's transaction.  Database errors are logged and treated as a
+miss: the cache may make a call cheaper, never make it fail.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from datetime import timedelta
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bouwmeester.models.llm_cache import LLMCacheEntry
+
+logger = logging.getLogger(__name__)
+
+# Run eviction after this many writes.
+EVICT_EVERY = 100
+
+
+def cache_key(operation: str, model: str, prompt: str) -> str:
+    """Content address of one LLM request."""
+    payload = json.dumps([operation, model, prompt], ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResultCache:
+    """Read-through cache of LLM responses in the ``llm_cache`` table."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        ttl_seconds: float,
+        max_entries: int,
+    ) -> None:
+        self._session_factory = session_factory
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._max_entries = max_entries
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters of this process."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    async def get(self, key: str) -> str | None:
+        """The cached response for *key*, or None; counts the hit."""
+        stmt = (
+            update(LLMCacheEntry)
+            .where(LLMCacheEntry.key == key, LLMCacheEntry.expires_at > func.now())
+            .values(hit_count=LLMCacheEntry.hit_count + 1, last_used_at=func.now())
+            .returning(LLMCacheEntry.response)
+        )
+        try:
+            async with self._session_factory() as session:
+                response = (await session.execute(stmt)).scalar_one_or_none()
+                await session.commit()
+        except SQLAlchemyError:
+            logger.exception("LLM cache lookup failed")
+            response = None
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return response
+
+    async def put(self, key: str, operation: str, model: str, response: str) -> None:
+        """Store *response* under *key*, replacing any older entry."""
+        stmt = pg_insert(LLMCacheEntry).values(
+            key=key,
+            operation=operation,
+            model=model,
+            response=response,
+            expires_at=func.now() + self._ttl,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={
+                "response": stmt.excluded.response,
+                "expires_at": stmt.excluded.expires_at,
+                "created_at": func.now(),
+                "last_used_at": func.now(),
+            },
+        )
+        self._writes += 1
+        try:
+            async with self._session_factory() as session:
+                await session.execute(stmt)
+                if self._writes % EVICT_EVERY == 0:
+                    await self._evict(session)
+                await session.commit()
+        except SQLAlchemyError:
+            logger.exception("LLM cache write failed")
+
+    async def _evict(self, session: AsyncSession) -> None:
+        """Delete expired rows and the least recently used beyond the limit."""
+        beyond_limit = (
+            select(LLMCacheEntry.key)
+            .order_by(LLMCacheEntry.last_used_at.desc())
+            .offset(self._max_entries)
+        )
+        result = await session.execute(
+            delete(LLMCacheEntry).where(
+                or_(
+                    LLMCacheEntry.expires_at <= func.now(),
+                    LLMCacheEntry.key.in_(beyond_limit),
+                )
+            )
+        )
+        logger.info(
+            f"LLM cache: evicted {result.rowcount} entries "
+            f"({self.hits} hits, {self.misses} misses in this process)"
+        )
@@ -5,7 +5,9 @@ Settings are read from:
 2. Environment variables / config.py settings (fallback)
 
 Service instances and config are cached in memory. The cache is cleared
-when an admin updates config via the admin panel.
+when an admin updates config via the admin panel.  LLM responses are cached
+separately in the database (see ``cache.py``); that cache is shared by all
+providers and survives config changes, since the model is part of its key.
 
 NOTE: Caches are per-process. In a multi-worker deployment, only the worker
 that handles the admin config update will have its cache cleared immediately.
@@ -21,6 +23,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from bouwmeester.core.config import get_settings
 from bouwmeester.services.llm.base import BaseLLMService, DataSensitivity
+from bouwmeester.services.llm.cache import LLMResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,7 @@ _config_cache: dict[str, str] | None = None
 _claude_cache: BaseLLMService | None = None
 _vlam_cache: BaseLLMService | None = None
 _services_built = False
+_result_cache: LLMResultCache | None = None
 
 
 def clear_config_cache() -> None:
@@ -92,9 +96,31 @@ async def _ensure_services(db: AsyncSession) -> None:
             api_key=vlam_key, base_url=vlam_url, model=vlam_model
         )
 
+    result_cache = get_result_cache()
+    for service in (_claude_cache, _vlam_cache):
+        if service is not None:
+            service.cache = result_cache
+
     _services_built = True
 
 
+def get_result_cache() -> LLMResultCache | None:
+    """The process-wide LLM response cache, or None when disabled."""
+    global _result_cache  # noqa: PLW0603
+    settings = get_settings()
+    if settings.LLM_CACHE_TTL_SECONDS <= 0:
+        return None
+    if _result_cache is None:
+        from bouwmeester.core.database import async_session
+
+        _result_cache = LLMResultCache(
+            async_session,
+            ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+        )
+    return _result_cache
+
+
 async def get_llm_service(
     db: AsyncSession,
 ) -> BaseLLMService | None:
@@ -1,11 +1,17 @@
 """Shared prompt templates for BZK policy domain (Dutch)."""
 
 import json
+from collections.abc import Callable, Iterator
 
 # Maximum number of tags to include in prompts to control token usage.
 MAX_TAGS_IN_PROMPT = 200
 MAX_TEXT_IN_PROMPT = 10000
 MAX_DESCRIPTION_IN_PROMPT = 500
+# Batched prompts: items per prompt, and document text per prompt.  Each
+# item keeps the single-item cap; long items just share a batch with fewer
+# others (see batch_chunks).
+MAX_ITEMS_PER_BATCH = 10
+MAX_TEXT_PER_BATCH = 20000
 
 _TYPE_LABELS: dict[str, str] = {
     "motie": "aangenomen motie",
@@ -31,6 +37,31 @@ _NODE_TYPE_LABELS: dict[str, str] = {
 }
 
 
+def batch_chunks[T](
+    items: list[T], text: Callable[[T], str | None]
+) -> Iterator[list[T]]:
+    """Split *items* into consecutive batches for one prompt each.
+
+    A batch holds at most ``MAX_ITEMS_PER_BATCH`` items and at most
+    ``MAX_TEXT_PER_BATCH`` characters of *text* (counted after the
+    ``MAX_TEXT_IN_PROMPT`` cut); an item that alone fills it gets a batch
+    of its own.
+    """
+    chunk: list[T] = []
+    length = 0
+    for item in items:
+        size = min(len(text(item) or ""), MAX_TEXT_IN_PROMPT)
+        if chunk and (
+            len(chunk) == MAX_ITEMS_PER_BATCH or length + size > MAX_TEXT_PER_BATCH
+        ):
+            yield chunk
+            chunk, length = [], 0
+        chunk.append(item)
+        length += size
+    if chunk:
+        yield chunk
+
+
 def build_extract_tags_prompt(
     titel: str,
     onderwerp: str,
@@ -81,6 +112,60 @@ def build_extract_tags_prompt(
     )
 
 
+def build_extract_tags_batch_prompt(
+    items: list[tuple[str, str, str | None]],
+    bestaande_tags: list[str],
+    context_hint: str = "motie",
+) -> str:
+    """One prompt for several ``(titel, onderwerp, document_tekst)`` items.
+
+    The tag list is sent once; the answer holds one entry per item,
+    identified by its 1-based number.
+    """
+    type_label = _TYPE_LABELS.get(context_hint, context_hint)
+    blocks = []
+    for nummer, (titel, onderwerp, document_tekst) in enumerate(items, start=1):
+        block = f"ITEM {nummer}:\nTITEL: {titel}\nONDERWERP: {onderwerp}"
+        if document_tekst:
+            block += f"\nDOCUMENTTEKST:\n{document_tekst[:MAX_TEXT_IN_PROMPT]}"
+        blocks.append(block)
+
+    tags_json = json.dumps(bestaande_tags[:MAX_TAGS_IN_PROMPT], ensure_ascii=False)
+    return (
+        "Je bent een beleidsanalist van het ministerie van BZK"
+        " (Binnenlandse Zaken en Koninkrijksrelaties)."
+        f" Analyseer elk van de volgende {len(items)} items"
+        f" (elk een {type_label}) en bepaal per item welke"
+        " beleidstags relevant zijn.\n\n"
+        + "\n\n".join(blocks)
+        + f"\n\nBESTAANDE TAGS IN HET SYSTEEM:\n{tags_json}\n\n"
+        "Instructies (per item):\n"
+        "- Selecteer ALLEEN tags die specifiek relevant"
+        " zijn voor dat item\n"
+        "- Vermijd te brede/generieke tags — gebruik de"
+        " meest specifieke subtag\n"
+        "- Stel maximaal 3 nieuwe tags voor als de"
+        " bestaande tags het onderwerp niet dekken\n"
+        "- Nieuwe tags moeten het hiërarchische"
+        " pad-formaat volgen"
+        ' (bijv. "digitalisering/AI/privacy")\n'
+        "- Geef een korte samenvatting (max 2 zinnen)"
+        " van wat het item vraagt en waarom\n\n"
+        "Geef je analyse als JSON met precies één entry per item"
+        " (en ALLEEN JSON, geen andere tekst):\n"
+        "{\n"
+        '  "items": [\n'
+        "    {\n"
+        '      "item": 1,\n'
+        '      "samenvatting": "...",\n'
+        '      "matched_tags": ["specifieke/tag1"],\n'
+        '      "suggested_new_tags": ["nieuwe/specifieke/tag"]\n'
+        "    }\n"
+        "  ]\n"
+        "}"
+    )
+
+
 def build_suggest_tags_prompt(
     title: str,
     description: str | None,
@@ -160,6 +245,53 @@ def build_edge_relevance_prompt(
     )
 
 
+def build_edge_relevance_batch_prompt(
+    source_title: str,
+    source_description: str | None,
+    targets: list[tuple[str, str | None]],
+) -> str:
+    """Score all ``(title, description)`` targets against one source node."""
+    source = f"TITEL: {source_title}"
+    if source_description:
+        source += f"\nBESCHRIJVING: {source_description[:MAX_DESCRIPTION_IN_PROMPT]}"
+
+    blocks = []
+    for nummer, (title, description) in enumerate(targets, start=1):
+        block = f"KANDIDAAT {nummer}:\nTITEL: {title}"
+        if description:
+            block += f"\nBESCHRIJVING: {description[:MAX_DESCRIPTION_IN_PROMPT]}"
+        blocks.append(block)
+
+    return (
+        "Je bent een beleidsanalist van het ministerie van BZK."
+        " Beoordeel voor elke kandidaat of er een inhoudelijke"
+        " relatie bestaat met de bronnode.\n\n"
+        f"BRONNODE:\n{source}\n\n"
+        + "\n\n".join(blocks)
+        + "\n\nInstructies (per kandidaat):\n"
+        "- Geef een score van 0.0 (geen relatie) tot"
+        " 1.0 (sterk gerelateerd)\n"
+        "- Stel een relatietype voor uit:"
+        " implementeert, draagt_bij_aan, vloeit_voort_uit,"
+        " conflicteert_met, verwijst_naar, vereist,"
+        " evalueert, vervangt, onderdeel_van,"
+        " leidt_tot, adresseert, meet\n"
+        "- Geef een korte reden in het Nederlands\n\n"
+        "Geef je analyse als JSON met precies één entry per kandidaat"
+        " (en ALLEEN JSON, geen andere tekst):\n"
+        "{\n"
+        '  "items": [\n'
+        "    {\n"
+        '      "item": 1,\n'
+        '      "score": 0.8,\n'
+        '      "suggested_edge_type": "draagt_bij_aan",\n'
+        '      "reason": "Beide nodes gaan over ..."\n'
+        "    }\n"
+        "  ]\n"
+        "}"
+    )
+
+
 def build_summarize_prompt(text: str, max_words: int = 100) -> str:
     return (
         "Je bent een beleidsanalist van het ministerie van BZK."
@@ -6,6 +6,7 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from bouwmeester.core.mention_index import get_mention_index
 from bouwmeester.models.corpus_node import CorpusNode
 from bouwmeester.models.mention import Mention
 from bouwmeester.models.task import Task
@@ -172,69 +173,21 @@ class MentionService:
     async def search_mentionables(
         self, query: str, types: list[str] | None = None, limit: int = 10
     ) -> list[MentionSearchResult]:
-        """Search across nodes, tasks, and tags for # mention suggestions."""
-        results: list[MentionSearchResult] = []
-        allowed = types or ["node", "task", "tag"]
-        pattern = f"%{query}%"
-
-        if "node" in allowed:
-            stmt = (
-                select(CorpusNode)
-                .where(CorpusNode.title.ilike(pattern))
-                .order_by(CorpusNode.title)
-                .limit(limit)
-            )
-            rows = await self.session.execute(stmt)
-            for n in rows.scalars().all():
-                results.append(
-                    MentionSearchResult(
-                        id=str(n.id),
-                        label=n.title,
-                        type="node",
-                        subtitle=n.node_type.replace("_", " "),
-                    )
-                )
-
-        if "task" in allowed:
-            stmt = (
-                select(Task)
-                .where(Task.title.ilike(pattern))
-                .order_by(Task.title)
-                .limit(limit)
-            )
-            rows = await self.session.execute(stmt)
-            for t in rows.scalars().all():
-                results.append(
-                    MentionSearchResult(
-                        id=str(t.id),
-                        label=t.title,
-                        type="task",
-                        subtitle=t.status.replace("_", " ") if t.status else None,
-                    )
-                )
+        """Search nodes, tasks and tags (or people) for mention suggestions.
 
-        if "tag" in allowed:
-            from bouwmeester.models.tag import Tag
-
-            stmt = (
-                select(Tag)
-                .where(Tag.name.ilike(pattern))
-                .order_by(Tag.name)
-                .limit(limit)
+        Served from the in-process :mod:`~bouwmeester.core.mention_index`;
+        the database is only consulted when the index is due a refresh.
+        """
+        index = await get_mention_index(self.session)
+        return [
+            MentionSearchResult(
+                id=str(entry.id),
+                label=entry.label,
+                type=entry.type,
+                subtitle=entry.subtitle,
             )
-            rows = await self.session.execute(stmt)
-            for tag in rows.scalars().all():
-                results.append(
-                    MentionSearchResult(
-                        id=str(tag.id),
-                        label=tag.name,
-                        type="tag",
-                    )
-                )
-
-        # Sort combined results by label and limit
-        results.sort(key=lambda r: r.label.lower())
-        return results[:limit]
+            for entry in index.search(query, types or ["node", "task", "tag"], limit)
+        ]
 
 
 def _walk_tiptap(node: dict | list, mentions: list[dict]) -> None:
@@ -1,9 +1,13 @@
 """Service layer for CorpusNode operations."""
 
+from datetime import date
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from bouwmeester.core.duplicate_index import get_duplicate_index
+from bouwmeester.core.similarity_index import get_similarity_index
 from bouwmeester.models.beleidskader import Beleidskader
 from bouwmeester.models.bron import Bron
 from bouwmeester.models.corpus_node import CorpusNode
@@ -31,8 +35,19 @@ class NodeService:
         skip: int = 0,
         limit: int = 100,
         node_type: str | None = None,
+        *,
+        sort_by: str | None = None,
+        orphan: bool | None = None,
+        component_id: int | None = None,
     ) -> list[CorpusNode]:
-        return await self.repo.get_all(skip=skip, limit=limit, node_type=node_type)
+        return await self.repo.get_all(
+            skip=skip,
+            limit=limit,
+            node_type=node_type,
+            sort_by=sort_by,
+            orphan=orphan,
+            component_id=component_id,
+        )
 
     async def create(self, data: CorpusNodeCreate) -> CorpusNode:
         node = await self.repo.create(data)
@@ -64,8 +79,60 @@ class NodeService:
     async def get_neighbors(self, id: UUID) -> dict:
         return await self.repo.get_neighbors(id)
 
-    async def get_graph(self, node_id: UUID, depth: int = 2) -> dict:
-        return await self.repo.get_graph(node_id, depth)
+    async def get_similar(
+        self, id: UUID, limit: int = 10
+    ) -> list[tuple[CorpusNode, float]]:
+        """Nodes whose text is most similar to node *id* (local TF-IDF)."""
+        index = await get_similarity_index(self.session)
+        ranked = index.similar(id, limit)
+        if not ranked:
+            return []
+        result = await self.session.execute(
+            select(CorpusNode).where(CorpusNode.id.in_([nid for nid, _ in ranked]))
+        )
+        nodes = {n.id: n for n in result.scalars()}
+        # Nodes deleted since the last index refresh are skipped.
+        return [(nodes[nid], score) for nid, score in ranked if nid in nodes]
+
+    async def get_duplicate_groups(
+        self, min_similarity: float
+    ) -> list[tuple[list[CorpusNode], float]]:
+        """Clusters of near-duplicate nodes (MinHash LSH), best first."""
+        index = await get_duplicate_index(self.session)
+        groups = index.groups(min_similarity)
+        if not groups:
+            return []
+        ids = {nid for members, _ in groups for nid in members}
+        result = await self.session.execute(
+            select(CorpusNode).where(CorpusNode.id.in_(ids))
+        )
+        nodes = {n.id: n for n in result.scalars()}
+        report = []
+        for members, score in groups:
+            # Nodes deleted since the last index refresh are skipped.
+            found = [nodes[nid] for nid in members if nid in nodes]
+            if len(found) > 1:
+                report.append((found, score))
+        return report
+
+    async def get_graph(
+        self,
+        node_id: UUID,
+        depth: int = 2,
+        *,
+        max_nodes: int = 500,
+        edge_types: list[str] | None = None,
+        node_types: list[str] | None = None,
+        as_of: date | None = None,
+    ) -> dict:
+        return await self.repo.get_graph(
+            node_id,
+            depth,
+            max_nodes=max_nodes,
+            edge_types=edge_types,
+            node_types=node_types,
+            as_of=as_of,
+        )
 
     async def count(self, node_type: str | None = None) -> int:
         return await self.repo.count(node_type)
@@ -5,6 +5,7 @@ matches tags to existing corpus nodes, creates CorpusNode + PolitiekeInput
 records, creates suggested edges, and sends notifications.
 """
 
+import asyncio
 import logging
 import uuid
 from collections import Counter
@@ -15,12 +16,16 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bouwmeester.core.config import get_settings
+from bouwmeester.core.duplicate_index import check_node
 from bouwmeester.models.corpus_node import CorpusNode
 from bouwmeester.models.node_stakeholder import NodeStakeholder
 from bouwmeester.models.parlementair_item import ParlementairItem, SuggestedEdge
 from bouwmeester.models.person import Person
 from bouwmeester.models.politieke_input import PolitiekeInput
+from bouwmeester.models.tag import NodeTag
 from bouwmeester.models.task import Task
+from bouwmeester.repositories.corpus_node import CorpusNodeRepository
+from bouwmeester.repositories.import_watermark import ImportWatermarkRepository
 from bouwmeester.repositories.parlementair_item import (
     ParlementairItemRepository,
     SuggestedEdgeRepository,
@@ -29,18 +34,103 @@ from bouwmeester.repositories.tag import TagRepository
 from bouwmeester.schema.tag import TagCreate
 from bouwmeester.services.import_strategies.base import FetchedItem, ImportStrategy
 from bouwmeester.services.import_strategies.registry import get_strategy
-from bouwmeester.services.llm import get_llm_service
+from bouwmeester.services.llm import (
+    TagExtractionInput,
+    TagExtractionResult,
+    get_llm_service,
+)
 from bouwmeester.services.notification_service import NotificationService
-from bouwmeester.services.tk_api_client import EersteKamerClient, TweedeKamerClient
+from bouwmeester.services.tk_api_client import (
+    EersteKamerClient,
+    TweedeKamerClient,
+    create_http_client,
+)
 
 logger = logging.getLogger(__name__)
 
+# New items per transaction; each item still gets its own savepoint.
+IMPORT_CHUNK_SIZE = 20
+
+_CHAMBERS = {"tweede_kamer": "Tweede Kamer", "eerste_kamer": "Eerste Kamer"}
+
+# Import cycles a failing item may hold the watermark back before it is
+# skipped; it is picked up again if the source record changes.
+IMPORT_MAX_ATTEMPTS = 3
+
+# zaak_id -> consecutive failed import cycles in this process.
+_failure_counts: Counter[str] = Counter()
+
+
+def reset_failure_counts() -> None:
+    _failure_counts.clear()
+
+
+def retryable_failures(
+    processed: list[FetchedItem], failed: list[FetchedItem]
+) -> list[FetchedItem]:
+    """Count this cycle's failures; return those still worth retrying.
+
+    Items that fail ``IMPORT_MAX_ATTEMPTS`` cycles in a row are logged and
+    dropped, so one permanently broken record cannot stall the watermark.
+    """
+    failed_ids = {item.zaak_id for item in failed}
+    for item in processed:
+        if item.zaak_id not in failed_ids:
+            _failure_counts.pop(item.zaak_id, None)
+
+    retry: list[FetchedItem] = []
+    for item in failed:
+        _failure_counts[item.zaak_id] += 1
+        if _failure_counts[item.zaak_id] >= IMPORT_MAX_ATTEMPTS:
+            logger.error(
+                f"Giving up on {item.bron} {item.zaak_id} after "
+                f"{IMPORT_MAX_ATTEMPTS} failed import cycles"
+            )
+            del _failure_counts[item.zaak_id]
+            continue
+        retry.append(item)
+    return retry
+
+
+def next_watermarks(
+    items: list[FetchedItem], failed: list[FetchedItem]
+) -> dict[str, datetime]:
+    """Per bron, how far the import watermark may advance.
+
+    A failed item must be fetched again next poll, so the watermark stops
+    short of the oldest failure in its bron.  Items after it are fetched
+    again too; the idempotency check skips them.
+    """
+    first_failure: dict[str, datetime] = {}
+    for item in failed:
+        if item.gewijzigd_op is None:
+            continue
+        current = first_failure.get(item.bron)
+        if current is None or item.gewijzigd_op < current:
+            first_failure[item.bron] = item.gewijzigd_op
+
+    watermarks: dict[str, datetime] = {}
+    for item in items:
+        ts = item.gewijzigd_op
+        if ts is None:
+            continue
+        limit = first_failure.get(item.bron)
+        if limit is not None and ts >= limit:
+            continue
+        if item.bron not in watermarks or ts > watermarks[item.bron]:
+            watermarks[item.bron] = ts
+    return watermarks
+
 
 class ParlementairImportService:
     """Orchestrates the full parliamentary item import pipeline.
 
+    Already imported zaak_ids are filtered out per batch with one query.
+    New items are then committed in chunks of ``IMPORT_CHUNK_SIZE``, each
+    item inside its own savepoint so a failure only rolls back that item.
+
     Steps per item:
-    1. Idempotency check (skip if zaak_id already imported)
+    1. Idempotency check (per batch, before processing)
     2. LLM tag extraction from item text (if strategy requires it)
     3. Create any newly suggested tags
     4. Find matching corpus nodes via tag overlap
@@ -58,6 +148,7 @@ class ParlementairImportService:
         self.import_repo = ParlementairItemRepository(session)
         self.edge_repo = SuggestedEdgeRepository(session)
         self.tag_repo = TagRepository(session)
+        self.watermark_repo = ImportWatermarkRepository(session)
         self.notification_service = NotificationService(session)
 
     async def poll_and_import(
@@ -66,6 +157,13 @@ class ParlementairImportService:
     ) -> int:
         """Poll TK and EK APIs for new items and import them.
 
+        All types and both chambers are fetched concurrently over one
+        keep-alive connection pool; the fetched items are then processed
+        one by one on this service's database session.
+
+        Each (type, chamber) only fetches items changed since its
+        watermark, the latest ``GewijzigdOp`` imported so far.
+
         Args:
             item_types: List of item types to import. If None, uses
                 configured ENABLED_IMPORT_TYPES.
@@ -73,128 +171,222 @@ class ParlementairImportService:
         Returns the number of items successfully imported.
         """
         types_to_import = item_types or self.settings.ENABLED_IMPORT_TYPES
-        imported_count = 0
-
+        strategies: list[ImportStrategy] = []
         for item_type in types_to_import:
             try:
-                strategy = get_strategy(item_type)
+                strategies.append(get_strategy(item_type))
             except ValueError:
                 logger.warning(f"Unknown import type: {item_type}, skipping")
-                continue
 
-            count = await self._import_type(strategy)
-            imported_count += count
+        watermarks = await self.watermark_repo.get_all()
+        async with create_http_client() as http_client:
+            tk_client = TweedeKamerClient(
+                base_url=self.settings.TK_API_BASE_URL,
+                session=self.session,
+                http_client=http_client,
+            )
+            ek_client = EersteKamerClient(
+                base_url=self.settings.EK_API_BASE_URL,
+                session=self.session,
+                http_client=http_client,
+            )
+            fetched = await asyncio.gather(
+                *(
+                    self._fetch_type(st, tk_client, ek_client, watermarks)
+                    for st in strategies
+                )
+            )
 
+        imported_count = 0
+        for strategy, items in zip(strategies, fetched, strict=True):
+            imported_count += await self._import_items(strategy, items)
         return imported_count
 
-    async def _import_type(self, strategy: ImportStrategy) -> int:
-        """Import all items for a single strategy/type."""
-        imported_count = 0
+    async def _fetch_type(
+        self,
+        strategy: ImportStrategy,
+        tk_client: TweedeKamerClient,
+        ek_client: EersteKamerClient,
+        watermarks: dict[tuple[str, str], datetime],
+    ) -> list[FetchedItem]:
+        """Fetch one type from TK and (if supported) EK concurrently."""
+        clients = {"tweede_kamer": tk_client}
+        if strategy.supports_ek:
+            clients["eerste_kamer"] = ek_client
+        fetches = [
+            self._fetch_from(
+                strategy, client, bron, watermarks.get((strategy.item_type, bron))
+            )
+            for bron, client in clients.items()
+        ]
+        results = await asyncio.gather(*fetches)
+        return [item for items in results for item in items]
 
-        # Poll Tweede Kamer
-        tk_client = TweedeKamerClient(
-            base_url=self.settings.TK_API_BASE_URL,
-            session=self.session,
-        )
+    async def _fetch_from(
+        self,
+        strategy: ImportStrategy,
+        client: TweedeKamerClient | EersteKamerClient,
+        bron: str,
+        since: datetime | None,
+    ) -> list[FetchedItem]:
+        """Fetch items of one type from one chamber; errors yield no items."""
+        chamber = _CHAMBERS[bron]
         try:
-            async with tk_client:
-                tk_items = await strategy.fetch_items(
-                    client=tk_client,
-                    since=None,
-                    limit=self.settings.TK_IMPORT_LIMIT,
-                )
-            logger.info(
-                f"Fetched {len(tk_items)} {strategy.item_type} items from Tweede Kamer"
+            items = await strategy.fetch_items(
+                client=client,
+                since=since,
+                limit=self.settings.TK_IMPORT_LIMIT,
             )
         except Exception:
-            logger.exception(f"Error fetching {strategy.item_type} from Tweede Kamer")
-            tk_items = []
+            logger.exception(f"Error fetching {strategy.item_type} from {chamber}")
+            return []
+        logger.info(f"Fetched {len(items)} {strategy.item_type} items from {chamber}")
+        return items
 
-        # Poll Eerste Kamer (only if strategy supports it)
-        ek_items: list[FetchedItem] = []
-        if strategy.supports_ek:
-            ek_client = EersteKamerClient(
-                base_url=self.settings.EK_API_BASE_URL,
-                session=self.session,
-            )
-            try:
-                async with ek_client:
-                    ek_items = await strategy.fetch_items(
-                        client=ek_client,
-                        since=None,
-                        limit=self.settings.TK_IMPORT_LIMIT,
-                    )
-                logger.info(
-                    f"Fetched {len(ek_items)} {strategy.item_type} "
-                    f"items from Eerste Kamer"
-                )
-            except Exception:
-                logger.exception(
-                    f"Error fetching {strategy.item_type} from Eerste Kamer"
-                )
-                ek_items = []
+    async def _import_items(
+        self, strategy: ImportStrategy, items: list[FetchedItem]
+    ) -> int:
+        """Run fetched items of one type through the import pipeline.
 
-        all_items = tk_items + ek_items
+        Afterwards the type's watermarks are advanced past what was handled.
+        """
+        existing = await self.import_repo.get_existing_zaak_ids(
+            [item.zaak_id for item in items]
+        )
+        new_items: dict[str, FetchedItem] = {}
+        for item in items:
+            if item.zaak_id not in existing:
+                new_items.setdefault(item.zaak_id, item)
+        to_process = list(new_items.values())
+        logger.debug(
+            f"{len(items) - len(to_process)} {strategy.item_type} items "
+            f"already imported, {len(to_process)} new"
+        )
 
-        for item in all_items:
+        imported_count = 0
+        failed: list[FetchedItem] = []
+        for start in range(0, len(to_process), IMPORT_CHUNK_SIZE):
+            chunk = to_process[start : start + IMPORT_CHUNK_SIZE]
+            chunk_imported = 0
+            chunk_failed: list[FetchedItem] = []
+            extractions = await self._extract_tags_batch(chunk, strategy)
+            for item in chunk:
+                try:
+                    async with self.session.begin_nested():
+                        if await self._process_item(
+                            item, strategy, extractions.get(item.zaak_id)
+                        ):
+                            chunk_imported += 1
+                except Exception:
+                    logger.exception(
+                        f"Error processing {strategy.item_type} {item.zaak_id}"
+                    )
+                    chunk_failed.append(item)
             try:
-                result = await self._process_item(item, strategy)
                 await self.session.commit()
-                if result:
-                    imported_count += 1
-            except Exception:
+            except SQLAlchemyError:
                 logger.exception(
-                    f"Error processing {strategy.item_type} {item.zaak_id}"
+                    f"Error committing {len(chunk)} {strategy.item_type} items"
                 )
                 await self.session.rollback()
+                failed.extend(chunk)
+                continue
+            imported_count += chunk_imported
+            failed.extend(chunk_failed)
 
+        retry = retryable_failures(to_process, failed)
+        for bron, gewijzigd_op in next_watermarks(items, retry).items():
+            await self.watermark_repo.advance(strategy.item_type, bron, gewijzigd_op)
+        await self.session.commit()
         return imported_count
 
+    async def _extract_tags_batch(
+        self, items: list[FetchedItem], strategy: ImportStrategy
+    ) -> dict[str, TagExtractionResult]:
+        """Tag extraction for a chunk of items in batched LLM prompts.
+
+        Returns ``{zaak_id: extraction}``; items left out (no provider, or
+        the batch call failed) are extracted one by one in _process_item.
+        """
+        if not strategy.requires_llm or not items:
+            return {}
+        llm_service = await get_llm_service(self.session)
+        if not llm_service:
+            return {}
+        tag_names = [t.name for t in await self.tag_repo.get_all()]
+        try:
+            extractions = await llm_service.extract_tags_batch(
+                items=[
+                    TagExtractionInput(
+                        titel=item.titel,
+                        onderwerp=item.onderwerp,
+                        document_tekst=item.document_tekst,
+                    )
+                    for item in items
+                ],
+                bestaande_tags=tag_names,
+                context_hint=strategy.context_hint(),
+            )
+            return {
+                item.zaak_id: extraction
+                for item, extraction in zip(items, extractions, strict=True)
+            }
+        except Exception:
+            logger.exception(
+                f"Batched LLM extraction failed for {len(items)} "
+                f"{strategy.item_type} items"
+            )
+            return {}
+
+    async def _extract_tags(
+        self, item: FetchedItem, strategy: ImportStrategy
+    ) -> TagExtractionResult | None:
+        """Tag extraction for one item; None if the LLM is unavailable/failed."""
+        all_tags = await self.tag_repo.get_all()
+        tag_names = [t.name for t in all_tags]
+
+        llm_service = await get_llm_service(self.session)
+        if not llm_service:
+            logger.warning("No LLM provider configured, skipping tag extraction")
+            return None
+        try:
+            return await llm_service.extract_tags(
+                titel=item.titel,
+                onderwerp=item.onderwerp,
+                document_tekst=item.document_tekst,
+                bestaande_tags=tag_names,
+                context_hint=strategy.context_hint(),
+            )
+        except Exception:
+            logger.exception(
+                "LLM extraction failed for %s %s",
+                strategy.item_type,
+                item.zaak_nummer,
+            )
+            return None
+
     async def _process_item(
         self,
         item: FetchedItem,
         strategy: ImportStrategy,
+        extraction: TagExtractionResult | None = None,
     ) -> bool:
         """Process a single item through the import pipeline.
 
+        The caller has already filtered out imported zaak_ids.  Rows that
+        depend on the new node are added together and written in one flush,
+        which batches them into multi-row inserts.  *extraction* is the
+        item's result from a batched extraction, if there was one.
+
         Returns True if the item was imported, False if skipped.
         """
-        # Step 1: Idempotency check
-        existing = await self.import_repo.get_by_zaak_id(item.zaak_id)
-        if existing:
-            logger.debug(
-                f"Skipping {strategy.item_type} {item.zaak_nummer}: already imported"
-            )
-            return False
-
         # Step 2: LLM tag extraction (if strategy requires it)
         matched_tag_names: list[str] = []
         samenvatting: str | None = None
 
         if strategy.requires_llm:
-            all_tags = await self.tag_repo.get_all()
-            tag_names = [t.name for t in all_tags]
-
-            llm_service = await get_llm_service(self.session)
-            if not llm_service:
-                logger.warning("No LLM provider configured, skipping tag extraction")
-                extraction = None
-            else:
-                try:
-                    extraction = await llm_service.extract_tags(
-                        titel=item.titel,
-                        onderwerp=item.onderwerp,
-                        document_tekst=item.document_tekst,
-                        bestaande_tags=tag_names,
-                        context_hint=strategy.context_hint(),
-                    )
-                except Exception:
-                    logger.exception(
-                        "LLM extraction failed for %s %s",
-                        strategy.item_type,
-                        item.zaak_nummer,
-                    )
-                    extraction = None
+            if extraction is None:
+                extraction = await self._extract_tags(item, strategy)
 
             if extraction is None:
                 # LLM required but unavailable/failed — queue for later
@@ -277,6 +469,7 @@ class ParlementairImportService:
         )
         self.session.add(node)
         await self.session.flush()
+        await check_node(self.session, node.id, node.title, node.description)
 
         pi = PolitiekeInput(
             id=node.id,
@@ -286,21 +479,18 @@ class ParlementairImportService:
             status=strategy.politieke_input_status(item),
         )
         self.session.add(pi)
-        await self.session.flush()
 
         # Step 6: Link indieners as stakeholders
         await self._link_indieners(node.id, item.indieners, item.bron)
 
         # Step 7: Tag the new node with matched tags (batch lookup)
         matched_tag_map = await self.tag_repo.get_by_names(matched_tag_names)
-        for tag_name, tag in matched_tag_map.items():
-            try:
-                await self.tag_repo.add_tag_to_node(node.id, tag.id)
-            except SQLAlchemyError:
-                logger.exception(f"Error tagging node {node.id} with tag '{tag_name}'")
+        self.session.add_all(
+            NodeTag(node_id=node.id, tag_id=tag.id) for tag in matched_tag_map.values()
+        )
 
         # Step 8: Create ParlementairItem record
-        parlementair_item = await self.import_repo.create(
+        parlementair_item = ParlementairItem(
             type=strategy.item_type,
             zaak_id=item.zaak_id,
             zaak_nummer=item.zaak_nummer,
@@ -320,28 +510,25 @@ class ParlementairImportService:
             ministerie=item.ministerie,
             extra_data=item.extra_data,
         )
+        self.session.add(parlementair_item)
 
         # Step 9: Create SuggestedEdge records for matching nodes
         affected_nodes: list[CorpusNode] = []
         for match in matched_nodes:
-            target_node = match["node"]
-            confidence = match["confidence"]
-            reason = match["reason"]
-
-            try:
-                await self.edge_repo.create(
-                    parlementair_item_id=parlementair_item.id,
-                    target_node_id=target_node.id,
+            self.session.add(
+                SuggestedEdge(
+                    parlementair_item=parlementair_item,
+                    target_node_id=match["node"].id,
                     edge_type_id=strategy.default_edge_type(),
-                    confidence=confidence,
-                    reason=reason,
+                    confidence=match["confidence"],
+                    reason=match["reason"],
                     status="pending",
                 )
-                affected_nodes.append(target_node)
-            except SQLAlchemyError:
-                logger.exception(
-                    f"Error creating suggested edge to node {target_node.id}"
-                )
+            )
+            affected_nodes.append(match["node"])
+
+        # One flush writes steps 5-9 with a multi-row insert per table.
+        await self.session.flush()
 
         # Step 10: Send notifications
         if affected_nodes:
@@ -398,6 +585,7 @@ class ParlementairImportService:
         )
         self.session.add(node)
         await self.session.flush()
+        await check_node(self.session, node.id, node.title, node.description)
 
         pi = PolitiekeInput(
             id=node.id,
@@ -423,11 +611,9 @@ class ParlementairImportService:
         # Tag the node with matched tags
         if item.matched_tags:
             tag_map = await self.tag_repo.get_by_names(item.matched_tags)
-            for tag_name, tag in tag_map.items():
-                try:
-                    await self.tag_repo.add_tag_to_node(node.id, tag.id)
-                except SQLAlchemyError:
-                    logger.exception(f"Error tagging node {node.id} with '{tag_name}'")
+            self.session.add_all(
+                NodeTag(node_id=node.id, tag_id=tag.id) for tag in tag_map.values()
+            )
 
         # Update the item to point to the new node
         item.corpus_node_id = node.id
@@ -572,8 +758,6 @@ class ParlementairImportService:
             if tag.parent_id:
                 all_tag_ids.add(tag.parent_id)
 
-        from bouwmeester.models.tag import NodeTag
-
         tag_node_stmt = select(NodeTag.tag_id, NodeTag.node_id).where(
             NodeTag.tag_id.in_(all_tag_ids)
         )
@@ -796,12 +980,10 @@ class ParlementairImportService:
 
         Deletes the CorpusNode (cascading to PolitiekeInput, edges,
         tasks, stakeholders, node_tags) and clears the FK on the item.
+        The repository repairs the hierarchy closure around the node.
         """
-        # Delete the corpus node (cascades to politieke_input, tasks, etc.)
         if item.corpus_node_id:
-            node = await self.session.get(CorpusNode, item.corpus_node_id)
-            if node:
-                await self.session.delete(node)
+            await CorpusNodeRepository(self.session).delete(item.corpus_node_id)
             item.corpus_node_id = None
 
         await self.session.flush()
@@ -812,44 +994,36 @@ class ParlementairImportService:
         indieners: list[str],
         bron: str,
     ) -> None:
-        """Find or create Person records for indieners and link as stakeholders."""
-        kamer = "Tweede Kamer" if bron == "tweede_kamer" else "Eerste Kamer"
-        for naam in indieners:
-            naam = naam.strip()
-            if not naam or naam == "TK" or naam == "EK":
-                continue
-
-            try:
-                person = await self._find_or_create_person(naam, kamer)
-                stakeholder = NodeStakeholder(
-                    node_id=node_id,
-                    person_id=person.id,
-                    rol="indiener",
-                )
-                self.session.add(stakeholder)
-            except SQLAlchemyError:
-                logger.exception(f"Error linking indiener '{naam}' to node")
+        """Find or create Person records for indieners and link as stakeholders.
 
-        await self.session.flush()
-
-    async def _find_or_create_person(self, naam: str, kamer: str) -> Person:
-        """Find a person by name+functie or create a new external person record."""
+        Existing persons are looked up in one query.  The new persons and
+        stakeholder rows are only added to the session; the caller's next
+        flush writes them.
+        """
+        kamer = "Tweede Kamer" if bron == "tweede_kamer" else "Eerste Kamer"
         functie = f"Kamerlid {kamer}"
-        stmt = select(Person).where(
-            Person.naam == naam,
-            Person.functie == functie,
+        namen = list(
+            dict.fromkeys(
+                naam.strip()
+                for naam in indieners
+                if naam.strip() and naam.strip() not in ("TK", "EK")
+            )
         )
-        result = await self.session.execute(stmt)
-        person = result.scalar_one_or_none()
-
-        if person:
-            return person
+        if not namen:
+            return
 
-        person = Person(
-            naam=naam,
-            functie=functie,
-            is_active=True,
+        result = await self.session.execute(
+            select(Person).where(Person.naam.in_(namen), Person.functie == functie)
         )
-        self.session.add(person)
-        await self.session.flush()
-        return person
+        persons: dict[str, Person] = {}
+        for person in result.scalars().all():
+            persons.setdefault(person.naam, person)
+
+        for naam in namen:
+            person = persons.get(naam)
+            if person is None:
+                person = Person(naam=naam, functie=functie, is_active=True)
+                self.session.add(person)
+            self.session.add(
+                NodeStakeholder(node_id=node_id, person=person, rol="indiener")
+            )
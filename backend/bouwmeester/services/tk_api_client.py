@@ -4,10 +4,24 @@ Tweede Kamer and Eerste Kamer API clients for parliamentary data.
 Integrates with the official OData APIs to retrieve parliamentary items
 (moties, kamervragen, toezeggingen, etc.) from both chambers of Dutch
 parliament.
+
+Each zaak needs a few follow-up requests (indieners, document, document
+HTML).  These run concurrently, bounded per client by a semaphore, over a
+keep-alive connection pool that the import service can share between
+clients.
+
+Incremental polls pass ``since`` (the last imported ``GewijzigdOp``);
+results are then returned oldest change first and paged through
+``@odata.nextLink`` up to the limit, so a backlog larger than one page is
+picked up over successive polls instead of being skipped.  The filter is
+inclusive (``ge``): a page cut off at the limit may end halfway through
+records sharing one timestamp, so the next poll starts at that timestamp
+again and the import's idempotency check drops what was already seen.
 """
 
+import asyncio
 import logging
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 
 import httpx
@@ -16,12 +30,64 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+# How many zaken a client enriches at the same time.  Each one issues up to
+# three requests, two of them in parallel.
+ZAAK_ENRICH_CONCURRENCY = 8
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create an httpx client with retry, timeout and keep-alive pooling."""
+    transport = httpx.AsyncHTTPTransport(
+        retries=3,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(30.0),
+        follow_redirects=True,
+    )
+
 
 def _odata_escape(value: str) -> str:
     """Escape a string value for use in OData filter expressions."""
     return value.replace("'", "''")
 
 
+def _odata_datetime(value: datetime) -> str:
+    """Format a datetime as an OData UTC literal, keeping microseconds."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _parse_gewijzigd_op(value: Any) -> datetime | None:
+    """Parse a ``GewijzigdOp`` value from the API, or None."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+
+
+async def _get_pages(
+    client: httpx.AsyncClient, url: str, params: dict[str, str], limit: int
+) -> list[dict[str, Any]]:
+    """GET an OData collection, following ``@odata.nextLink`` up to *limit*."""
+    records: list[dict[str, Any]] = []
+    next_url: str | None = url
+    next_params: dict[str, str] | None = params
+    while next_url and len(records) < limit:
+        response = await client.get(next_url, params=next_params)
+        response.raise_for_status()
+        data = response.json()
+        records.extend(data.get("value", []))
+        # The next link already carries the query string.
+        next_url = data.get("@odata.nextLink")
+        next_params = None
+    return records[:limit]
+
+
 class MotieData(BaseModel):
     """Structured data for a motie from either parliamentary chamber."""
 
@@ -35,6 +101,7 @@ class MotieData(BaseModel):
     document_url: str | None = None
     kabinetsappreciatie: str | None = None
     bron: str  # "tweede_kamer" or "eerste_kamer"
+    gewijzigd_op: datetime | None = None
 
 
 class ZaakData(BaseModel):
@@ -51,6 +118,7 @@ class ZaakData(BaseModel):
     document_url: str | None = None
     termijn: datetime | None = None
     bron: str = "tweede_kamer"
+    gewijzigd_op: datetime | None = None
 
 
 class ToezeggingData(BaseModel):
@@ -65,6 +133,7 @@ class ToezeggingData(BaseModel):
     datum_nakoming: datetime | None = None
     activiteit_nummer: str | None = None
     bron: str = "tweede_kamer"
+    gewijzigd_op: datetime | None = None
 
 
 class TweedeKamerClient:
@@ -78,6 +147,8 @@ class TweedeKamerClient:
         self,
         base_url: str = "https://gegevensmagazijn.tweedekamer.nl/OData/v4/2.0",
         session: AsyncSession | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        enrich_concurrency: int = ZAAK_ENRICH_CONCURRENCY,
     ):
         """
         Initialize TK API client.
@@ -85,25 +156,24 @@ class TweedeKamerClient:
         Args:
             base_url: OData API base URL
             session: Optional SQLAlchemy session (for future DB integration)
+            http_client: Optional shared httpx client; the caller closes it
+            enrich_concurrency: Maximum number of zaken enriched at once
         """
         self.base_url = base_url.rstrip("/")
         self.session = session
-        self._http_client: httpx.AsyncClient | None = None
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self._enrich_semaphore = asyncio.Semaphore(enrich_concurrency)
 
     def _get_http_client(self) -> httpx.AsyncClient:
         """Get or create httpx client with retry and timeout configuration."""
         if self._http_client is None:
-            transport = httpx.AsyncHTTPTransport(retries=3)
-            self._http_client = httpx.AsyncClient(
-                transport=transport,
-                timeout=httpx.Timeout(30.0),
-                follow_redirects=True,
-            )
+            self._http_client = create_http_client()
         return self._http_client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._http_client is not None:
+        """Close the HTTP client (unless it was passed in)."""
+        if self._http_client is not None and self._owns_http_client:
             await self._http_client.aclose()
             self._http_client = None
 
@@ -141,6 +211,7 @@ class TweedeKamerClient:
                 document_url=z.document_url,
                 kabinetsappreciatie=None,
                 bron=z.bron,
+                gewijzigd_op=z.gewijzigd_op,
             )
             for z in zaken
         ]
@@ -156,7 +227,8 @@ class TweedeKamerClient:
 
         Args:
             soort: Zaak type to query (e.g. 'Schriftelijke vragen')
-            since: Optional datetime to filter by GewijzigdOp
+            since: Optional datetime to filter by GewijzigdOp; when given,
+                the oldest changes are returned first
             limit: Maximum number of results
             besluit_filter: Optional Besluit filter
                 (e.g. "contains(BesluitSoort,'aangenomen')")
@@ -164,6 +236,7 @@ class TweedeKamerClient:
         client = self._get_http_client()
 
         escaped_soort = _odata_escape(soort)
+        order = "GewijzigdOp asc" if since else "GewijzigdOp desc"
 
         if besluit_filter:
             # Query via Besluit, expanding Zaak (like fetch_moties)
@@ -172,12 +245,11 @@ class TweedeKamerClient:
                 f"Zaak/any(z:z/Soort eq '{escaped_soort}')",
             ]
             if since:
-                since_str = since.strftime("%Y-%m-%dT%H:%M:%SZ")
-                filters.append(f"GewijzigdOp gt {since_str}")
+                filters.append(f"GewijzigdOp ge {_odata_datetime(since)}")
 
             params = {
                 "$filter": " and ".join(filters),
-                "$orderby": "GewijzigdOp desc",
+                "$orderby": order,
                 "$top": str(limit),
                 "$expand": "Zaak($select=Id,Nummer,Titel,Onderwerp,GestartOp)",
             }
@@ -186,14 +258,13 @@ class TweedeKamerClient:
             # Query Zaak directly
             filters = [f"Soort eq '{escaped_soort}'"]
             if since:
-                since_str = since.strftime("%Y-%m-%dT%H:%M:%SZ")
-                filters.append(f"GewijzigdOp gt {since_str}")
+                filters.append(f"GewijzigdOp ge {_odata_datetime(since)}")
 
             params = {
                 "$filter": " and ".join(filters),
-                "$orderby": "GewijzigdOp desc",
+                "$orderby": order,
                 "$top": str(limit),
-                "$select": "Id,Nummer,Titel,Onderwerp,GestartOp,Termijn",
+                "$select": "Id,Nummer,Titel,Onderwerp,GestartOp,Termijn,GewijzigdOp",
             }
             url = f"{self.base_url}/Zaak"
 
@@ -202,30 +273,37 @@ class TweedeKamerClient:
         )
 
         try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            records = await _get_pages(client, url, params, limit)
 
-            results: list[ZaakData] = []
+            zaken: list[tuple[dict[str, Any], Any]] = []
             seen_zaak_ids: set[str] = set()
 
             if besluit_filter:
-                # Besluit-based: extract Zaak from expansion
-                for besluit in data.get("value", []):
-                    for zaak in besluit.get("Zaak", []):
-                        zaak_id = zaak.get("Id")
-                        if not zaak_id or zaak_id in seen_zaak_ids:
-                            continue
-                        seen_zaak_ids.add(zaak_id)
-                        results.append(await self._zaak_to_data(zaak, soort))
+                # Besluit-based: extract Zaak from expansion.  The filter
+                # is on the Besluit, so its GewijzigdOp is the watermark.
+                raw_zaken = [
+                    (zaak, besluit.get("GewijzigdOp"))
+                    for besluit in records
+                    for zaak in besluit.get("Zaak", [])
+                ]
             else:
                 # Direct Zaak query
-                for zaak in data.get("value", []):
-                    zaak_id = zaak.get("Id")
-                    if not zaak_id or zaak_id in seen_zaak_ids:
-                        continue
-                    seen_zaak_ids.add(zaak_id)
-                    results.append(await self._zaak_to_data(zaak, soort))
+                raw_zaken = [(zaak, zaak.get("GewijzigdOp")) for zaak in records]
+            for zaak, gewijzigd_op in raw_zaken:
+                zaak_id = zaak.get("Id")
+                if not zaak_id or zaak_id in seen_zaak_ids:
+                    continue
+                seen_zaak_ids.add(zaak_id)
+                zaken.append((zaak, gewijzigd_op))
+
+            results = list(
+                await asyncio.gather(
+                    *(
+                        self._zaak_to_data(z, soort, _parse_gewijzigd_op(g))
+                        for z, g in zaken
+                    )
+                )
+            )
 
             logger.info(f"Fetched {len(results)} Zaak records (soort='{soort}')")
             return results
@@ -240,15 +318,25 @@ class TweedeKamerClient:
             logger.error(f"Request error fetching Zaak soort='{soort}': {e}")
             raise
 
-    async def _zaak_to_data(self, zaak: dict[str, Any], soort: str) -> ZaakData:
-        """Convert a raw Zaak dict to ZaakData with enrichment."""
+    async def _zaak_to_data(
+        self,
+        zaak: dict[str, Any],
+        soort: str,
+        gewijzigd_op: datetime | None = None,
+    ) -> ZaakData:
+        """Convert a raw Zaak dict to ZaakData with enrichment.
+
+        Indieners and document are fetched concurrently; both helpers log
+        and swallow their own errors.
+        """
         zaak_id = zaak["Id"]
         zaak_nummer = zaak.get("Nummer") or ""
 
-        indieners = await self._fetch_indieners(zaak_id)
-        document_tekst, document_url = await self._fetch_document_text(
-            zaak_id, zaak_nummer
-        )
+        async with self._enrich_semaphore:
+            indieners, (document_tekst, document_url) = await asyncio.gather(
+                self._fetch_indieners(zaak_id),
+                self._fetch_document_text(zaak_id, zaak_nummer),
+            )
 
         datum = None
         if zaak.get("GestartOp"):
@@ -282,6 +370,7 @@ class TweedeKamerClient:
             document_url=document_url,
             termijn=termijn,
             bron="tweede_kamer",
+            gewijzigd_op=gewijzigd_op,
         )
 
     async def fetch_toezeggingen(
@@ -294,7 +383,8 @@ class TweedeKamerClient:
 
         Args:
             ministerie: Filter by ministry (e.g. 'Binnenlandse Zaken')
-            since: Optional datetime to filter by GewijzigdOp
+            since: Optional datetime to filter by GewijzigdOp; when given,
+                the oldest changes are returned first
             limit: Maximum number of results
         """
         client = self._get_http_client()
@@ -303,16 +393,15 @@ class TweedeKamerClient:
         if ministerie:
             filters.append(f"contains(Ministerie,'{_odata_escape(ministerie)}')")
         if since:
-            since_str = since.strftime("%Y-%m-%dT%H:%M:%SZ")
-            filters.append(f"GewijzigdOp gt {since_str}")
+            filters.append(f"GewijzigdOp ge {_odata_datetime(since)}")
 
         params = {
             "$filter": " and ".join(filters),
-            "$orderby": "GewijzigdOp desc",
+            "$orderby": "GewijzigdOp asc" if since else "GewijzigdOp desc",
             "$top": str(limit),
             "$select": (
                 "Id,Nummer,Tekst,Naam,Achternaam,Initialen,"
-                "Ministerie,Status,DatumNakoming,ActiviteitNummer"
+                "Ministerie,Status,DatumNakoming,ActiviteitNummer,GewijzigdOp"
             ),
         }
 
@@ -324,12 +413,10 @@ class TweedeKamerClient:
         )
 
         try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            records = await _get_pages(client, url, params, limit)
 
             results: list[ToezeggingData] = []
-            for item in data.get("value", []):
+            for item in records:
                 toezegging_id = item.get("Id")
                 if not toezegging_id:
                     continue
@@ -366,6 +453,7 @@ class TweedeKamerClient:
                         datum_nakoming=datum_nakoming,
                         activiteit_nummer=item.get("ActiviteitNummer"),
                         bron="tweede_kamer",
+                        gewijzigd_op=_parse_gewijzigd_op(item.get("GewijzigdOp")),
                     )
                 )
 
@@ -552,6 +640,7 @@ class EersteKamerClient:
         self,
         base_url: str = "https://gegevens.eerstekamer.nl/opendata",
         session: AsyncSession | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """
         Initialize EK API client.
@@ -559,25 +648,22 @@ class EersteKamerClient:
         Args:
             base_url: API base URL
             session: Optional SQLAlchemy session (for future DB integration)
+            http_client: Optional shared httpx client; the caller closes it
         """
         self.base_url = base_url.rstrip("/")
         self.session = session
-        self._http_client: httpx.AsyncClient | None = None
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
 
     def _get_http_client(self) -> httpx.AsyncClient:
         """Get or create httpx client with retry and timeout configuration."""
         if self._http_client is None:
-            transport = httpx.AsyncHTTPTransport(retries=3)
-            self._http_client = httpx.AsyncClient(
-                transport=transport,
-                timeout=httpx.Timeout(30.0),
-                follow_redirects=True,
-            )
+            self._http_client = create_http_client()
         return self._http_client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._http_client is not None:
+        """Close the HTTP client (unless it was passed in)."""
+        if self._http_client is not None and self._owns_http_client:
             await self._http_client.aclose()
             self._http_client = None
 
@@ -0,0 +1,222 @@
+"""Compact binary encoding of graph views for the graph explorer.
+
+JSON graph views repeat full UUID strings, type names, descriptions and
+timestamps for every element.  This format interns node ids to indices,
+codes node types, statuses and edge types as small integers, and stores
+edges in CSR form, so large views shrink by an order of magnitude and
+browsers can map the sections straight onto typed arrays.
+
+Layout — all integers little-endian, every section padded to a multiple
+of 4 bytes::
+
+    char[4]     magic ``b"BMG1"``
+    u32         node count N
+    u32         edge count E
+    u32         flags (bit 0: descriptions included)
+    u32         header length H
+    u8[H]       UTF-8 JSON header: ``node_types``, ``statuses`` and
+                ``edge_types`` code tables plus endpoint ``meta``
+    u8[16N]     node UUIDs
+    u16[N]      node type codes
+    u16[N]      status codes
+    u32[N+1]    title offsets into the title blob
+    u8[...]     UTF-8 title blob
+    u32[N+1]    description offsets   } only when flag bit 0 is set;
+    u8[...]     UTF-8 description blob} a missing description is empty
+    u32[N+1]    CSR row offsets (edges grouped by source node index)
+    u32[E]      target node index
+    u16[E]      edge type code
+    f32[E]      weight
+    u8[16E]     edge UUIDs
+
+Edges whose endpoints are not part of the node list are dropped.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from collections.abc import Iterable, Sequence
+from typing import Any, Protocol
+from uuid import UUID
+
+GRAPH_BINARY_MEDIA_TYPE = "application/vnd.bouwmeester.graph"
+
+_MAGIC = b"BMG1"
+_FLAG_DESCRIPTIONS = 1
+
+
+class _Node(Protocol):
+    id: UUID
+    title: str
+    description: str | None
+    node_type: str
+    status: str
+
+
+class _Edge(Protocol):
+    id: UUID
+    from_node_id: UUID
+    to_node_id: UUID
+    edge_type_id: str
+    weight: float
+
+
+def accepts_binary_graph(accept: str | None) -> bool:
+    """Return whether an ``Accept`` header asks for the binary layout."""
+    return bool(accept) and GRAPH_BINARY_MEDIA_TYPE in accept
+
+
+def _pad(buf: bytearray) -> None:
+    buf.extend(b"\0" * (-len(buf) % 4))
+
+
+def _intern(values: Iterable[str]) -> tuple[list[str], list[int]]:
+    table: dict[str, int] = {}
+    codes = [table.setdefault(v, len(table)) for v in values]
+    return list(table), codes
+
+
+def _write_strings(buf: bytearray, values: Sequence[str]) -> None:
+    encoded = [v.encode() for v in values]
+    offsets = [0]
+    for chunk in encoded:
+        offsets.append(offsets[-1] + len(chunk))
+    buf += struct.pack(f"<{len(offsets)}I", *offsets)
+    buf += b"".join(encoded)
+    _pad(buf)
+
+
+def encode_graph(
+    nodes: Sequence[_Node],
+    edges: Iterable[_Edge],
+    *,
+    include_descriptions: bool = False,
+    meta: dict[str, Any] | None = None,
+) -> bytes:
+    """Encode nodes and edges into the compact binary layout."""
+    position = {node.id: i for i, node in enumerate(nodes)}
+    node_count = len(nodes)
+
+    # Group edges by source index for the CSR arrays.
+    rows: list[list[tuple[int, _Edge]]] = [[] for _ in range(node_count)]
+    for edge in edges:
+        src = position.get(edge.from_node_id)
+        dst = position.get(edge.to_node_id)
+        if src is not None and dst is not None:
+            rows[src].append((dst, edge))
+    ordered = [item for row in rows for item in row]
+
+    node_types, node_type_codes = _intern(n.node_type for n in nodes)
+    statuses, status_codes = _intern(n.status for n in nodes)
+    edge_types, edge_type_codes = _intern(e.edge_type_id for _, e in ordered)
+
+    header = json.dumps(
+        {
+            "node_types": node_types,
+            "statuses": statuses,
+            "edge_types": edge_types,
+            "meta": meta or {},
+        },
+        separators=(",", ":"),
+    ).encode()
+
+    edge_count = len(ordered)
+    flags = _FLAG_DESCRIPTIONS if include_descriptions else 0
+    buf = bytearray(_MAGIC)
+    buf += struct.pack("<4I", node_count, edge_count, flags, len(header))
+    buf += header
+    _pad(buf)
+
+    buf += b"".join(n.id.bytes for n in nodes)
+    buf += struct.pack(f"<{node_count}H", *node_type_codes)
+    _pad(buf)
+    buf += struct.pack(f"<{node_count}H", *status_codes)
+    _pad(buf)
+    _write_strings(buf, [n.title for n in nodes])
+    if include_descriptions:
+        _write_strings(buf, [n.description or "" for n in nodes])
+
+    offsets = [0]
+    for row in rows:
+        offsets.append(offsets[-1] + len(row))
+    buf += struct.pack(f"<{node_count + 1}I", *offsets)
+    buf += struct.pack(f"<{edge_count}I", *(dst for dst, _ in ordered))
+    buf += struct.pack(f"<{edge_count}H", *edge_type_codes)
+    _pad(buf)
+    buf += struct.pack(f"<{edge_count}f", *(e.weight for _, e in ordered))
+    buf += b"".join(e.id.bytes for _, e in ordered)
+    return bytes(buf)
+
+
+def decode_graph(data: bytes) -> dict[str, Any]:
+    """Decode :func:`encode_graph` output back into plain dicts.
+
+    Intended for Python clients and tests; browsers read the typed-array
+    sections directly.
+    """
+    if data[:4] != _MAGIC:
+        raise ValueError("Not a Bouwmeester binary graph payload")
+    node_count, edge_count, flags, header_len = struct.unpack_from("<4I", data, 4)
+    pos = 20
+    header = json.loads(data[pos : pos + header_len])
+    pos += header_len + (-header_len % 4)
+
+    def take(fmt: str, count: int) -> tuple[Any, ...]:
+        nonlocal pos
+        values = struct.unpack_from(f"<{count}{fmt}", data, pos)
+        pos += struct.calcsize(f"<{count}{fmt}")
+        pos += -pos % 4
+        return values
+
+    def take_uuids(count: int) -> list[UUID]:
+        nonlocal pos
+        ids = [
+            UUID(bytes=data[pos + 16 * i : pos + 16 * (i + 1)]) for i in range(count)
+        ]
+        pos += 16 * count
+        return ids
+
+    def take_strings(count: int) -> list[str]:
+        nonlocal pos
+        offsets = take("I", count + 1)
+        blob = data[pos : pos + offsets[-1]]
+        pos += offsets[-1] + (-offsets[-1] % 4)
+        return [blob[offsets[i] : offsets[i + 1]].decode() for i in range(count)]
+
+    node_ids = take_uuids(node_count)
+    node_type_codes = take("H", node_count)
+    status_codes = take("H", node_count)
+    titles = take_strings(node_count)
+    descriptions = (
+        take_strings(node_count) if flags & _FLAG_DESCRIPTIONS else [None] * node_count
+    )
+    row_offsets = take("I", node_count + 1)
+    targets = take("I", edge_count)
+    edge_type_codes = take("H", edge_count)
+    weights = take("f", edge_count)
+    edge_ids = take_uuids(edge_count)
+
+    nodes = [
+        {
+            "id": node_ids[i],
+            "title": titles[i],
+            "description": descriptions[i],
+            "node_type": header["node_types"][node_type_codes[i]],
+            "status": header["statuses"][status_codes[i]],
+        }
+        for i in range(node_count)
+    ]
+    edges = []
+    for src in range(node_count):
+        for k in range(row_offsets[src], row_offsets[src + 1]):
+            edges.append(
+                {
+                    "id": edge_ids[k],
+                    "from_node_id": node_ids[src],
+                    "to_node_id": node_ids[targets[k]],
+                    "edge_type_id": header["edge_types"][edge_type_codes[k]],
+                    "weight": weights[k],
+                }
+            )
+    return {"nodes": nodes, "edges": edges, "meta": header["meta"]}
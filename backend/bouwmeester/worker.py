@@ -1,4 +1,8 @@
-"""Background worker for polling TK/EK APIs and importing parliamentary items."""
+"""Background worker for polling TK/EK APIs and importing parliamentary items.
+
+Also keeps the precomputed ``node_metrics`` table up to date and rebuilds
+the ``edge_closure`` reachability table on start-up.
+"""
 
 import asyncio
 import logging
@@ -13,7 +17,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def main() -> None:
+async def _import_loop() -> None:
     settings = get_settings()
     logger.info(
         f"Parlementair import worker started. Poll interval: "
@@ -36,5 +40,47 @@ async def main() -> None:
         await asyncio.sleep(settings.TK_POLL_INTERVAL_SECONDS)
 
 
+async def _metrics_loop() -> None:
+    settings = get_settings()
+    logger.info(
+        f"Graph metrics refresh started. Interval: "
+        f"{settings.GRAPH_METRICS_INTERVAL_SECONDS}s"
+    )
+
+    while True:
+        try:
+            async with async_session() as session:
+                from bouwmeester.services.graph_metrics_service import (
+                    GraphMetricsService,
+                )
+
+                updated = await GraphMetricsService(session).refresh()
+                await session.commit()
+                if updated is not None:
+                    logger.info(f"Graph metrics refreshed: {updated} rows updated")
+        except Exception:
+            logger.exception("Error in graph metrics refresh")
+
+        await asyncio.sleep(settings.GRAPH_METRICS_INTERVAL_SECONDS)
+
+
+async def _rebuild_edge_closure() -> None:
+    """Rebuild ``edge_closure`` so HIERARCHICAL_EDGE_TYPES changes apply."""
+    try:
+        async with async_session() as session:
+            from bouwmeester.repositories.edge_closure import EdgeClosureRepository
+
+            rows = await EdgeClosureRepository(session).rebuild()
+            await session.commit()
+            logger.info(f"Edge closure rebuilt: {rows} rows")
+    except Exception:
+        logger.exception("Error rebuilding edge closure")
+
+
+async def main() -> None:
+    await _rebuild_edge_closure()
+    await asyncio.gather(_import_loop(), _metrics_loop())
+
+
 if __name__ == "__main__":
     asyncio.run(main())
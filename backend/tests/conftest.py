@@ -15,7 +15,11 @@ from sqlalchemy.pool import NullPool
 
 from bouwmeester.core.config import get_settings
 from bouwmeester.core.database import get_db
+from bouwmeester.core.duplicate_index import reset_duplicate_index
+from bouwmeester.core.graph_index import reset_graph_index
+from bouwmeester.core.mention_index import reset_mention_index
 from bouwmeester.core.session_store import SessionStore
+from bouwmeester.core.similarity_index import reset_similarity_index
 from bouwmeester.middleware.session import ServerSideSessionMiddleware
 
 settings = get_settings()
@@ -39,6 +43,27 @@ async def _dispose_global_engine():
     await engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def _fresh_indexes():
+    """Drop the in-process search/graph indexes around each test.
+
+    They are module-level caches built from the database, so an index
+    left over from a previous test would hold that test's rolled-back
+    nodes.  Each test rebuilds them inside its own transaction instead.
+    """
+    resets = (
+        reset_duplicate_index,
+        reset_graph_index,
+        reset_mention_index,
+        reset_similarity_index,
+    )
+    for reset in resets:
+        reset()
+    yield
+    for reset in resets:
+        reset()
+
+
 class InMemorySessionStore(SessionStore):
     """Simple in-memory session store for tests (no DB connections)."""
 
@@ -4,7 +4,16 @@ import uuid
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from bouwmeester.core.api_key import generate_api_key, hash_api_key, verify_api_key
+from bouwmeester.core import api_key as api_key_mod
+from bouwmeester.core.api_key import (
+    cache_identity,
+    forget_api_key_person,
+    generate_api_key,
+    get_cached_identity,
+    hash_api_key,
+    reset_identity_cache,
+    verify_api_key,
+)
 from bouwmeester.models.person import Person
 
 # ---------------------------------------------------------------------------
@@ -53,6 +62,37 @@ class TestApiKeyUtility:
         assert all(c in "0123456789abcdef" for c in hashed)
 
 
+class TestIdentityCache:
+    """Unit tests for the middleware's hash → person cache."""
+
+    def setup_method(self):
+        reset_identity_cache()
+
+    def teardown_method(self):
+        reset_identity_cache()
+
+    def test_cached_identity_roundtrip(self):
+        person_id = uuid.uuid4()
+        cache_identity("hash-a", person_id, True)
+        assert get_cached_identity("hash-a") == (person_id, True)
+        assert get_cached_identity("hash-b") is None
+
+    def test_forget_person_drops_all_their_keys(self):
+        person_id, other_id = uuid.uuid4(), uuid.uuid4()
+        cache_identity("old", person_id, True)
+        cache_identity("new", person_id, True)
+        cache_identity("other", other_id, True)
+        forget_api_key_person(person_id)
+        assert get_cached_identity("old") is None
+        assert get_cached_identity("new") is None
+        assert get_cached_identity("other") == (other_id, True)
+
+    def test_cached_identity_expires(self, monkeypatch):
+        cache_identity("hash-a", uuid.uuid4(), True)
+        monkeypatch.setattr(api_key_mod, "_IDENTITY_TTL_SECONDS", -1.0)
+        assert get_cached_identity("hash-a") is None
+
+
 # ---------------------------------------------------------------------------
 # Integration tests for API key endpoints
 # ---------------------------------------------------------------------------
@@ -290,3 +290,109 @@ async def test_onboarding_rejects_invalid_org_id(db_session):
     stmt = select(OrganisatieEenheid.id).where(OrganisatieEenheid.id == fake_org_id)
     result = await db_session.execute(stmt)
     assert result.scalar_one_or_none() is None, "Fake org ID should not exist"
+
+
+# ---------------------------------------------------------------------------
+# Bearer token claims cache
+# ---------------------------------------------------------------------------
+
+
+async def test_bearer_claims_cached_until_exp(monkeypatch):
+    """A locally validated JWT is decoded once, then served from the cache."""
+    import time
+
+    from bouwmeester.core import auth as auth_mod
+    from bouwmeester.core.config import Settings
+
+    calls = []
+
+    async def fake_jwks(settings):
+        return object()
+
+    def fake_validate(token, jwks, settings):
+        calls.append(token)
+        return {"sub": "abc", "exp": time.time() + 300}
+
+    monkeypatch.setattr(auth_mod, "get_jwks", fake_jwks)
+    monkeypatch.setattr(auth_mod, "validate_jwt_locally", fake_validate)
+    auth_mod.reset_bearer_cache()
+    try:
+        settings = Settings()
+        first = await auth_mod.validate_bearer_token("tok", settings)
+        second = await auth_mod.validate_bearer_token("tok", settings)
+        assert first["sub"] == second["sub"] == "abc"
+        assert calls == ["tok"]
+    finally:
+        auth_mod.reset_bearer_cache()
+
+
+async def test_bearer_rejection_cached(monkeypatch):
+    """A token Keycloak rejected is refused again without another round trip."""
+    from bouwmeester.core import auth as auth_mod
+    from bouwmeester.core.config import Settings
+
+    requests = []
+
+    class FakeResponse:
+        status_code = 401
+
+    class FakeClient:
+        async def get(self, url, headers):
+            requests.append(url)
+            return FakeResponse()
+
+    async def no_jwks(settings):
+        return None
+
+    async def fake_metadata(settings):
+        return {"userinfo_endpoint": "https://idp.example/userinfo"}
+
+    monkeypatch.setattr(auth_mod, "get_jwks", no_jwks)
+    monkeypatch.setattr(auth_mod, "get_oidc_metadata", fake_metadata)
+    monkeypatch.setattr(auth_mod, "get_http_client", lambda: FakeClient())
+    auth_mod.reset_bearer_cache()
+    try:
+        settings = Settings()
+        assert await auth_mod.validate_bearer_token("opaque", settings) is None
+        assert await auth_mod.validate_bearer_token("opaque", settings) is None
+        assert len(requests) == 1
+    finally:
+        auth_mod.reset_bearer_cache()
+
+
+async def test_bearer_userinfo_outage_not_cached(monkeypatch):
+    """A 503 from the userinfo endpoint is not remembered as a rejection."""
+    from bouwmeester.core import auth as auth_mod
+    from bouwmeester.core.config import Settings
+
+    statuses = [503, 200]
+
+    class FakeResponse:
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+        def json(self):
+            return {"sub": "abc"}
+
+    class FakeClient:
+        async def get(self, url, headers):
+            return FakeResponse(statuses.pop(0))
+
+    async def no_jwks(settings):
+        return None
+
+    async def fake_metadata(settings):
+        return {"userinfo_endpoint": "https://idp.example/userinfo"}
+
+    monkeypatch.setattr(auth_mod, "get_jwks", no_jwks)
+    monkeypatch.setattr(auth_mod, "get_oidc_metadata", fake_metadata)
+    monkeypatch.setattr(auth_mod, "get_http_client", lambda: FakeClient())
+    auth_mod.reset_bearer_cache()
+    try:
+        settings = Settings()
+        assert await auth_mod.validate_bearer_token("opaque", settings) is None
+        claims = await auth_mod.validate_bearer_token("opaque", settings)
+        assert claims == {"sub": "abc"}
+        assert statuses == []
+    finally:
+        auth_mod.reset_bearer_cache()
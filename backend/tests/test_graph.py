@@ -1,6 +1,9 @@
 """Comprehensive API tests for the graph router."""
 
 import uuid
+from datetime import UTC
+
+import pytest
 
 from bouwmeester.models.corpus_node import CorpusNode
 
@@ -105,3 +108,578 @@ async def test_find_path_returns_200(client, sample_node, second_node, sample_ed
     assert "length" in data
     assert data["from_id"] == str(sample_node.id)
     assert data["to_id"] == str(second_node.id)
+
+
+async def test_find_path_multi_hop(
+    client, db_session, sample_node, second_node, sample_edge, sample_edge_type
+):
+    """A two-hop path is returned with node and edge metadata per step."""
+    from bouwmeester.models.edge import Edge
+
+    third = CorpusNode(
+        id=uuid.uuid4(), title="Derde node", node_type="maatregel", status="actief"
+    )
+    db_session.add(third)
+    await db_session.flush()
+    edge = Edge(
+        id=uuid.uuid4(),
+        from_node_id=third.id,
+        to_node_id=second_node.id,
+        edge_type_id=sample_edge_type.id,
+    )
+    db_session.add(edge)
+    await db_session.flush()
+
+    resp = await client.get(
+        "/api/graph/path",
+        params={"from_id": str(sample_node.id), "to_id": str(third.id)},
+    )
+    assert resp.status_code == 200
+    path = resp.json()["path"]
+    assert [s["node_id"] for s in path] == [
+        str(sample_node.id),
+        str(second_node.id),
+        str(third.id),
+    ]
+    assert path[0]["edge_id"] is None
+    assert path[1]["edge_id"] == str(sample_edge.id)
+    assert path[2]["edge_id"] == str(edge.id)
+    assert path[2]["edge_type_id"] == sample_edge_type.id
+    assert path[2]["node_title"] == "Derde node"
+    assert path[2]["node_type"] == "maatregel"
+
+
+async def test_find_path_respects_max_depth(
+    client, db_session, sample_node, second_node, sample_edge, sample_edge_type
+):
+    """A two-hop path is found with max_depth=2 but not with max_depth=1."""
+    from bouwmeester.models.edge import Edge
+
+    third = CorpusNode(
+        id=uuid.uuid4(), title="Derde node", node_type="maatregel", status="actief"
+    )
+    db_session.add(third)
+    await db_session.flush()
+    db_session.add(
+        Edge(
+            id=uuid.uuid4(),
+            from_node_id=second_node.id,
+            to_node_id=third.id,
+            edge_type_id=sample_edge_type.id,
+        )
+    )
+    await db_session.flush()
+    params = {"from_id": str(sample_node.id), "to_id": str(third.id)}
+
+    resp = await client.get("/api/graph/path", params={**params, "max_depth": 1})
+    assert resp.status_code == 200
+    assert resp.json()["path"] == []
+
+    resp = await client.get("/api/graph/path", params={**params, "max_depth": 2})
+    assert resp.status_code == 200
+    assert [s["node_id"] for s in resp.json()["path"]] == [
+        str(sample_node.id),
+        str(second_node.id),
+        str(third.id),
+    ]
+
+
+async def test_find_path_follows_edge_create_and_delete(
+    client, sample_node, second_node, sample_edge_type
+):
+    """Edges created and deleted via the API are reflected in path results."""
+    params = {"from_id": str(sample_node.id), "to_id": str(second_node.id)}
+    resp = await client.get("/api/graph/path", params=params)
+    assert resp.json()["path"] == []
+
+    create = await client.post(
+        "/api/edges",
+        json={
+            "from_node_id": str(sample_node.id),
+            "to_node_id": str(second_node.id),
+            "edge_type_id": sample_edge_type.id,
+        },
+    )
+    assert create.status_code == 201
+    edge_id = create.json()["id"]
+
+    resp = await client.get("/api/graph/path", params=params)
+    assert resp.json()["length"] == 2
+    assert resp.json()["path"][1]["edge_id"] == edge_id
+
+    delete = await client.delete(f"/api/edges/{edge_id}")
+    assert delete.status_code == 204
+
+    resp = await client.get("/api/graph/path", params=params)
+    assert resp.json()["path"] == []
+
+
+# ---------------------------------------------------------------------------
+# Adjacency index (unit)
+# ---------------------------------------------------------------------------
+
+
+def test_adjacency_index_shortest_path_and_overlay():
+    """Bidirectional BFS finds shortest paths across CSR and overlay edges."""
+    from bouwmeester.core.graph_index import AdjacencyIndex
+
+    a, b, c, d = (uuid.uuid4() for _ in range(4))
+    ab, bc, cd, ad = (uuid.uuid4() for _ in range(4))
+    index = AdjacencyIndex([(ab, a, b, "x"), (bc, b, c, "x"), (cd, c, d, "y")])
+
+    path = index.shortest_path(a, d, max_depth=10)
+    assert [step[0] for step in path] == [a, b, c, d]
+    assert index.shortest_path(a, d, max_depth=2) is None
+
+    index.add_edge(ad, a, d, "z")
+    assert index.shortest_path(d, a, max_depth=1) == [(d, None, None), (a, ad, "z")]
+
+    index.remove_edge(ad)
+    index.remove_edge(bc)
+    assert index.shortest_path(a, d, max_depth=10) is None
+
+    index.compact()
+    assert index.edge_count == 2
+    assert index.shortest_path(c, d, max_depth=1) == [(c, None, None), (d, cd, "y")]
+
+
+async def test_graph_index_sees_edge_type_change_by_other_worker(
+    db_session, sample_node, second_node, sample_edge
+):
+    """A retype without a local note still reaches the index via updated_at."""
+    from bouwmeester.core.graph_index import get_graph_index
+
+    index = await get_graph_index(db_session)
+    path = index.shortest_path(sample_node.id, second_node.id, max_depth=1)
+    assert path[1][2] == sample_edge.edge_type_id
+
+    sample_edge.edge_type_id = "onderdeel_van"
+    await db_session.flush()
+
+    index = await get_graph_index(db_session)
+    path = index.shortest_path(sample_node.id, second_node.id, max_depth=1)
+    assert path[1][2] == "onderdeel_van"
+
+
+async def test_graph_index_notes_wait_for_commit(
+    db_session, sample_node, second_node, sample_edge
+):
+    """A note from a rolled-back savepoint never reaches the index."""
+    from bouwmeester.core.graph_index import get_graph_index, note_edge_deleted
+
+    index = await get_graph_index(db_session)
+    with pytest.raises(RuntimeError):
+        async with db_session.begin_nested():
+            note_edge_deleted(db_session, sample_edge.id)
+            raise RuntimeError
+    await db_session.commit()
+    assert index.shortest_path(sample_node.id, second_node.id, max_depth=1)
+
+    note_edge_deleted(db_session, sample_edge.id)
+    assert index.shortest_path(sample_node.id, second_node.id, max_depth=1)
+    await db_session.commit()
+    assert index.shortest_path(sample_node.id, second_node.id, max_depth=1) is None
+
+
+# ---------------------------------------------------------------------------
+# Node subgraph (frontier expansion)
+# ---------------------------------------------------------------------------
+
+
+async def _make_star(db_session, hub, edge_type_id, count, node_type="maatregel"):
+    """Attach *count* fresh leaf nodes to *hub* and return them."""
+    from bouwmeester.models.edge import Edge
+
+    leaves = [
+        CorpusNode(
+            id=uuid.uuid4(), title=f"Blad {i}", node_type=node_type, status="actief"
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(leaves)
+    await db_session.flush()
+    db_session.add_all(
+        Edge(
+            id=uuid.uuid4(),
+            from_node_id=hub.id,
+            to_node_id=leaf.id,
+            edge_type_id=edge_type_id,
+        )
+        for leaf in leaves
+    )
+    await db_session.flush()
+    return leaves
+
+
+async def test_node_graph_level_counts(
+    client, db_session, sample_node, second_node, sample_edge, sample_edge_type
+):
+    """GET /api/nodes/{id}/graph reports nodes reached per level."""
+    await _make_star(db_session, second_node, sample_edge_type.id, 3)
+
+    resp = await client.get(f"/api/nodes/{sample_node.id}/graph", params={"depth": 2})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["truncated"] is False
+    assert data["level_counts"] == [1, 1, 3]
+    assert len(data["nodes"]) == 5
+    assert len(data["edges"]) == 4
+
+
+async def test_node_graph_truncates_at_max_nodes(
+    client, db_session, sample_node, sample_edge_type
+):
+    """Expansion stops at max_nodes and flags the result as truncated."""
+    await _make_star(db_session, sample_node, sample_edge_type.id, 6)
+
+    resp = await client.get(
+        f"/api/nodes/{sample_node.id}/graph", params={"depth": 3, "max_nodes": 4}
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["truncated"] is True
+    assert data["level_counts"] == [1, 3]
+    assert len(data["nodes"]) == 4
+    assert len(data["edges"]) == 3
+    assert all(e["from_node_id"] == str(sample_node.id) for e in data["edges"])
+
+
+async def test_node_graph_filters_node_and_edge_types(
+    client, db_session, sample_node, second_node, sample_edge, sample_edge_type
+):
+    """node_types / edge_types restrict which neighbours are expanded."""
+    await _make_star(db_session, sample_node, sample_edge_type.id, 2, "instrument")
+
+    resp = await client.get(
+        f"/api/nodes/{sample_node.id}/graph", params={"node_types": "instrument"}
+    )
+    data = resp.json()
+    types = {n["id"]: n["node_type"] for n in data["nodes"]}
+    assert str(second_node.id) not in types
+    assert data["level_counts"] == [1, 2]
+
+    resp = await client.get(
+        f"/api/nodes/{sample_node.id}/graph", params={"edge_types": "bestaat_niet"}
+    )
+    data = resp.json()
+    assert [n["id"] for n in data["nodes"]] == [str(sample_node.id)]
+    assert data["edges"] == []
+
+
+# ---------------------------------------------------------------------------
+# Graph search (NDJSON streaming)
+# ---------------------------------------------------------------------------
+
+
+async def test_graph_search_ndjson_stream(
+    client, sample_node, second_node, sample_edge
+):
+    """Accept: application/x-ndjson streams nodes first, then edges."""
+    import json
+
+    resp = await client.get(
+        "/api/graph/search", headers={"Accept": "application/x-ndjson"}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    kinds = [next(iter(line)) for line in lines]
+    assert kinds == sorted(kinds, key=lambda k: k != "node")
+    node_ids = {line["node"]["id"] for line in lines if "node" in line}
+    edge_ids = {line["edge"]["id"] for line in lines if "edge" in line}
+    assert {str(sample_node.id), str(second_node.id)} <= node_ids
+    assert str(sample_edge.id) in edge_ids
+
+
+async def test_graph_search_ndjson_node_type_filter(
+    client, sample_node, second_node, sample_edge
+):
+    """Streaming drops edges whose endpoints fall outside node_types."""
+    import json
+
+    resp = await client.get(
+        "/api/graph/search",
+        params={"node_types": "dossier"},
+        headers={"Accept": "application/x-ndjson"},
+    )
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert all(
+        line["node"]["node_type"] == "dossier" for line in lines if "node" in line
+    )
+    assert str(sample_edge.id) not in {
+        line["edge"]["id"] for line in lines if "edge" in line
+    }
+
+
+# ---------------------------------------------------------------------------
+# Binary graph payload
+# ---------------------------------------------------------------------------
+
+BINARY_ACCEPT = {"Accept": "application/vnd.bouwmeester.graph"}
+
+
+async def test_graph_search_binary_roundtrip(
+    client, sample_node, second_node, sample_edge
+):
+    """The binary graph/search payload decodes to the same nodes and edges."""
+    from bouwmeester.utils.graph_binary import decode_graph
+
+    json_resp = await client.get("/api/graph/search")
+    resp = await client.get("/api/graph/search", headers=BINARY_ACCEPT)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/vnd.bouwmeester.graph"
+    assert len(resp.content) < len(json_resp.content)
+
+    graph = decode_graph(resp.content)
+    nodes = {n["id"]: n for n in graph["nodes"]}
+    assert nodes[sample_node.id]["title"] == "Test dossier"
+    assert nodes[sample_node.id]["node_type"] == "dossier"
+    assert nodes[sample_node.id]["description"] is None
+    edge = next(e for e in graph["edges"] if e["id"] == sample_edge.id)
+    assert edge["from_node_id"] == sample_node.id
+    assert edge["to_node_id"] == second_node.id
+    assert edge["edge_type_id"] == sample_edge.edge_type_id
+    assert edge["weight"] == 1.0
+
+
+async def test_node_graph_binary_with_descriptions(
+    client, sample_node, second_node, sample_edge
+):
+    """Descriptions and subgraph metadata are included when requested."""
+    from bouwmeester.utils.graph_binary import decode_graph
+
+    resp = await client.get(
+        f"/api/nodes/{sample_node.id}/graph",
+        params={"include_descriptions": True},
+        headers=BINARY_ACCEPT,
+    )
+    assert resp.status_code == 200
+    graph = decode_graph(resp.content)
+    assert graph["meta"] == {"truncated": False, "level_counts": [1, 1]}
+    descriptions = {n["id"]: n["description"] for n in graph["nodes"]}
+    assert descriptions == {
+        sample_node.id: "Testomschrijving",
+        second_node.id: "Doelomschrijving",
+    }
+    assert [e["id"] for e in graph["edges"]] == [sample_edge.id]
+
+
+# ---------------------------------------------------------------------------
+# Hierarchy closure: /graph/descendants and /graph/ancestors
+# ---------------------------------------------------------------------------
+
+
+async def _make_nodes(db_session, *titles, node_type="maatregel"):
+    nodes = [
+        CorpusNode(id=uuid.uuid4(), title=t, node_type=node_type, status="actief")
+        for t in titles
+    ]
+    db_session.add_all(nodes)
+    await db_session.flush()
+    return nodes
+
+
+async def _link(client, child, parent, edge_type_id="onderdeel_van"):
+    resp = await client.post(
+        "/api/edges",
+        json={
+            "from_node_id": str(child.id),
+            "to_node_id": str(parent.id),
+            "edge_type_id": edge_type_id,
+        },
+    )
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+async def _depths(client, direction, node, **params):
+    resp = await client.get(
+        f"/api/graph/{direction}", params={"node_id": str(node.id), **params}
+    )
+    assert resp.status_code == 200
+    return {e["node"]["title"]: e["depth"] for e in resp.json()["nodes"]}
+
+
+async def test_closure_tracks_edge_creation(client, db_session):
+    """A chain built in any order is fully closed."""
+    root, mid, leaf = await _make_nodes(db_session, "Root", "Mid", "Leaf")
+    await _link(client, leaf, mid)
+    await _link(client, mid, root)
+
+    assert await _depths(client, "descendants", root) == {"Mid": 1, "Leaf": 2}
+    assert await _depths(client, "ancestors", leaf) == {"Mid": 1, "Root": 2}
+    assert await _depths(client, "descendants", root, max_depth=1) == {"Mid": 1}
+
+
+async def test_closure_ignores_non_hierarchical_types(
+    client, db_session, sample_edge_type
+):
+    parent, child = await _make_nodes(db_session, "Ouder", "Kind")
+    await _link(client, child, parent, sample_edge_type.id)
+    assert await _depths(client, "descendants", parent) == {}
+
+
+async def test_closure_shortcut_and_delete(client, db_session):
+    """Deleting an edge keeps pairs still reachable through another path."""
+    root, mid, leaf = await _make_nodes(db_session, "Root", "Mid", "Leaf")
+    await _link(client, leaf, mid)
+    await _link(client, mid, root)
+    shortcut = await _link(client, leaf, root)
+    assert (await _depths(client, "ancestors", leaf))["Root"] == 1
+
+    assert (await client.delete(f"/api/edges/{shortcut}")).status_code == 204
+    assert await _depths(client, "ancestors", leaf) == {"Mid": 1, "Root": 2}
+
+    middle = (
+        await client.get("/api/edges", params={"from_node_id": str(mid.id)})
+    ).json()[0]["id"]
+    assert (await client.delete(f"/api/edges/{middle}")).status_code == 204
+    assert await _depths(client, "ancestors", leaf) == {"Mid": 1}
+    assert await _depths(client, "descendants", root) == {}
+
+
+async def test_closure_node_delete_splits_chain(client, db_session):
+    root, mid, leaf = await _make_nodes(db_session, "Root", "Mid", "Leaf")
+    await _link(client, leaf, mid)
+    await _link(client, mid, root)
+
+    assert (await client.delete(f"/api/nodes/{mid.id}")).status_code == 204
+    assert await _depths(client, "ancestors", leaf) == {}
+    assert await _depths(client, "descendants", root) == {}
+
+
+async def test_closure_rebuild_matches_incremental(client, db_session):
+    """A full rebuild reproduces what incremental maintenance produced."""
+    from sqlalchemy import select
+
+    from bouwmeester.models.edge_closure import EdgeClosure
+    from bouwmeester.repositories.edge_closure import EdgeClosureRepository
+
+    a, b, c, d = await _make_nodes(db_session, "A", "B", "C", "D")
+    await _link(client, b, a)
+    await _link(client, c, b)
+    await _link(client, d, b)
+    await _link(client, d, a, "draagt_bij_aan")
+    await _link(client, a, d)  # cycle
+
+    stmt = select(
+        EdgeClosure.ancestor_id,
+        EdgeClosure.edge_type_id,
+        EdgeClosure.descendant_id,
+        EdgeClosure.depth,
+    ).where(EdgeClosure.descendant_id.in_([a.id, b.id, c.id, d.id]))
+    incremental = set((await db_session.execute(stmt)).all())
+    await EdgeClosureRepository(db_session).rebuild()
+    assert set((await db_session.execute(stmt)).all()) == incremental
+
+
+# ---------------------------------------------------------------------------
+# Diff
+# ---------------------------------------------------------------------------
+
+
+async def _diff(client, from_date, to_date=None):
+    params = {"from": str(from_date)}
+    if to_date is not None:
+        params["to"] = str(to_date)
+    resp = await client.get("/api/graph/diff", params=params)
+    assert resp.status_code == 200
+    return resp.json()
+
+
+async def test_diff_temporal_node_changes(client):
+    resp = await client.post(
+        "/api/nodes",
+        json={"title": "Eerst", "node_type": "doel", "geldig_van": "2024-01-01"},
+    )
+    node_id = resp.json()["id"]
+    await client.put(
+        f"/api/nodes/{node_id}",
+        json={"title": "Daarna", "wijzig_datum": "2025-01-01"},
+    )
+
+    data = await _diff(client, "2023-06-01", "2024-06-01")
+    assert node_id in {n["id"] for n in data["nodes_added"]}
+
+    data = await _diff(client, "2024-06-01", "2025-06-01")
+    changed = {n["id"]: n for n in data["nodes_changed"]}
+    assert changed[node_id]["title"] == "Daarna"
+    assert changed[node_id]["previous_title"] == "Eerst"
+    assert changed[node_id]["previous_status"] is None
+    assert node_id not in {n["id"] for n in data["nodes_added"]}
+
+
+async def test_diff_edges_from_activity_log(
+    client, db_session, sample_node, second_node, sample_edge_type
+):
+    from datetime import date, datetime, timedelta
+
+    from bouwmeester.models.edge import Edge
+
+    old_edge = Edge(
+        id=uuid.uuid4(),
+        from_node_id=second_node.id,
+        to_node_id=sample_node.id,
+        edge_type_id=sample_edge_type.id,
+        created_at=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+    db_session.add(old_edge)
+    await db_session.flush()
+
+    new_edge = await _link(client, sample_node, second_node, sample_edge_type.id)
+    temp_edge = await _link(client, sample_node, second_node, "onderdeel_van")
+    await client.delete(f"/api/edges/{old_edge.id}")
+    await client.delete(f"/api/edges/{temp_edge}")
+
+    yesterday = date.today() - timedelta(days=1)
+    data = await _diff(client, yesterday)
+    assert data["to_date"] == str(date.today())
+    assert {e["id"] for e in data["edges_added"]} == {new_edge}
+    # Created and deleted within the period: not reported at all.
+    assert {e["id"] for e in data["edges_removed"]} == {str(old_edge.id)}
+
+    # Nothing before the period shows up.
+    data = await _diff(client, "2020-01-01", "2023-01-01")
+    assert data["edges_added"] == [] and data["edges_removed"] == []
+
+
+async def test_diff_hard_deleted_node(
+    client, db_session, sample_node, second_node, sample_edge_type
+):
+    from datetime import date, datetime, timedelta
+
+    from bouwmeester.models.edge import Edge
+
+    sample_node.created_at = datetime(2024, 1, 1, tzinfo=UTC)
+    old_edge = Edge(
+        id=uuid.uuid4(),
+        from_node_id=second_node.id,
+        to_node_id=sample_node.id,
+        edge_type_id=sample_edge_type.id,
+        created_at=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+    db_session.add(old_edge)
+    await db_session.flush()
+    new_edge = await _link(client, sample_node, second_node, "onderdeel_van")
+    resp = await client.post("/api/nodes", json={"title": "Kort", "node_type": "doel"})
+    short_lived = resp.json()["id"]
+
+    assert (await client.delete(f"/api/nodes/{sample_node.id}")).status_code == 204
+    assert (await client.delete(f"/api/nodes/{short_lived}")).status_code == 204
+    data = await _diff(client, date.today() - timedelta(days=1))
+    removed = {n["id"]: n for n in data["nodes_removed"]}
+    assert removed[str(sample_node.id)]["title"] == "Test dossier"
+    # Created and deleted within the period: not reported at all.
+    assert short_lived not in removed
+    # The cascade removed the old edge; the new one never counted.
+    edges_removed = {e["id"]: e for e in data["edges_removed"]}
+    assert set(edges_removed) == {str(old_edge.id)}
+    assert edges_removed[str(old_edge.id)]["to_node_id"] == str(sample_node.id)
+    assert new_edge not in {e["id"] for e in data["edges_added"]}
+
+
+async def test_diff_rejects_reversed_period(client):
+    resp = await client.get(
+        "/api/graph/diff", params={"from": "2025-01-01", "to": "2024-01-01"}
+    )
+    assert resp.status_code == 400
@@ -0,0 +1,112 @@
+"""Tests for precomputed graph metrics and the /api/nodes metric filters."""
+
+import uuid
+
+import pytest
+
+from bouwmeester.models.corpus_node import CorpusNode
+from bouwmeester.services.graph_metrics_service import (
+    GraphMetricsService,
+    compute_graph_metrics,
+)
+
+# ---------------------------------------------------------------------------
+# Pure computation
+# ---------------------------------------------------------------------------
+
+
+def test_compute_graph_metrics_star_and_orphan():
+    """A star centre dominates degree, PageRank and betweenness."""
+    centre, a, b, c, lone = (uuid.uuid4() for _ in range(5))
+    edges = [(a, centre), (b, centre), (c, centre)]
+    metrics = compute_graph_metrics([centre, a, b, c, lone], edges)
+
+    assert metrics[centre].degree == 3
+    assert metrics[centre].in_degree == 3
+    assert metrics[a].out_degree == 1
+    assert metrics[centre].pagerank > metrics[a].pagerank
+    assert sum(m.pagerank for m in metrics.values()) == pytest.approx(1.0)
+    # Centre lies on every shortest path between the three leaves.
+    assert metrics[centre].betweenness == pytest.approx(0.5)
+    assert metrics[a].betweenness == 0
+
+    assert metrics[centre].component_id == 1
+    assert metrics[centre].component_size == 4
+    assert metrics[lone].component_id == 2
+    assert metrics[lone].component_size == 1
+    assert metrics[lone].is_orphan
+    assert not metrics[a].is_orphan
+
+
+def test_compute_graph_metrics_sampled_betweenness():
+    """Sampling fewer sources still ranks the bridge node highest."""
+    left = [uuid.uuid4() for _ in range(10)]
+    right = [uuid.uuid4() for _ in range(10)]
+    bridge = uuid.uuid4()
+    edges = [(n, left[0]) for n in left[1:]]
+    edges += [(n, right[0]) for n in right[1:]]
+    edges += [(left[0], bridge), (bridge, right[0])]
+    metrics = compute_graph_metrics(
+        [*left, *right, bridge], edges, betweenness_samples=8
+    )
+    top = max(metrics, key=lambda nid: metrics[nid].betweenness)
+    assert top in {left[0], right[0], bridge}
+    assert metrics[bridge].betweenness > metrics[left[1]].betweenness
+
+
+# ---------------------------------------------------------------------------
+# Refresh + API
+# ---------------------------------------------------------------------------
+
+
+async def test_refresh_writes_only_changed_rows(db_session, sample_edge):
+    service = GraphMetricsService(db_session)
+    first = await service.refresh(force=True)
+    assert first is not None
+    # Nothing changed since the previous run: skipped entirely.
+    assert await service.refresh() is None
+    # An edge update (here a retype) is a change, even if no metric moves.
+    sample_edge.edge_type_id = "onderdeel_van"
+    await db_session.flush()
+    assert await service.refresh() == 0
+    assert await service.refresh() is None
+    # Forced recomputation of an unchanged graph writes nothing.
+    assert await service.refresh(force=True) == 0
+
+
+async def test_list_nodes_includes_metrics(
+    client, db_session, sample_node, second_node, sample_edge
+):
+    await GraphMetricsService(db_session).refresh(force=True)
+    resp = await client.get("/api/nodes", params={"limit": 500})
+    assert resp.status_code == 200
+    by_id = {n["id"]: n for n in resp.json()}
+    metrics = by_id[str(sample_node.id)]["metrics"]
+    assert metrics["degree"] == 1
+    assert metrics["out_degree"] == 1
+    assert metrics["is_orphan"] is False
+
+
+async def test_list_nodes_sort_and_orphan_filter(
+    client, db_session, sample_node, second_node, sample_edge
+):
+    lone = CorpusNode(id=uuid.uuid4(), title="Los", node_type="dossier")
+    db_session.add(lone)
+    await db_session.flush()
+    await GraphMetricsService(db_session).refresh(force=True)
+
+    resp = await client.get("/api/nodes", params={"orphan": "true", "limit": 500})
+    assert resp.status_code == 200
+    ids = {n["id"] for n in resp.json()}
+    assert str(lone.id) in ids
+    assert str(sample_node.id) not in ids
+
+    resp = await client.get("/api/nodes", params={"sort_by": "degree", "limit": 500})
+    assert resp.status_code == 200
+    degrees = [n["metrics"]["degree"] for n in resp.json() if n["metrics"]]
+    assert degrees == sorted(degrees, reverse=True)
+
+
+async def test_list_nodes_rejects_unknown_sort(client):
+    resp = await client.get("/api/nodes", params={"sort_by": "title"})
+    assert resp.status_code == 422
@@ -1,7 +1,7 @@
 """Tests for import strategy pattern, registry, and new strategies."""
 
 import uuid
-from datetime import date, datetime
+from datetime import UTC, date, datetime
 from unittest.mock import AsyncMock
 
 import pytest
@@ -469,6 +469,151 @@ class TestODataEscape:
         assert _odata_escape("a'b'c") == "a''b''c"
 
 
+class TestZaakEnrichment:
+    """fetch_zaak_by_soort enriches zaken concurrently, within its bound."""
+
+    @pytest.mark.anyio
+    async def test_enrichment_is_bounded_and_keeps_order(self):
+        import asyncio
+
+        import httpx
+
+        zaak_ids = [str(uuid.uuid4()) for _ in range(6)]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            value = [{"Id": zid, "Nummer": f"Z{i}"} for i, zid in enumerate(zaak_ids)]
+            return httpx.Response(200, json={"value": value})
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_indieners(zaak_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [f"indiener {zaak_id}"]
+
+        async def fake_document(zaak_id, zaak_nummer):
+            return None, None
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = TweedeKamerClient(
+                base_url="https://tk.example", http_client=http, enrich_concurrency=2
+            )
+            client._fetch_indieners = fake_indieners
+            client._fetch_document_text = fake_document
+            zaken = await client.fetch_zaak_by_soort(soort="Motie")
+            await client.close()
+            assert not http.is_closed  # shared client is left to its owner
+
+        assert [z.zaak_id for z in zaken] == zaak_ids
+        assert zaken[0].indieners == [f"indiener {zaak_ids[0]}"]
+        assert peak == 2
+
+
+class TestIncrementalFetch:
+    """Polls since a watermark page oldest-first; watermarks skip failures."""
+
+    @pytest.mark.anyio
+    async def test_since_pages_through_next_link(self):
+        import httpx
+
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            page = request.url.params.get("page", "1")
+            if page == "1":
+                return httpx.Response(
+                    200,
+                    json={
+                        "value": [
+                            {"Id": "t1", "GewijzigdOp": "2026-03-01T10:00:00Z"},
+                            {"Id": "t2", "GewijzigdOp": "2026-03-02T10:00:00Z"},
+                        ],
+                        "@odata.nextLink": "https://tk.example/Toezegging?page=2",
+                    },
+                )
+            return httpx.Response(
+                200,
+                json={
+                    "value": [
+                        {"Id": "t3", "GewijzigdOp": "2026-03-03T10:00:00Z"},
+                        {"Id": "t4", "GewijzigdOp": "2026-03-04T10:00:00Z"},
+                    ],
+                    "@odata.nextLink": "https://tk.example/Toezegging?page=3",
+                },
+            )
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = TweedeKamerClient(base_url="https://tk.example", http_client=http)
+            results = await client.fetch_toezeggingen(
+                since=datetime(2026, 3, 1, tzinfo=UTC), limit=3
+            )
+
+        assert [t.toezegging_id for t in results] == ["t1", "t2", "t3"]
+        assert results[-1].gewijzigd_op == datetime(2026, 3, 3, 10, tzinfo=UTC)
+        assert len(requests) == 2  # stops once the limit is reached
+        first = requests[0].url.params
+        assert "GewijzigdOp ge 2026-03-01T00:00:00.000000Z" in first["$filter"]
+        assert first["$orderby"] == "GewijzigdOp asc"
+
+    def test_watermark_stops_before_first_failure(self):
+        from bouwmeester.services.parlementair_import_service import next_watermarks
+
+        def item(zaak_id, day, bron="tweede_kamer"):
+            return FetchedItem(
+                zaak_id=zaak_id,
+                zaak_nummer=zaak_id,
+                titel="",
+                onderwerp="",
+                bron=bron,
+                gewijzigd_op=datetime(2026, 3, day, tzinfo=UTC),
+            )
+
+        items = [
+            item("a", 1),
+            item("b", 2),
+            item("c", 3),
+            item("d", 4),
+            item("e", 5, bron="eerste_kamer"),
+        ]
+        watermarks = next_watermarks(items, failed=[items[2]])
+
+        assert watermarks == {
+            "tweede_kamer": datetime(2026, 3, 2, tzinfo=UTC),
+            "eerste_kamer": datetime(2026, 3, 5, tzinfo=UTC),
+        }
+
+    def test_permanently_failing_item_is_skipped_after_max_attempts(self):
+        from bouwmeester.services import parlementair_import_service as svc
+
+        items = [
+            FetchedItem(
+                zaak_id=zaak_id,
+                zaak_nummer=zaak_id,
+                titel="",
+                onderwerp="",
+                bron="tweede_kamer",
+                gewijzigd_op=datetime(2026, 3, day, tzinfo=UTC),
+            )
+            for zaak_id, day in (("a", 1), ("broken", 2), ("c", 3))
+        ]
+        svc.reset_failure_counts()
+        try:
+            marks = []
+            for _ in range(svc.IMPORT_MAX_ATTEMPTS):
+                retry = svc.retryable_failures(items, failed=[items[1]])
+                marks.append(svc.next_watermarks(items, retry)["tweede_kamer"])
+        finally:
+            svc.reset_failure_counts()
+
+        held = [datetime(2026, 3, 1, tzinfo=UTC)] * (svc.IMPORT_MAX_ATTEMPTS - 1)
+        assert marks == [*held, datetime(2026, 3, 3, tzinfo=UTC)]
+
+
 # ---------------------------------------------------------------------------
 # API filter: type parameter
 # ---------------------------------------------------------------------------
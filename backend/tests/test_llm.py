@@ -1,6 +1,8 @@
 """Tests for the LLM multi-provider architecture, admin config, and API endpoints."""
 
+import asyncio
 import uuid
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -8,9 +10,11 @@ import pytest
 from bouwmeester.services.llm.base import (
     BaseLLMService,
     DataSensitivity,
+    EdgeCandidate,
     EdgeRelevanceResult,
     ProviderCapabilities,
     SummarizeResult,
+    TagExtractionInput,
     TagExtractionResult,
     TagSuggestionResult,
 )
@@ -21,9 +25,14 @@ from bouwmeester.services.llm.factory import (
 )
 from bouwmeester.services.llm.prompts import (
     MAX_DESCRIPTION_IN_PROMPT,
+    MAX_ITEMS_PER_BATCH,
     MAX_TAGS_IN_PROMPT,
     MAX_TEXT_IN_PROMPT,
+    MAX_TEXT_PER_BATCH,
+    batch_chunks,
+    build_edge_relevance_batch_prompt,
     build_edge_relevance_prompt,
+    build_extract_tags_batch_prompt,
     build_extract_tags_prompt,
     build_suggest_tags_prompt,
     build_summarize_prompt,
@@ -177,6 +186,170 @@ class TestBaseLLMServiceMethods:
         assert isinstance(result, SummarizeResult)
         assert result.summary == "Een korte samenvatting."
 
+    @pytest.mark.asyncio
+    async def test_extract_tags_batch_falls_back_per_item(self):
+        batch = (
+            '{"items": ['
+            '{"item": 1, "samenvatting": "een", "matched_tags": ["a"],'
+            ' "suggested_new_tags": []},'
+            '{"item": 2, "samenvatting": "twee", "matched_tags": "geen lijst"}'
+            "]}"
+        )
+        single = '{"samenvatting": "los", "matched_tags": ["b"]}'
+        service = DummyLLMService(responses=[batch, single])
+        results = await service.extract_tags_batch(
+            items=[
+                TagExtractionInput(titel="T1", onderwerp="O1"),
+                TagExtractionInput(titel="T2", onderwerp="O2"),
+            ],
+            bestaande_tags=["a", "b"],
+        )
+        assert [r.matched_tags for r in results] == [["a"], ["b"]]
+        assert results[1].samenvatting == "los"
+        assert service._call_idx == 2
+
+    @pytest.mark.asyncio
+    async def test_score_edges_batch(self):
+        batch = (
+            '{"items": ['
+            '{"item": 2, "score": 0.2, "suggested_edge_type": "vereist",'
+            ' "reason": "twee"},'
+            '{"item": 1, "score": 0.9, "suggested_edge_type": "meet",'
+            ' "reason": "een"}'
+            "]}"
+        )
+        service = DummyLLMService(responses=[batch])
+        results = await service.score_edges_batch(
+            source_title="Bron",
+            source_description=None,
+            candidates=[EdgeCandidate(title="A"), EdgeCandidate(title="B")],
+        )
+        assert [r.score for r in results] == [0.9, 0.2]
+        assert results[0].suggested_edge_type == "meet"
+        assert service._call_idx == 1
+
+    @pytest.mark.asyncio
+    async def test_score_edges_batch_unparseable_scores_each(self):
+        single = '{"score": 0.5, "suggested_edge_type": "meet", "reason": "r"}'
+        service = DummyLLMService(responses=["geen json", single, single])
+        results = await service.score_edges_batch(
+            source_title="Bron",
+            source_description=None,
+            candidates=[EdgeCandidate(title="A"), EdgeCandidate(title="B")],
+        )
+        assert [r.score for r in results] == [0.5, 0.5]
+        assert service._call_idx == 3
+
+    @pytest.mark.asyncio
+    async def test_score_edges_batch_fallbacks_run_concurrently(self):
+        class SlowLLMService(DummyLLMService):
+            running = peak = 0
+
+            async def _complete(self, prompt, max_tokens=1024):
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+                await asyncio.sleep(0.01)
+                self.running -= 1
+                return await super()._complete(prompt, max_tokens)
+
+        single = '{"score": 0.5, "suggested_edge_type": "meet", "reason": "r"}'
+        service = SlowLLMService(responses=["geen json"] + [single] * 3)
+        results = await service.score_edges_batch(
+            source_title="Bron",
+            source_description=None,
+            candidates=[EdgeCandidate(title=t) for t in "ABC"],
+        )
+        assert [r.score for r in results] == [0.5, 0.5, 0.5]
+        assert service.peak == 3
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+
+class FakeResultCache:
+    """In-memory stand-in for LLMResultCache."""
+
+    def __init__(self):
+        self.entries: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.entries.get(key)
+
+    async def put(self, key, operation, model, response):
+        self.entries[key] = response
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_repeat_call_is_served_from_cache(self):
+        resp = '{"matched_tags": ["x"], "suggested_new_tags": []}'
+        service = DummyLLMService(responses=[resp])
+        service.cache = FakeResultCache()
+
+        for _ in range(2):
+            result = await service.suggest_tags(
+                title="T", description=None, node_type="dossier", bestaande_tags=[]
+            )
+            assert result.matched_tags == ["x"]
+        assert service._call_idx == 1
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_is_not_cached(self):
+        service = DummyLLMService(responses=["not json"])
+        service.cache = FakeResultCache()
+
+        await service.suggest_tags(
+            title="T", description=None, node_type="dossier", bestaande_tags=[]
+        )
+        assert service.cache.entries == {}
+
+    def test_key_depends_on_operation_model_and_prompt(self):
+        from bouwmeester.services.llm.cache import cache_key
+
+        key = cache_key("summarize", "m1", "prompt")
+        assert key == cache_key("summarize", "m1", "prompt")
+        assert key != cache_key("summarize", "m2", "prompt")
+        assert key != cache_key("extract_tags", "m1", "prompt")
+        assert key != cache_key("summarize", "m1", "prompt2")
+
+    @pytest.mark.asyncio
+    async def test_table_cache_ttl_counters_and_eviction(self, db_session):
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        from bouwmeester.models.llm_cache import LLMCacheEntry
+        from bouwmeester.services.llm.cache import LLMResultCache
+
+        factory = async_sessionmaker(
+            bind=db_session.bind, join_transaction_mode="create_savepoint"
+        )
+        cache = LLMResultCache(factory, ttl_seconds=3600, max_entries=1)
+
+        assert await cache.get("k1") is None
+        await cache.put("k1", "summarize", "m", "eerste")
+        await cache.put("k2", "summarize", "m", "tweede")
+        assert await cache.get("k2") == "tweede"
+        assert cache.stats() == {"hits": 1, "misses": 1}
+
+        entry = await db_session.get(LLMCacheEntry, "k2")
+        assert entry.hit_count == 1
+        # now() is fixed within the test transaction; age k1 explicitly.
+        older = await db_session.get(LLMCacheEntry, "k1")
+        older.last_used_at = datetime(2020, 1, 1, tzinfo=UTC)
+        await db_session.flush()
+
+        async with factory() as session:
+            await cache._evict(session)
+            await session.commit()
+        db_session.expire_all()
+        assert await db_session.get(LLMCacheEntry, "k1") is None
+        assert await db_session.get(LLMCacheEntry, "k2") is not None
+
+        expired = LLMResultCache(factory, ttl_seconds=-1, max_entries=10)
+        await expired.put("k3", "summarize", "m", "verlopen")
+        assert await expired.get("k3") is None
+
 
 # ---------------------------------------------------------------------------
 # Prompts
@@ -227,6 +400,42 @@ class TestPrompts:
         # Descriptions are truncated at MAX_DESCRIPTION_IN_PROMPT chars
         assert "y" * (MAX_DESCRIPTION_IN_PROMPT + 1) not in prompt
 
+    def test_extract_tags_batch_prompt_sends_tags_once(self):
+        prompt = build_extract_tags_batch_prompt(
+            items=[("Motie A", "Wonen", None), ("Motie B", "Klimaat", "Tekst")],
+            bestaande_tags=["woningbouw/huur"],
+        )
+        assert prompt.count("woningbouw/huur") == 1
+        assert "ITEM 1:\nTITEL: Motie A" in prompt
+        assert "ITEM 2:\nTITEL: Motie B" in prompt
+
+    def test_batch_chunks_bounds_items_and_text(self):
+        texts = [None] * 12 + ["x" * MAX_TEXT_IN_PROMPT] * 3 + ["x" * 50_000]
+        chunks = list(batch_chunks(texts, lambda t: t))
+        assert [len(c) for c in chunks] == [MAX_ITEMS_PER_BATCH, 4, 2]
+        for chunk in chunks:
+            assert sum(min(len(t or ""), MAX_TEXT_IN_PROMPT) for t in chunk) <= (
+                MAX_TEXT_PER_BATCH
+            )
+
+    def test_extract_tags_batch_prompt_keeps_single_item_text_cap(self):
+        prompt = build_extract_tags_batch_prompt(
+            items=[("A", "O", "x" * (MAX_TEXT_IN_PROMPT + 10)), ("B", "O", None)],
+            bestaande_tags=[],
+        )
+        assert "x" * MAX_TEXT_IN_PROMPT in prompt
+        assert "x" * (MAX_TEXT_IN_PROMPT + 1) not in prompt
+
+    def test_edge_relevance_batch_prompt_numbers_candidates(self):
+        prompt = build_edge_relevance_batch_prompt(
+            source_title="Bron",
+            source_description="y" * 1000,
+            targets=[("A", None), ("B", "Beschrijving")],
+        )
+        assert "KANDIDAAT 1:\nTITEL: A" in prompt
+        assert "KANDIDAAT 2:\nTITEL: B" in prompt
+        assert "y" * (MAX_DESCRIPTION_IN_PROMPT + 1) not in prompt
+
     def test_summarize_prompt_truncates_text(self):
         long_text = "z" * (MAX_TEXT_IN_PROMPT + 500)
         prompt = build_summarize_prompt(text=long_text)
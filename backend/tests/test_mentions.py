@@ -2,6 +2,9 @@
 
 import uuid
 
+import pytest
+
+from bouwmeester.core.mention_index import MentionIndex, note_mentionable_saved
 from bouwmeester.models.mention import Mention
 
 # ---------------------------------------------------------------------------
@@ -34,6 +37,68 @@ async def test_search_mentionables_finds_node(client, sample_node):
     assert str(sample_node.id) in ids
 
 
+async def test_search_mentionables_follows_writes(client, db_session, sample_node):
+    """Renames and deletes through the API are reflected once committed."""
+    resp = await client.get("/api/mentions/search", params={"q": "dossier"})
+    assert str(sample_node.id) in {item["id"] for item in resp.json()}
+
+    await client.put(f"/api/nodes/{sample_node.id}", json={"title": "Zeespiegel"})
+    # Local notes reach the index on commit, which get_db does after a request.
+    await db_session.commit()
+    resp = await client.get("/api/mentions/search", params={"q": "zeesp"})
+    assert [item["label"] for item in resp.json()] == ["Zeespiegel"]
+    resp = await client.get("/api/mentions/search", params={"q": "dossier"})
+    assert str(sample_node.id) not in {item["id"] for item in resp.json()}
+
+    await client.delete(f"/api/nodes/{sample_node.id}")
+    await db_session.commit()
+    resp = await client.get("/api/mentions/search", params={"q": "zeesp"})
+    assert resp.json() == []
+
+
+async def test_rolled_back_rename_leaves_no_label(client, db_session, sample_node):
+    """A rename noted inside a rolled-back savepoint never reaches the index."""
+    await client.get("/api/mentions/search", params={"q": "dossier"})
+
+    with pytest.raises(RuntimeError):
+        async with db_session.begin_nested():
+            note_mentionable_saved(db_session, "node", sample_node.id, "Zeespiegel")
+            raise RuntimeError
+    await db_session.commit()
+
+    resp = await client.get("/api/mentions/search", params={"q": "zeesp"})
+    assert resp.json() == []
+    resp = await client.get("/api/mentions/search", params={"q": "dossier"})
+    assert str(sample_node.id) in {item["id"] for item in resp.json()}
+
+
+def test_mention_index_prefix_substring_and_ranking():
+    ids = [uuid.uuid4() for _ in range(4)]
+    index = MentionIndex(
+        [
+            ("node", ids[0], "Waterschapsbelasting", "dossier"),
+            ("node", ids[1], "Herziening waterwet", "politieke_input"),
+            ("task", ids[2], "Reëel begroten", "in_progress"),
+            ("tag", ids[3], "Klimaat", None),
+        ]
+    )
+    types = ["node", "task", "tag"]
+
+    # Label prefix ranks above a word prefix; short queries match words.
+    assert [e.id for e in index.search("wa", types, 10)] == [ids[0], ids[1]]
+    # Longer queries match anywhere in the label.
+    assert [e.id for e in index.search("schaps", types, 10)] == [ids[0]]
+    # Case- and accent-insensitive; subtitles are humanised.
+    (entry,) = index.search("REEEL", types, 10)
+    assert entry.subtitle == "in progress"
+    assert index.search("wa", ["tag"], 10) == []
+
+    index.upsert("tag", ids[3], "Klimaatadaptatie", None)
+    index.remove("node", ids[0])
+    assert [e.label for e in index.search("ada", types, 10)] == ["Klimaatadaptatie"]
+    assert [e.id for e in index.search("wa", types, 10)] == [ids[1]]
+
+
 # ---------------------------------------------------------------------------
 # References
 # ---------------------------------------------------------------------------
@@ -5,7 +5,7 @@ dissolution, active-only filtering, history endpoints, and wijzig_datum override
 """
 
 import uuid
-from datetime import date
+from datetime import UTC, date
 
 import pytest
 from httpx import AsyncClient
@@ -231,3 +231,111 @@ class TestHistory404:
             f"/api/nodes/{uuid.uuid4()}/history/statuses",
         )
         assert resp.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# as_of graph snapshots
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+async def historic_pair(client: AsyncClient, db_session) -> tuple[dict, dict]:
+    """Two nodes valid since 2024, renamed in 2025, linked by a 2024 edge."""
+    from datetime import datetime
+
+    from bouwmeester.models.edge import Edge
+
+    nodes = []
+    for title in ("Oude Naam", "Doel 2024"):
+        resp = await client.post(
+            "/api/nodes",
+            json={"title": title, "node_type": "dossier", "geldig_van": "2024-01-01"},
+        )
+        assert resp.status_code == 201
+        nodes.append(resp.json())
+    resp = await client.put(
+        f"/api/nodes/{nodes[0]['id']}",
+        json={
+            "title": "Nieuwe Naam",
+            "status": "afgerond",
+            "wijzig_datum": "2025-01-01",
+        },
+    )
+    assert resp.status_code == 200
+
+    edge_type = (await client.get("/api/edge-types")).json()[0]["id"]
+    db_session.add(
+        Edge(
+            id=uuid.uuid4(),
+            from_node_id=uuid.UUID(nodes[0]["id"]),
+            to_node_id=uuid.UUID(nodes[1]["id"]),
+            edge_type_id=edge_type,
+            created_at=datetime(2024, 3, 1, tzinfo=UTC),
+        )
+    )
+    await db_session.flush()
+    return nodes[0], nodes[1]
+
+
+class TestAsOf:
+    async def test_graph_search_as_of_resolves_title_and_status(
+        self, client, historic_pair
+    ):
+        renamed, other = historic_pair
+        resp = await client.get("/api/graph/search", params={"as_of": "2024-06-01"})
+        assert resp.status_code == 200
+        data = resp.json()
+        by_id = {n["id"]: n for n in data["nodes"]}
+        assert by_id[renamed["id"]]["title"] == "Oude Naam"
+        assert by_id[renamed["id"]]["status"] == "actief"
+        assert {(e["from_node_id"], e["to_node_id"]) for e in data["edges"]} >= {
+            (renamed["id"], other["id"])
+        }
+
+        resp = await client.get("/api/graph/search", params={"as_of": "2025-02-01"})
+        by_id = {n["id"]: n for n in resp.json()["nodes"]}
+        assert by_id[renamed["id"]]["title"] == "Nieuwe Naam"
+        assert by_id[renamed["id"]]["status"] == "afgerond"
+
+    async def test_graph_search_as_of_before_existence(self, client, historic_pair):
+        renamed, _ = historic_pair
+        resp = await client.get("/api/graph/search", params={"as_of": "2023-12-31"})
+        assert renamed["id"] not in {n["id"] for n in resp.json()["nodes"]}
+
+    async def test_node_graph_as_of(self, client, sample_corpus_node, historic_pair):
+        renamed, other = historic_pair
+        url = f"/api/nodes/{renamed['id']}/graph"
+
+        resp = await client.get(url, params={"as_of": "2024-06-01"})
+        assert resp.status_code == 200
+        data = resp.json()
+        titles = {n["title"] for n in data["nodes"]}
+        assert titles == {"Oude Naam", "Doel 2024"}
+        assert len(data["edges"]) == 1
+
+        # Before the edge existed only the start node is left.
+        resp = await client.get(url, params={"as_of": "2024-02-01"})
+        data = resp.json()
+        assert [n["id"] for n in data["nodes"]] == [renamed["id"]]
+        assert data["edges"] == []
+
+        # A node created today did not exist yet.
+        resp = await client.get(
+            f"/api/nodes/{sample_corpus_node['id']}/graph",
+            params={"as_of": "2024-06-01"},
+        )
+        assert resp.json()["nodes"] == []
+
+    async def test_graph_search_as_of_ndjson(self, client, historic_pair):
+        import json
+
+        renamed, _ = historic_pair
+        resp = await client.get(
+            "/api/graph/search",
+            params={"as_of": "2024-06-01"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        titles = {x["node"]["id"]: x["node"]["title"] for x in lines if "node" in x}
+        assert titles[renamed["id"]] == "Oude Naam"
+        assert any("edge" in x for x in lines)
@@ -2,6 +2,10 @@
 
 import uuid
 
+import pytest
+
+from bouwmeester.core.duplicate_index import check_node, get_duplicate_index
+
 # ---------------------------------------------------------------------------
 # List nodes
 # ---------------------------------------------------------------------------
@@ -261,3 +265,136 @@ async def test_remove_tag_not_found(client, sample_node):
         f"/api/nodes/{sample_node.id}/tags/{fake_tag_id}",
     )
     assert resp.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Similar nodes
+# ---------------------------------------------------------------------------
+
+
+async def test_similar_nodes_ranks_by_shared_wording(client):
+    """GET /api/nodes/{id}/similar ranks nodes by text similarity."""
+    payloads = [
+        ("Waterschapsbelasting herzien", "Herziening van de waterschapsbelasting"),
+        ("Belasting waterschappen", "Tarieven van de waterschapsbelasting"),
+        ("Woningbouw versnellen", "Meer woningen bouwen"),
+    ]
+    ids = []
+    for title, description in payloads:
+        resp = await client.post(
+            "/api/nodes",
+            json={"title": title, "node_type": "dossier", "description": description},
+        )
+        ids.append(resp.json()["id"])
+
+    resp = await client.get(f"/api/nodes/{ids[0]}/similar")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data[0]["node"]["id"] == ids[1]
+    assert 0 < data[0]["score"] <= 1
+    assert ids[0] not in {item["node"]["id"] for item in data}
+    assert ids[2] not in {item["node"]["id"] for item in data}
+
+
+async def test_similar_nodes_not_found(client):
+    resp = await client.get(f"/api/nodes/{uuid.uuid4()}/similar")
+    assert resp.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Duplicates
+# ---------------------------------------------------------------------------
+
+
+async def test_duplicates_groups_near_identical_nodes(client, db_session):
+    """GET /api/nodes/duplicates groups nodes with near-identical text."""
+    titles = [
+        "Motie van het lid Van der Berg over stikstofreductie in Natura 2000",
+        "Motie van het lid Van der Berg over stikstof-reductie in Natura 2000",
+        "Kamervraag over woningbouw in Utrecht",
+    ]
+    ids = []
+    for title in titles:
+        resp = await client.post(
+            "/api/nodes", json={"title": title, "node_type": "politieke_input"}
+        )
+        ids.append(resp.json()["id"])
+    # Nodes enter the index on commit, which get_db does after a request.
+    await db_session.commit()
+
+    resp = await client.get("/api/nodes/duplicates")
+    assert resp.status_code == 200
+    groups = [{n["id"] for n in g["nodes"]} for g in resp.json()]
+    assert {ids[0], ids[1]} in groups
+    assert not any(ids[2] in g for g in groups)
+
+
+async def test_duplicates_follow_edits(client, db_session):
+    """Editing a node away from its twin removes the group."""
+    body = {"title": "Begroting Infrastructuur en Waterstaat 2026", "node_type": "doel"}
+    first = (await client.post("/api/nodes", json=body)).json()["id"]
+    await client.post("/api/nodes", json=body)
+    await db_session.commit()
+
+    resp = await client.get("/api/nodes/duplicates")
+    assert any(first in {n["id"] for n in g["nodes"]} for g in resp.json())
+
+    await client.put(f"/api/nodes/{first}", json={"title": "Iets heel anders"})
+    await db_session.commit()
+    resp = await client.get("/api/nodes/duplicates")
+    assert not any(first in {n["id"] for n in g["nodes"]} for g in resp.json())
+
+
+async def test_duplicates_ignore_rolled_back_nodes(db_session):
+    """A node written in a rolled-back savepoint never enters the index."""
+    index = await get_duplicate_index(db_session)
+    size = len(index)
+    title = "Programma Aanpak Grote Wateren tweede tranche"
+    with pytest.raises(RuntimeError):
+        async with db_session.begin_nested():
+            await check_node(db_session, uuid.uuid4(), title, None)
+            raise RuntimeError
+    await db_session.commit()
+    assert len(index) == size
+
+    kept = uuid.uuid4()
+    assert await check_node(db_session, kept, title, None) == []
+    await db_session.commit()
+    assert index.candidates(kept) == []
+    assert len(index) == size + 1
+
+
+# ---------------------------------------------------------------------------
+# Suggested connections
+# ---------------------------------------------------------------------------
+
+
+async def test_suggested_connections_via_common_neighbour(client, sample_edge_type):
+    """A node two hops away is suggested; a direct neighbour is not."""
+    ids = []
+    for title in ("Stikstofaanpak", "Natuurherstel", "Vergunningverlening"):
+        resp = await client.post(
+            "/api/nodes", json={"title": title, "node_type": "dossier"}
+        )
+        ids.append(resp.json()["id"])
+    for from_id, to_id in ((ids[0], ids[1]), (ids[1], ids[2])):
+        await client.post(
+            "/api/edges",
+            json={
+                "from_node_id": from_id,
+                "to_node_id": to_id,
+                "edge_type_id": sample_edge_type.id,
+            },
+        )
+
+    resp = await client.get(f"/api/nodes/{ids[0]}/suggested-connections")
+    assert resp.status_code == 200
+    suggested = {item["target_node_id"] for item in resp.json()}
+    assert ids[2] in suggested
+    assert ids[1] not in suggested
+    assert ids[0] not in suggested
+
+
+async def test_suggested_connections_not_found(client):
+    resp = await client.get(f"/api/nodes/{uuid.uuid4()}/suggested-connections")
+    assert resp.status_code == 404
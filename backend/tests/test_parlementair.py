@@ -323,6 +323,27 @@ async def test_reset_suggested_edge_from_approved(
     assert data["edge_id"] is None
 
 
+async def test_reset_suggested_edge_updates_closure(
+    client, db_session, sample_node, second_node
+):
+    """Resetting an approved hierarchical edge removes it from the closure."""
+    item = await _create_parlementair_item(
+        db_session, corpus_node_id=sample_node.id, status="imported"
+    )
+    se = await _create_suggested_edge(
+        db_session, item.id, second_node.id, "onderdeel_van"
+    )
+    ancestors_url = f"/api/graph/ancestors?node_id={sample_node.id}"
+
+    await client.put(f"/api/parlementair/edges/{se.id}/approve")
+    resp = await client.get(ancestors_url)
+    assert [e["node"]["id"] for e in resp.json()["nodes"]] == [str(second_node.id)]
+
+    await client.put(f"/api/parlementair/edges/{se.id}/reset")
+    resp = await client.get(ancestors_url)
+    assert resp.json()["nodes"] == []
+
+
 async def test_reset_suggested_edge_from_rejected(
     client, db_session, sample_node, second_node, sample_edge_type
 ):
@@ -95,6 +95,11 @@ def _mock_llm(matched_tags=None, samenvatting="Samenvatting"):
         suggested_new_tags=[],
         samenvatting=samenvatting,
     )
+
+    async def extract_tags_batch(items, **kwargs):
+        return [mock.extract_tags.return_value for _ in items]
+
+    mock.extract_tags_batch.side_effect = extract_tags_batch
     return mock
 
 
@@ -401,6 +406,40 @@ async def test_detach_corpus_node_cascade_deletes_tasks(db_session):
     assert await db_session.get(Task, open_task.id) is None
 
 
+async def test_detach_corpus_node_repairs_closure(db_session):
+    """Hierarchy paths through the detached node leave the closure."""
+    from bouwmeester.models.edge import Edge
+    from bouwmeester.models.edge_closure import EdgeClosure
+    from bouwmeester.repositories.edge_closure import EdgeClosureRepository
+
+    item, node = await _make_item(db_session)
+    leaf, root = (
+        CorpusNode(id=uuid.uuid4(), title=t, node_type="maatregel", status="actief")
+        for t in ("Leaf", "Root")
+    )
+    db_session.add_all([leaf, root])
+    await db_session.flush()
+    closure = EdgeClosureRepository(db_session)
+    for child, parent in ((leaf, node), (node, root)):
+        db_session.add(
+            Edge(
+                from_node_id=child.id,
+                to_node_id=parent.id,
+                edge_type_id="onderdeel_van",
+            )
+        )
+        await db_session.flush()
+        await closure.add_edge(child.id, parent.id, "onderdeel_van")
+
+    service = ParlementairImportService(db_session)
+    await service._detach_corpus_node(item)
+
+    rows = await db_session.execute(
+        select(EdgeClosure).where(EdgeClosure.descendant_id == leaf.id)
+    )
+    assert rows.scalars().all() == []
+
+
 async def test_detach_corpus_node_no_node_is_noop(db_session):
     """_detach_corpus_node is safe to call when corpus_node_id is None."""
     item, _ = await _make_item(db_session, with_node=False)
@@ -485,6 +524,64 @@ async def test_process_item_no_llm_provider_creates_pending(db_session):
     assert created.corpus_node_id is None
 
 
+# ---------------------------------------------------------------------------
+# _import_items — batched idempotency check and per-item savepoints
+# ---------------------------------------------------------------------------
+
+
+async def test_import_items_skips_known_and_isolates_failures(db_session):
+    """Known zaak_ids are skipped; a failing item doesn't undo its chunk."""
+    from bouwmeester.services.import_strategies.base import FetchedItem
+    from bouwmeester.services.import_strategies.registry import get_strategy
+
+    known, _ = await _make_item(db_session, with_node=False)
+
+    def fetched(zaak_id):
+        return FetchedItem(
+            zaak_id=zaak_id,
+            zaak_nummer="36200-VII-43",
+            titel="Test motie",
+            onderwerp="Onderwerp",
+            bron="tweede_kamer",
+        )
+
+    good = fetched(f"zaak-{uuid.uuid4().hex[:8]}")
+    bad = fetched(f"zaak-{uuid.uuid4().hex[:8]}")
+
+    service = ParlementairImportService(db_session)
+    create = service.import_repo.create
+
+    async def failing_create(**kwargs):
+        if kwargs["zaak_id"] == bad.zaak_id:
+            raise RuntimeError("boom")
+        return await create(**kwargs)
+
+    service.import_repo.create = failing_create
+    llm = _mock_llm(matched_tags=[])
+
+    with patch(
+        "bouwmeester.services.parlementair_import_service.get_llm_service",
+        new=AsyncMock(return_value=llm),
+    ):
+        await service._import_items(
+            get_strategy(TEST_TYPE), [fetched(known.zaak_id), bad, good]
+        )
+
+    # One batched extraction for both new items, none per item.
+    assert llm.extract_tags_batch.await_count == 1
+    assert len(llm.extract_tags_batch.await_args.kwargs["items"]) == 2
+    assert llm.extract_tags.await_count == 0
+    result = await db_session.execute(
+        select(ParlementairItem.zaak_id, ParlementairItem.status).where(
+            ParlementairItem.zaak_id.in_([known.zaak_id, good.zaak_id, bad.zaak_id])
+        )
+    )
+    assert dict(result.all()) == {
+        known.zaak_id: "imported",
+        good.zaak_id: "out_of_scope",
+    }
+
+
 # ---------------------------------------------------------------------------
 # Reprocess API endpoint
 # ---------------------------------------------------------------------------
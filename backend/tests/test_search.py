@@ -58,3 +58,125 @@ async def test_search_result_has_required_fields(client, sample_node):
     assert "title" in result
     assert "score" in result
     assert "url" in result
+
+
+async def test_search_highlights_each_result(client, db_session):
+    """Every hit with a matching description gets its own highlight."""
+    import uuid
+
+    from bouwmeester.models.corpus_node import CorpusNode
+
+    nodes = [
+        CorpusNode(
+            id=uuid.uuid4(),
+            title=f"Zoektitel {i}",
+            node_type="dossier",
+            description=f"Omschrijving {i} over waterschapsbelasting",
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(nodes)
+    await db_session.flush()
+
+    resp = await client.get("/api/search", params={"q": "waterschapsbelasting"})
+    assert resp.status_code == 200
+    by_id = {r["id"]: r for r in resp.json()["results"]}
+    for i, node in enumerate(nodes):
+        (highlight,) = by_id[str(node.id)]["highlights"]
+        assert "<mark>waterschapsbelasting</mark>" in highlight
+        assert f"Omschrijving {i}" in highlight
+
+
+async def test_search_follows_updates_and_deletes(client, sample_node):
+    """The search index follows edits and deletions of the source row."""
+    resp = await client.put(
+        f"/api/nodes/{sample_node.id}", json={"title": "Kustverdediging"}
+    )
+    assert resp.status_code == 200
+
+    resp = await client.get("/api/search", params={"q": "kustverdediging"})
+    ids = {r["id"] for r in resp.json()["results"]}
+    assert str(sample_node.id) in ids
+
+    resp = await client.delete(f"/api/nodes/{sample_node.id}")
+    assert resp.status_code == 204
+
+    resp = await client.get("/api/search", params={"q": "kustverdediging"})
+    assert resp.json()["results"] == []
+
+
+async def test_search_matches_word_prefix(client, db_session):
+    """The last word of the query is matched as a prefix while typing."""
+    import uuid
+
+    from bouwmeester.models.corpus_node import CorpusNode
+
+    node = CorpusNode(
+        id=uuid.uuid4(),
+        title="Waterschapsbelasting herzien",
+        node_type="dossier",
+    )
+    db_session.add(node)
+    await db_session.flush()
+
+    # "wat" is a Dutch stop word, but must still work as a prefix.
+    for q in ("wat", "waterschapsbel", "herzien water"):
+        resp = await client.get("/api/search", params={"q": q})
+        ids = {r["id"] for r in resp.json()["results"]}
+        assert str(node.id) in ids, q
+
+
+async def test_search_ignores_punctuation_only_query(client, sample_node):
+    """A query without any word characters does not error."""
+    resp = await client.get("/api/search", params={"q": "&!:"})
+    assert resp.status_code == 200
+
+
+async def test_search_cursor_pagination_and_facets(client, db_session):
+    """Cursor pages cover every hit exactly once; facets count per type."""
+    import uuid
+
+    from bouwmeester.models.corpus_node import CorpusNode
+    from bouwmeester.models.task import Task
+
+    nodes = [
+        CorpusNode(id=uuid.uuid4(), title=f"Dijkversterking {i}", node_type="dossier")
+        for i in range(5)
+    ]
+    db_session.add_all(nodes)
+    await db_session.flush()
+    db_session.add(
+        Task(id=uuid.uuid4(), title="Dijkversterking plannen", node_id=nodes[0].id)
+    )
+    await db_session.flush()
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        params = {"q": "dijkversterking", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = await client.get("/api/search", params=params)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["facets"] == {"corpus_node": 5, "task": 1}
+        assert data["total"] == 6
+        seen.extend(r["id"] for r in data["results"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 6
+    assert len(set(seen)) == 6
+
+    resp = await client.get(
+        "/api/search", params={"q": "dijkversterking", "result_types": "task"}
+    )
+    data = resp.json()
+    assert data["total"] == 1
+    assert data["facets"] == {"corpus_node": 5, "task": 1}
+
+
+async def test_search_invalid_cursor(client):
+    resp = await client.get("/api/search", params={"q": "x", "cursor": "nonsense"})
+    assert resp.status_code == 400
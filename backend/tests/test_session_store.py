@@ -0,0 +1,162 @@
+"""Tests for the session cache and touch-field handling."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from bouwmeester.core.session_store import (
+    CachedSession,
+    DatabaseSessionStore,
+    SessionCache,
+    split_touch_fields,
+)
+
+
+def _entry(version: int = 1, expires_in: int = 60) -> CachedSession:
+    return CachedSession(
+        data='{"person_id": "abc"}',
+        touch={"token_validated_at": 1000.0},
+        version=version,
+        expires_at=datetime.now(UTC) + timedelta(seconds=expires_in),
+    )
+
+
+def _store(db_session, **kwargs) -> DatabaseSessionStore:
+    """A store on the test transaction, as one replica of several."""
+    factory = async_sessionmaker(
+        bind=db_session.bind,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    kwargs.setdefault("cache_check_seconds", 0)
+    return DatabaseSessionStore(factory, **kwargs)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = SessionCache(max_entries=2)
+    cache.put("a", _entry())
+    cache.put("b", _entry())
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put("c", _entry())
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_cache_drops_expired_sessions():
+    cache = SessionCache()
+    cache.put("a", _entry(expires_in=-1))
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_versions_and_discard():
+    cache = SessionCache()
+    cache.put("a", _entry(version=3))
+    cache.put("b", _entry(version=1))
+    assert cache.versions() == {"a": 3, "b": 1}
+    cache.discard("a")
+    cache.discard("missing")
+    assert cache.versions() == {"b": 1}
+
+
+def test_cached_session_merges_touch_fields():
+    entry = _entry()
+    data = entry.session_data()
+    assert data == {"person_id": "abc", "token_validated_at": 1000.0}
+    data["person_id"] = "changed"
+    assert entry.session_data()["person_id"] == "abc"
+
+
+def test_split_touch_fields():
+    payload, touch = split_touch_fields(
+        {"access_token": "t", "token_validated_at": 1.0, "is_admin_checked_at": 2.0}
+    )
+    assert payload == {"access_token": "t"}
+    assert touch == {"token_validated_at": 1.0, "is_admin_checked_at": 2.0}
+
+
+async def test_flush_keeps_newest_touch_per_key(db_session):
+    sid = uuid.uuid4().hex
+    replica_a, replica_b = _store(db_session), _store(db_session)
+    await replica_a.set(sid, {"person_id": "abc", "token_validated_at": 100.0})
+
+    await replica_b.touch(
+        sid, {"token_validated_at": 300.0, "is_admin_checked_at": 50.0}
+    )
+    assert await replica_b.flush() == 1
+    # A stale touch queued by A must not roll B's timestamp back.
+    await replica_a.touch(sid, {"token_validated_at": 200.0})
+    assert await replica_a.flush() == 1
+
+    data = await _store(db_session, cache_size=0).get(sid)
+    assert data == {
+        "person_id": "abc",
+        "token_validated_at": 300.0,
+        "is_admin_checked_at": 50.0,
+    }
+
+
+async def test_set_bumps_version(db_session):
+    sid = uuid.uuid4().hex
+    store = _store(db_session)
+    await store.set(sid, {"person_id": "abc"})
+    await store.set(sid, {"person_id": "def"})
+    assert store._cache.versions() == {sid: 2}
+
+
+async def test_cache_follows_other_replica_writes(db_session):
+    sid = uuid.uuid4().hex
+    replica_a, replica_b = _store(db_session), _store(db_session)
+    await replica_a.set(sid, {"person_id": "abc"})
+    assert await replica_b.get(sid) == {"person_id": "abc"}
+
+    await replica_a.set(sid, {"person_id": "def"})
+    # B's cached copy has a stale version: revalidation drops it.
+    await replica_b._revalidate_cache()
+    assert sid not in replica_b._cache.versions()
+    assert await replica_b.get(sid) == {"person_id": "def"}
+    assert replica_b._cache.versions() == {sid: 2}
+
+
+async def test_cache_drops_sessions_deleted_elsewhere(db_session):
+    sid = uuid.uuid4().hex
+    replica_a, replica_b = _store(db_session), _store(db_session)
+    await replica_a.set(sid, {"person_id": "abc"})
+    assert await replica_b.get(sid) == {"person_id": "abc"}
+
+    await replica_a.delete(sid)
+    assert await replica_b.get(sid) is None
+    assert len(replica_b._cache) == 0
+
+
+async def test_logout_elsewhere_is_seen_before_the_periodic_check(db_session):
+    sid = uuid.uuid4().hex
+    replica_a = _store(db_session)
+    replica_b = _store(db_session, cache_check_seconds=3600)
+    await replica_a.set(sid, {"person_id": "abc"})
+    assert await replica_b.get(sid) == {"person_id": "abc"}
+
+    # Without a listener, B confirms the row version on every read.
+    await replica_a.set(sid, {"person_id": "def"})
+    assert await replica_b.get(sid) == {"person_id": "def"}
+    await replica_a.delete(sid)
+    assert await replica_b.get(sid) is None
+
+
+async def test_listening_store_drops_entries_on_notification(db_session):
+    sid = uuid.uuid4().hex
+    replica_a = _store(db_session)
+    replica_b = _store(db_session, cache_check_seconds=3600)
+    replica_b.set_listening(True)
+    await replica_a.set(sid, {"person_id": "abc"})
+    assert await replica_b.get(sid) == {"person_id": "abc"}
+
+    await replica_a.set(sid, {"person_id": "def"})
+    # Served from the cache until the notification arrives.
+    assert await replica_b.get(sid) == {"person_id": "abc"}
+    replica_b.handle_notification(f"{replica_b._origin} {sid}")  # own: ignored
+    assert sid in replica_b._cache.versions()
+    replica_b.handle_notification(f"{replica_a._origin} {sid}")
+    assert await replica_b.get(sid) == {"person_id": "def"}
@@ -1,5 +1,6 @@
 import { apiGet, apiPost, apiPut, apiDelete, BASE_URL, getCsrfToken } from './client';
-import type { CorpusNode, CorpusNodeCreate, CorpusNodeUpdate, GraphViewResponse, NodeStakeholder, NodeTitleRecord, NodeStatusRecord, NodeType } from '@/types';
+import type { EdgeSuggestionItem } from './llm';
+import type { CorpusNode, CorpusNodeCreate, CorpusNodeUpdate, SubgraphViewResponse, NodeStakeholder, NodeTitleRecord, NodeStatusRecord, NodeType, SimilarNode, DuplicateGroup } from '@/types';
 
 export async function getNodes(nodeType?: NodeType): Promise<CorpusNode[]> {
   return apiGet<CorpusNode[]>('/api/nodes', {
@@ -28,8 +29,24 @@ export async function getNodeNeighbors(id: string): Promise<CorpusNode[]> {
   return apiGet<CorpusNode[]>(`/api/nodes/${id}/neighbors`);
 }
 
-export async function getNodeGraph(id: string, depth?: number): Promise<GraphViewResponse> {
-  return apiGet<GraphViewResponse>(`/api/nodes/${id}/graph`, { depth });
+export async function getSimilarNodes(id: string, limit?: number): Promise<SimilarNode[]> {
+  return apiGet<SimilarNode[]>(`/api/nodes/${id}/similar`, { limit });
+}
+
+export async function getSuggestedConnections(id: string, limit?: number): Promise<EdgeSuggestionItem[]> {
+  return apiGet<EdgeSuggestionItem[]>(`/api/nodes/${id}/suggested-connections`, { limit });
+}
+
+export async function getDuplicateNodes(minSimilarity?: number): Promise<DuplicateGroup[]> {
+  return apiGet<DuplicateGroup[]>('/api/nodes/duplicates', { min_similarity: minSimilarity });
+}
+
+export async function getNodeGraph(
+  id: string,
+  depth?: number,
+  maxNodes?: number,
+): Promise<SubgraphViewResponse> {
+  return apiGet<SubgraphViewResponse>(`/api/nodes/${id}/graph`, { depth, max_nodes: maxNodes });
 }
 
 export async function getNodeStakeholders(id: string): Promise<NodeStakeholder[]> {
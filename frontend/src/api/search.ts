@@ -4,10 +4,14 @@ import type { SearchResponse, SearchResultType } from '@/types';
 export async function search(
   query: string,
   resultTypes?: SearchResultType[],
+  cursor?: string,
 ): Promise<SearchResponse> {
   const params: Record<string, string> = { q: query };
   if (resultTypes && resultTypes.length > 0) {
     params.result_types = resultTypes.join(',');
   }
+  if (cursor) {
+    params.cursor = cursor;
+  }
   return apiGet<SearchResponse>('/api/search', params);
 }
@@ -117,6 +117,29 @@ export interface CorpusNode {
   created_at: string;
   updated_at: string;
   edge_count?: number;
+  metrics?: NodeMetrics | null;
+}
+
+export interface NodeMetrics {
+  degree: number;
+  in_degree: number;
+  out_degree: number;
+  pagerank: number;
+  betweenness: number;
+  component_id: number;
+  component_size: number;
+  is_orphan: boolean;
+  computed_at: string;
+}
+
+export interface SimilarNode {
+  node: CorpusNode;
+  score: number;
+}
+
+export interface DuplicateGroup {
+  nodes: CorpusNode[];
+  similarity: number;
 }
 
 export interface CorpusNodeCreate {
@@ -758,6 +781,8 @@ export interface SearchResponse {
   results: SearchResult[];
   total: number;
   query: string;
+  facets: Partial<Record<SearchResultType, number>>;
+  next_cursor: string | null;
 }
 
 // Graph View
@@ -766,6 +791,11 @@ export interface GraphViewResponse {
   edges: Edge[];
 }
 
+export interface SubgraphViewResponse extends GraphViewResponse {
+  truncated: boolean;
+  level_counts: number[];
+}
+
 // Tags
 export interface Tag {
   id: string;